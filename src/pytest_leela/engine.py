@@ -11,6 +11,7 @@ import os
 import sys
 import tempfile
 import time
+from typing import Callable, Iterator
 
 from pytest_leela.ast_analysis import find_mutation_points
 from pytest_leela.coverage_tracker import collect_coverage
@@ -18,10 +19,15 @@ from pytest_leela.git_diff import changed_lines
 from pytest_leela.models import CoverageMap, Mutant, MutantResult, RunResult
 from pytest_leela.operators import count_pruned, mutations_for
 from pytest_leela.resources import ResourceLimits, apply_limits, is_memory_ok
-from pytest_leela.runner import run_tests_for_mutant
+from pytest_leela.runner import run_tests_for_mutant, run_tests_for_mutants_parallel
 from pytest_leela.type_extractor import enrich_mutation_points
 
 
+# Temp-dir prefix, resolved once per interpreter.  Like tempfile's own
+# cache, later changes to TMPDIR are deliberately not picked up.
+_TMP_DIR_PREFIX = tempfile.gettempdir() + os.sep
+
+
 def _module_name_from_path(file_path: str) -> str:
     """Convert an absolute file path to a dotted module name.
 
@@ -55,6 +61,19 @@ def _module_name_from_path(file_path: str) -> str:
     return rel.replace(os.sep, ".")
 
 
+def _module_file(mod: object) -> str | None:
+    """Return a module's ``__file__`` straight from its namespace.
+
+    Reading ``vars(mod)`` skips attribute lookup, so modules with a
+    module-level ``__getattr__`` (lazy loaders) are never poked.
+    """
+    try:
+        file: str | None = vars(mod).get("__file__")
+    except TypeError:  # object without a __dict__
+        return None
+    return file
+
+
 def _clean_process_state() -> None:
     """Remove stale state left by prior test runs.
 
@@ -74,23 +93,38 @@ def _clean_process_state() -> None:
 
     # 2. Remove modules loaded from temp directories (left by test
     #    fixtures that create throwaway target files).
-    tmp_prefix = tempfile.gettempdir() + os.sep
+    #    Collect first, then pop: never resize the dict mid-iteration.
+    #    ``_module_file`` returns None for ``None`` placeholders too.
     stale = [
         name for name, mod in sys.modules.items()
-        if mod is not None
-        and (f := getattr(mod, "__file__", None)) is not None
-        and f.startswith(tmp_prefix)
+        if (f := _module_file(mod)) and f.startswith(_TMP_DIR_PREFIX)
     ]
     for name in stale:
         sys.modules.pop(name, None)
 
 
+# Signature shared by run_tests_for_mutant and run_tests_for_mutant_forked.
+MutantExecutor = Callable[..., MutantResult]
+
+
 class Engine:
     """Orchestrates a full mutation testing run."""
 
-    def __init__(self, use_types: bool = True, use_coverage: bool = True) -> None:
+    def __init__(
+        self,
+        use_types: bool = True,
+        use_coverage: bool = True,
+        executor: MutantExecutor | None = None,
+        workers: int = 1,
+    ) -> None:
+        if executor is not None and workers > 1:
+            raise ValueError("a custom executor cannot be combined with workers > 1")
         self.use_types = use_types
         self.use_coverage = use_coverage
+        # None means run_tests_for_mutant, looked up at call time.
+        self.executor = executor
+        # More than one worker runs mutants in parallel forked children.
+        self.workers = workers
 
     def run(
         self,
@@ -146,14 +180,15 @@ class Engine:
 
         total_mutants = len(all_mutants) + total_pruned
 
-        # 6. If diff_base: filter to only changed lines
-        if diff_base is not None:
-            diff_lines = changed_lines(diff_base)
+        # 6. If diff_base: filter to only changed lines.  ``git diff`` runs
+        #    exactly once per Engine.run; every mutant reads the same map.
+        diff_lines = changed_lines(diff_base) if diff_base is not None else None
+        if diff_lines is not None:
+            no_lines: set[int] = set()
             all_mutants = [
                 m
                 for m in all_mutants
-                if m.point.file_path in diff_lines
-                and m.point.lineno in diff_lines[m.point.file_path]
+                if m.point.lineno in diff_lines.get(m.point.file_path, no_lines)
             ]
 
         # 7. Collect per-test coverage if enabled
@@ -164,33 +199,48 @@ class Engine:
             )
 
         # 8. Run each mutant
-        results: list[MutantResult] = []
-        for mutant in all_mutants:
-            # Check memory limits
-            if limits is not None and not is_memory_ok(limits):
-                break
-
-            # Look up relevant tests from coverage map
-            test_ids: list[str] | None = None
-            if coverage_map is not None:
-                covered = coverage_map.tests_for(
-                    mutant.point.file_path, mutant.point.lineno
-                )
-                if covered:
-                    test_ids = sorted(covered)
+        def jobs() -> Iterator[tuple[Mutant, list[str] | None]]:
+            for mutant in all_mutants:
+                # Check memory limits before dispatching each mutant
+                if limits is not None and not is_memory_ok(limits):
+                    return
+
+                # Look up relevant tests from coverage map
+                test_ids: list[str] | None = None
+                if coverage_map is not None:
+                    covered = coverage_map.tests_for(
+                        mutant.point.file_path, mutant.point.lineno
+                    )
+                    if covered:
+                        test_ids = sorted(covered)
 
-            # Fallback: use all session tests when no coverage info available
-            if test_ids is None and test_node_ids is not None:
-                test_ids = test_node_ids
+                # Fallback: use all session tests when no coverage info available
+                if test_ids is None and test_node_ids is not None:
+                    test_ids = test_node_ids
 
-            result = run_tests_for_mutant(
-                mutant,
+                yield mutant, test_ids
+
+        results: list[MutantResult]
+        if self.workers > 1:
+            results = run_tests_for_mutants_parallel(
+                jobs(),
                 target_sources,
                 module_to_file,
-                test_ids=test_ids,
                 test_dir=test_dir,
+                workers=self.workers,
             )
-            results.append(result)
+        else:
+            executor = self.executor or run_tests_for_mutant
+            results = [
+                executor(
+                    mutant,
+                    target_sources,
+                    module_to_file,
+                    test_ids=test_ids,
+                    test_dir=test_dir,
+                )
+                for mutant, test_ids in jobs()
+            ]
 
         wall_time = time.monotonic() - start
 
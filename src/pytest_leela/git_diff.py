@@ -7,24 +7,25 @@ import re
 import subprocess
 
 
+def _run(args: list[str]) -> subprocess.CompletedProcess[str]:
+    """Run a git command, raising on failure.
+
+    Single seam for every subprocess call in this module so tests can
+    swap in a fake backend without patching ``subprocess`` globally.
+    """
+    return subprocess.run(args, capture_output=True, text=True, check=True)
+
+
 def changed_files(base: str = "main") -> list[str]:
     """Get list of Python files changed since the base ref."""
     try:
-        result = subprocess.run(
-            ["git", "diff", "--name-only", "--diff-filter=ACMR", f"{base}...HEAD"],
-            capture_output=True,
-            text=True,
-            check=True,
+        result = _run(
+            ["git", "diff", "--name-only", "--diff-filter=ACMR", f"{base}...HEAD"]
         )
     except (subprocess.CalledProcessError, FileNotFoundError):
         # Fall back to diff against working tree
         try:
-            result = subprocess.run(
-                ["git", "diff", "--name-only", "--diff-filter=ACMR", base],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            result = _run(["git", "diff", "--name-only", "--diff-filter=ACMR", base])
         except (subprocess.CalledProcessError, FileNotFoundError):
             return []
 
@@ -41,20 +42,10 @@ def changed_files(base: str = "main") -> list[str]:
 def changed_lines(base: str = "main") -> dict[str, set[int]]:
     """Get changed line numbers per file since the base ref."""
     try:
-        result = subprocess.run(
-            ["git", "diff", "-U0", f"{base}...HEAD"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        result = _run(["git", "diff", "-U0", f"{base}...HEAD"])
     except (subprocess.CalledProcessError, FileNotFoundError):
         try:
-            result = subprocess.run(
-                ["git", "diff", "-U0", base],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            result = _run(["git", "diff", "-U0", base])
         except (subprocess.CalledProcessError, FileNotFoundError):
             return {}
 
@@ -64,25 +55,26 @@ def changed_lines(base: str = "main") -> dict[str, set[int]]:
 def _parse_diff_hunks(diff_output: str) -> dict[str, set[int]]:
     """Parse unified diff output to extract changed line numbers."""
     file_lines: dict[str, set[int]] = {}
-    current_file: str | None = None
+    current_lines: set[int] | None = None
 
     hunk_pattern = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
 
     for line in diff_output.splitlines():
         if line.startswith("+++ b/"):
+            # Decide once per file whether its hunks matter; non-Python
+            # files leave ``current_lines`` unset so their hunks are skipped.
             path = line[6:]
             if path.endswith(".py"):
-                current_file = os.path.abspath(path)
-                if current_file not in file_lines:
-                    file_lines[current_file] = set()
+                current_lines = file_lines.setdefault(os.path.abspath(path), set())
             else:
-                current_file = None
-        elif line.startswith("@@") and current_file is not None:
-            match = hunk_pattern.match(line)
-            if match:
-                start = int(match.group(1))
-                count = int(match.group(2)) if match.group(2) else 1
-                for lineno in range(start, start + count):
-                    file_lines[current_file].add(lineno)
+                current_lines = None
+            continue
+        if current_lines is None or not line.startswith("@@"):
+            continue
+        match = hunk_pattern.match(line)
+        if match:
+            start = int(match.group(1))
+            count = int(match.group(2)) if match.group(2) else 1
+            current_lines.update(range(start, start + count))
 
     return file_lines
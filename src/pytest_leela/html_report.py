@@ -3,16 +3,33 @@
 from __future__ import annotations
 
 import ast
+import functools
 import json
+import operator
 import os
+import re
 import textwrap
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
 
 from pytest_leela.models import RunResult
 from pytest_leela.output import _op_display
 
+# orjson is an optional speedup for serializing large reports; the stdlib
+# json module is used when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
+
+# Prefixes stripped from each ``::`` segment of a node ID.
+_TEST_PREFIX_RE = re.compile(r"^(?:test|describe|it|context)_")
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
+
+@functools.lru_cache(maxsize=8192)
 def _format_test_name(test_id: str) -> str:
     """Pretty-print a pytest node ID for human consumption.
 
@@ -26,6 +43,9 @@ def _format_test_name(test_id: str) -> str:
         "tests/describe_foo.py::describe_bar::it_does_thing" -> "bar > does thing"
         "tests/test_x.py::test_simple" -> "simple"
         "tests/test_x.py::TestClass::test_method[param1]" -> "TestClass > method[param1]"
+
+    The same node IDs recur across every mutant and covered line, so results
+    are memoized for the lifetime of the process.
     """
     parts = test_id.split("::")
     # Drop the first part (file path)
@@ -36,24 +56,14 @@ def _format_test_name(test_id: str) -> str:
 
     cleaned: list[str] = []
     for part in parts:
-        # Extract parametrize brackets if present
-        bracket_suffix = ""
-        if "[" in part:
-            bracket_idx = part.index("[")
-            bracket_suffix = part[bracket_idx:]
-            part = part[:bracket_idx]
-
-        # Strip common prefixes
-        for prefix in ("test_", "describe_", "it_", "context_"):
-            if part.startswith(prefix):
-                part = part[len(prefix):]
-                break
+        # Split off parametrize brackets, if present
+        name, bracket, params = part.partition("[")
 
-        # Replace underscores with spaces
-        part = part.replace("_", " ")
+        # Strip one common prefix, then turn underscores into spaces
+        name = _TEST_PREFIX_RE.sub("", name, count=1).translate(_UNDERSCORE_TO_SPACE)
 
         # Reattach parametrize brackets
-        part = part + bracket_suffix
+        part = name + bracket + params
 
         if part:
             cleaned.append(part)
@@ -150,25 +160,48 @@ def _extract_test_sources(result: RunResult) -> dict[str, str]:
     return sources
 
 
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
 def _build_report_data(result: RunResult) -> dict[str, Any]:
     """Build a JSON-serializable data structure from a RunResult.
 
     Returns a dict conforming to the Leela HTML report schema (version 1).
     """
-    # Determine common prefix for relative paths
+    # Determine common prefix for relative paths, once for all files
     all_file_paths = list(result.target_files)
     if len(all_file_paths) > 1:
-        common = os.path.commonpath(all_file_paths)
+        try:
+            common = os.path.commonpath(all_file_paths)
+        except ValueError:  # mix of absolute and relative paths
+            common = ""
     elif len(all_file_paths) == 1:
         common = os.path.dirname(all_file_paths[0])
     else:
         common = ""
+    # Trailing separator, without doubling it when common is the root
+    prefix = os.path.join(common, "") if common else ""
 
     def _relpath(fp: str) -> str:
-        if not common:
+        if not prefix:
             return fp
+        if fp.startswith(prefix):
+            return fp[len(prefix):]
+        # commonpath() normalizes; un-normalized inputs like "./src/a.py"
+        # need the slower relpath().
         return os.path.relpath(fp, common)
 
+    # Format each distinct test ID referenced by a mutant exactly once
+    mutant_test_ids = {
+        t
+        for mr in result.results
+        for t in (*mr.test_ids_run, *mr.killing_tests, mr.killing_test)
+        if t
+    }
+    display_of = {t: _format_test_name(t) for t in mutant_test_ids}
+
     # Group mutant results by file
     file_results: dict[str, list[tuple[int, dict[str, Any]]]] = {}
     for idx, mr in enumerate(result.results):
@@ -192,35 +225,39 @@ def _build_report_data(result: RunResult) -> dict[str, Any]:
             "tests_run": mr.tests_run,
             "time_seconds": mr.time_seconds,
             "killing_test": (
-                {"display": _format_test_name(mr.killing_test), "id": mr.killing_test}
+                {"display": display_of[mr.killing_test], "id": mr.killing_test}
                 if mr.killing_test
                 else None
             ),
             "killing_tests": [
-                {"display": _format_test_name(t), "id": t} for t in mr.killing_tests
+                {"display": display_of[t], "id": t} for t in mr.killing_tests
             ],
             "test_ids_run": [
-                {"display": _format_test_name(t), "id": t} for t in mr.test_ids_run
+                {"display": display_of[t], "id": t} for t in mr.test_ids_run
             ],
         }
         file_results[rel].append((idx, mutant_data))
 
+    # Build per-file coverage lines in a single pass over the coverage map
+    coverage_lines: dict[str, dict[str, dict[str, Any]]] = {}
+    if result.coverage_map is not None:
+        target_set = set(result.target_files)
+        by_display = operator.itemgetter("display")
+        for (cov_fp, lineno), test_ids in result.coverage_map.line_to_tests.items():
+            if cov_fp not in target_set:
+                continue
+            formatted = sorted(
+                ({"display": _format_test_name(t), "id": t} for t in test_ids),
+                key=by_display,
+            )
+            coverage_lines.setdefault(cov_fp, {})[str(lineno)] = {"coverage": formatted}
+
     # Build files dict
     files: dict[str, dict[str, Any]] = {}
     for fp in result.target_files:
         rel = _relpath(fp)
         source = result.target_sources.get(fp, "")
-
-        # Build coverage lines
-        lines: dict[str, dict[str, Any]] = {}
-        if result.coverage_map is not None:
-            for (cov_fp, lineno), test_ids in result.coverage_map.line_to_tests.items():
-                if cov_fp == fp:
-                    formatted = sorted(
-                        ({"display": _format_test_name(t), "id": t} for t in test_ids),
-                        key=lambda x: x["display"],
-                    )
-                    lines[str(lineno)] = {"coverage": formatted}
+        lines = coverage_lines.get(fp, {})
 
         # Collect mutants for this file
         mutants_for_file = file_results.get(rel, [])
@@ -255,11 +292,11 @@ def _build_report_data(result: RunResult) -> dict[str, Any]:
                     "mutant_idx": midx,
                     "description": m["description"],
                 })
-    survived_index.sort(key=lambda x: (x["file"], x["lineno"]))
+    survived_index.sort(key=operator.itemgetter("file", "lineno"))
 
     return {
         "version": 1,
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": _now_iso(),
         "summary": {
             "total_mutants": result.total_mutants,
             "mutants_tested": result.mutants_tested,
@@ -275,24 +312,30 @@ def _build_report_data(result: RunResult) -> dict[str, Any]:
     }
 
 
-def _escape_json_for_html(json_str: str) -> str:
+def _dumps_json(data: dict[str, Any]) -> bytes:
+    """Serialize report data to compact UTF-8 JSON bytes.
+
+    Uses orjson when available, falling back to the stdlib ``json`` module.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _escape_json_for_html(json_bytes: bytes) -> bytes:
     """Escape JSON for safe embedding in HTML script tags.
 
     Replaces ``</`` with ``<\\/`` to prevent premature script tag closure.
     ``\\/`` is valid JSON (RFC 8259 section 7) and evaluates to ``/`` at runtime.
+    Payloads without any ``</`` (the common case) are returned untouched.
     """
-    return json_str.replace("</", "<\\/")
+    if b"</" not in json_bytes:
+        return json_bytes
+    return json_bytes.replace(b"</", b"<\\/")
 
 
-def _build_html_viewer(json_data: str) -> str:
-    """Build a full interactive HTML viewer with inline JSON data.
-
-    Returns a self-contained HTML string with inline CSS, JS, and data.
-    The viewer renders a three-panel layout (sidebar / source / detail)
-    with survivor navigation, syntax highlighting, and a dark
-    Catppuccin-Mocha theme.
-    """
-    return f"""\
+# Static viewer shell, split once at import around the data insertion point.
+_HTML_TEMPLATE = """\
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -300,21 +343,21 @@ def _build_html_viewer(json_data: str) -> str:
 <meta name="viewport" content="width=device-width, initial-scale=1">
 <title>Leela Mutation Report</title>
 <style>
-*, *::before, *::after {{
+*, *::before, *::after {
     box-sizing: border-box;
     margin: 0;
     padding: 0;
-}}
-html, body {{
+}
+html, body {
     height: 100%;
     font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
     background: #1e1e2e;
     color: #cdd6f4;
     overflow: hidden;
     min-width: 1000px;
-}}
+}
 /* --- Header --- */
-#header {{
+#header {
     display: flex;
     align-items: center;
     gap: 12px;
@@ -323,30 +366,30 @@ html, body {{
     padding: 8px 16px;
     height: 48px;
     flex-shrink: 0;
-}}
-#header .logo {{
+}
+#header .logo {
     font-weight: 700;
     font-size: 15px;
     color: #cdd6f4;
     margin-right: 4px;
-}}
-.score-badge {{
+}
+.score-badge {
     display: inline-block;
     padding: 2px 10px;
     border-radius: 12px;
     font-weight: 700;
     font-size: 14px;
     line-height: 1.5;
-}}
-.score-green  {{ background: #a6e3a1; color: #1e1e2e; }}
-.score-yellow {{ background: #f9e2af; color: #1e1e2e; }}
-.score-red    {{ background: #f38ba8; color: #1e1e2e; }}
-#survived-count {{
+}
+.score-green  { background: #a6e3a1; color: #1e1e2e; }
+.score-yellow { background: #f9e2af; color: #1e1e2e; }
+.score-red    { background: #f38ba8; color: #1e1e2e; }
+#survived-count {
     font-size: 14px;
     color: #f38ba8;
     font-weight: 600;
-}}
-.hdr-btn {{
+}
+.hdr-btn {
     background: #313244;
     color: #cdd6f4;
     border: 1px solid #45475a;
@@ -355,36 +398,36 @@ html, body {{
     font-size: 13px;
     cursor: pointer;
     font-family: inherit;
-}}
-.hdr-btn:hover {{ background: #45475a; }}
-.hdr-spacer {{ flex: 1; }}
-.hdr-help {{
+}
+.hdr-btn:hover { background: #45475a; }
+.hdr-spacer { flex: 1; }
+.hdr-help {
     font-size: 12px;
     color: #6c7086;
-}}
+}
 /* --- Main Layout --- */
-#main {{
+#main {
     display: flex;
     height: calc(100% - 48px - 24px);
-}}
+}
 /* --- Sidebar --- */
-#sidebar {{
+#sidebar {
     width: 250px;
     min-width: 250px;
     background: #181825;
     border-right: 1px solid #45475a;
     overflow-y: auto;
     flex-shrink: 0;
-}}
-#sidebar .sidebar-title {{
+}
+#sidebar .sidebar-title {
     padding: 10px 12px 6px;
     font-size: 11px;
     text-transform: uppercase;
     letter-spacing: 0.8px;
     color: #6c7086;
     font-weight: 600;
-}}
-.file-entry {{
+}
+.file-entry {
     display: flex;
     align-items: center;
     gap: 8px;
@@ -393,25 +436,25 @@ html, body {{
     font-size: 13px;
     border-left: 3px solid transparent;
     transition: background 0.15s;
-}}
-.file-entry:hover {{ background: #313244; }}
-.file-entry.active {{
+}
+.file-entry:hover { background: #313244; }
+.file-entry.active {
     background: #313244;
     border-left-color: #89b4fa;
-}}
-.file-entry .fname {{
+}
+.file-entry .fname {
     flex: 1;
     overflow: hidden;
     text-overflow: ellipsis;
     white-space: nowrap;
     color: #cdd6f4;
-}}
-.file-entry .fstats {{
+}
+.file-entry .fstats {
     font-size: 11px;
     color: #a6adc8;
     white-space: nowrap;
-}}
-.file-badge {{
+}
+.file-badge {
     display: inline-block;
     padding: 1px 6px;
     border-radius: 8px;
@@ -419,75 +462,75 @@ html, body {{
     font-weight: 700;
     min-width: 36px;
     text-align: center;
-}}
+}
 /* --- Source View --- */
-#source-panel {{
+#source-panel {
     flex: 1;
     overflow: auto;
     background: #1e1e2e;
-}}
-#source-table {{
+}
+#source-table {
     border-collapse: collapse;
     width: 100%;
     font-family: "JetBrains Mono", "Fira Code", "Cascadia Code", Consolas, "Courier New", monospace;
     font-size: 13px;
     line-height: 1.55;
-}}
-#source-table tr {{
+}
+#source-table tr {
     cursor: pointer;
     transition: background 0.1s;
-}}
-#source-table tr:hover {{ background: #313244; }}
-#source-table tr.survived-line {{ background: rgba(243, 139, 168, 0.08); }}
-#source-table tr.selected-line {{ background: rgba(137, 180, 250, 0.15) !important; }}
-#source-table td {{
+}
+#source-table tr:hover { background: #313244; }
+#source-table tr.survived-line { background: rgba(243, 139, 168, 0.08); }
+#source-table tr.selected-line { background: rgba(137, 180, 250, 0.15) !important; }
+#source-table td {
     padding: 0 8px;
     white-space: pre;
     vertical-align: top;
-}}
-.ln {{
+}
+.ln {
     color: #6c7086;
     text-align: right;
     user-select: none;
     width: 1px;
     padding-right: 12px !important;
     border-right: 1px solid #45475a;
-}}
-.cov-cell {{
+}
+.cov-cell {
     width: 16px;
     text-align: center;
     padding: 0 4px !important;
-}}
-.cov-dot {{
+}
+.cov-dot {
     display: inline-block;
     width: 8px;
     height: 8px;
     border-radius: 50%;
-}}
-.cov-low  {{ background: rgba(137, 180, 250, 0.4); }}
-.cov-med  {{ background: rgba(137, 180, 250, 0.7); }}
-.cov-high {{ background: rgba(137, 180, 250, 1.0); }}
-.mut-cell {{
+}
+.cov-low  { background: rgba(137, 180, 250, 0.4); }
+.cov-med  { background: rgba(137, 180, 250, 0.7); }
+.cov-high { background: rgba(137, 180, 250, 1.0); }
+.mut-cell {
     width: 40px;
     text-align: center;
     padding: 0 2px !important;
     font-size: 12px;
     white-space: nowrap;
-}}
-.mut-killed  {{ color: #a6e3a1; }}
-.mut-survived {{ color: #f38ba8; font-weight: 700; }}
-.code-cell {{
+}
+.mut-killed  { color: #a6e3a1; }
+.mut-survived { color: #f38ba8; font-weight: 700; }
+.code-cell {
     padding-left: 12px !important;
-}}
+}
 /* Syntax colors */
-.syn-kw  {{ color: #cba6f7; }}
-.syn-str {{ color: #a6e3a1; }}
-.syn-com {{ color: #6c7086; font-style: italic; }}
-.syn-num {{ color: #fab387; }}
-.syn-dec {{ color: #f9e2af; }}
-.syn-bi  {{ color: #89dceb; }}
+.syn-kw  { color: #cba6f7; }
+.syn-str { color: #a6e3a1; }
+.syn-com { color: #6c7086; font-style: italic; }
+.syn-num { color: #fab387; }
+.syn-dec { color: #f9e2af; }
+.syn-bi  { color: #89dceb; }
 /* --- Detail Panel --- */
-#detail-panel {{
+#detail-panel {
     width: 320px;
     min-width: 320px;
     background: #181825;
@@ -496,76 +539,76 @@ html, body {{
     flex-shrink: 0;
     padding: 12px;
     font-size: 13px;
-}}
-#detail-panel.empty {{
+}
+#detail-panel.empty {
     display: flex;
     align-items: center;
     justify-content: center;
     color: #6c7086;
-}}
-.detail-section {{
+}
+.detail-section {
     margin-bottom: 16px;
-}}
-.detail-section h3 {{
+}
+.detail-section h3 {
     font-size: 11px;
     text-transform: uppercase;
     letter-spacing: 0.6px;
     color: #6c7086;
     margin-bottom: 6px;
     font-weight: 600;
-}}
-.detail-test {{
+}
+.detail-test {
     padding: 3px 0;
     color: #a6adc8;
     font-size: 12px;
     word-break: break-all;
-}}
-.mutant-card {{
+}
+.mutant-card {
     background: #313244;
     border-radius: 6px;
     padding: 8px 10px;
     margin-bottom: 8px;
     border-left: 3px solid #a6e3a1;
-}}
-.mutant-card.survived {{
+}
+.mutant-card.survived {
     border-left-color: #f38ba8;
     background: rgba(243, 139, 168, 0.08);
-}}
-.mutant-card .mc-header {{
+}
+.mutant-card .mc-header {
     display: flex;
     align-items: center;
     gap: 8px;
     margin-bottom: 4px;
-}}
-.status-badge {{
+}
+.status-badge {
     display: inline-block;
     padding: 1px 6px;
     border-radius: 4px;
     font-size: 11px;
     font-weight: 700;
-}}
-.status-killed   {{ background: #a6e3a1; color: #1e1e2e; }}
-.status-survived {{ background: #f38ba8; color: #1e1e2e; }}
-.mc-desc {{
+}
+.status-killed   { background: #a6e3a1; color: #1e1e2e; }
+.status-survived { background: #f38ba8; color: #1e1e2e; }
+.mc-desc {
     font-family: "JetBrains Mono", "Fira Code", Consolas, monospace;
     font-size: 13px;
     color: #cdd6f4;
-}}
-.mc-meta {{
+}
+.mc-meta {
     font-size: 11px;
     color: #6c7086;
     margin-top: 4px;
-}}
-.mc-tests {{
+}
+.mc-tests {
     margin-top: 6px;
-}}
-.mc-tests .mc-label {{
+}
+.mc-tests .mc-label {
     font-size: 11px;
     color: #6c7086;
     margin-bottom: 2px;
-}}
+}
 /* --- Survivor Overlay --- */
-#overlay {{
+#overlay {
     display: none;
     position: fixed;
     top: 0; left: 0; right: 0; bottom: 0;
@@ -573,11 +616,11 @@ html, body {{
     z-index: 100;
     align-items: center;
     justify-content: center;
-}}
-#overlay.visible {{
+}
+#overlay.visible {
     display: flex;
-}}
-#overlay-box {{
+}
+#overlay-box {
     background: #313244;
     border: 1px solid #45475a;
     border-radius: 10px;
@@ -585,66 +628,66 @@ html, body {{
     max-height: 70vh;
     display: flex;
     flex-direction: column;
-}}
-#overlay-header {{
+}
+#overlay-header {
     display: flex;
     align-items: center;
     padding: 12px 16px;
     border-bottom: 1px solid #45475a;
-}}
-#overlay-header h2 {{
+}
+#overlay-header h2 {
     flex: 1;
     font-size: 15px;
     font-weight: 600;
-}}
-#overlay-close {{
+}
+#overlay-close {
     background: none;
     border: none;
     color: #a6adc8;
     font-size: 20px;
     cursor: pointer;
     padding: 4px 8px;
-}}
-#overlay-close:hover {{ color: #cdd6f4; }}
-#overlay-list {{
+}
+#overlay-close:hover { color: #cdd6f4; }
+#overlay-list {
     overflow-y: auto;
     padding: 8px 0;
-}}
-.overlay-group-header {{
+}
+.overlay-group-header {
     padding: 8px 16px 4px;
     font-size: 12px;
     font-weight: 600;
     color: #89b4fa;
-}}
-.overlay-item {{
+}
+.overlay-item {
     display: flex;
     gap: 10px;
     padding: 6px 16px;
     cursor: pointer;
     font-size: 13px;
     transition: background 0.1s;
-}}
-.overlay-item:hover {{ background: #45475a; }}
-.overlay-item.current {{ background: rgba(137, 180, 250, 0.15); }}
-.overlay-item .oi-line {{
+}
+.overlay-item:hover { background: #45475a; }
+.overlay-item.current { background: rgba(137, 180, 250, 0.15); }
+.overlay-item .oi-line {
     color: #6c7086;
     min-width: 50px;
-}}
-.overlay-item .oi-desc {{
+}
+.overlay-item .oi-desc {
     color: #f38ba8;
     font-family: "JetBrains Mono", "Fira Code", Consolas, monospace;
     font-size: 12px;
-}}
+}
 /* --- Test Link --- */
-.test-link {{
+.test-link {
     color: #89b4fa;
     cursor: pointer;
-}}
-.test-link:hover {{
+}
+.test-link:hover {
     text-decoration: underline;
-}}
+}
 /* --- Test Overlay --- */
-#test-overlay {{
+#test-overlay {
     display: none;
     position: fixed;
     top: 0; left: 0; right: 0; bottom: 0;
@@ -652,11 +695,11 @@ html, body {{
     z-index: 100;
     align-items: center;
     justify-content: center;
-}}
-#test-overlay.visible {{
+}
+#test-overlay.visible {
     display: flex;
-}}
-#test-overlay-box {{
+}
+#test-overlay-box {
     background: #313244;
     border: 1px solid #45475a;
     border-radius: 10px;
@@ -664,96 +707,96 @@ html, body {{
     max-height: 80vh;
     display: flex;
     flex-direction: column;
-}}
-#test-overlay-header {{
+}
+#test-overlay-header {
     display: flex;
     align-items: center;
     padding: 12px 16px;
     border-bottom: 1px solid #45475a;
     gap: 8px;
-}}
-#test-overlay-header h2 {{
+}
+#test-overlay-header h2 {
     font-size: 15px;
     font-weight: 600;
     word-break: break-all;
-}}
-#test-overlay-header .to-file {{
+}
+#test-overlay-header .to-file {
     flex: 1;
     font-size: 12px;
     color: #6c7086;
     text-align: right;
-}}
-#test-overlay-close {{
+}
+#test-overlay-close {
     background: none;
     border: none;
     color: #a6adc8;
     font-size: 20px;
     cursor: pointer;
     padding: 4px 8px;
-}}
-#test-overlay-close:hover {{ color: #cdd6f4; }}
-#test-overlay-body {{
+}
+#test-overlay-close:hover { color: #cdd6f4; }
+#test-overlay-body {
     overflow-y: auto;
     flex: 1;
-}}
-#test-overlay-source table {{
+}
+#test-overlay-source table {
     border-collapse: collapse;
     width: 100%;
     font-family: "JetBrains Mono", "Fira Code", "Cascadia Code", Consolas, "Courier New", monospace;
     font-size: 13px;
     line-height: 1.55;
-}}
-#test-overlay-source td {{
+}
+#test-overlay-source td {
     padding: 0 8px;
     white-space: pre;
     vertical-align: top;
-}}
-#test-overlay-footer {{
+}
+#test-overlay-footer {
     border-top: 1px solid #45475a;
     padding: 10px 16px;
     font-size: 12px;
     max-height: 30vh;
     overflow-y: auto;
-}}
-.to-section {{
+}
+.to-section {
     margin-bottom: 8px;
-}}
-.to-section:last-child {{
+}
+.to-section:last-child {
     margin-bottom: 0;
-}}
-.to-label {{
+}
+.to-label {
     font-size: 11px;
     text-transform: uppercase;
     letter-spacing: 0.6px;
     color: #6c7086;
     font-weight: 600;
     margin-bottom: 2px;
-}}
-.to-mutant {{
+}
+.to-mutant {
     color: #a6e3a1;
     padding: 1px 0;
     font-size: 12px;
-}}
-.to-lines {{
+}
+.to-lines {
     color: #a6adc8;
     font-size: 12px;
     padding: 1px 0;
-}}
-#test-overlay-nav {{
+}
+#test-overlay-nav {
     display: flex;
     gap: 8px;
     align-items: center;
     border-top: 1px solid #45475a;
     padding: 8px 16px;
-}}
-.to-pos {{
+}
+.to-pos {
     flex: 1;
     font-size: 12px;
     color: #6c7086;
     text-align: center;
-}}
+}
 /* --- Footer --- */
-#footer {{
+#footer {
     height: 24px;
     display: flex;
     align-items: center;
@@ -763,7 +806,7 @@ html, body {{
     font-size: 11px;
     color: #6c7086;
     flex-shrink: 0;
-}}
+}
 </style>
 </head>
 <body>
@@ -821,15 +864,15 @@ html, body {{
 <!-- Footer -->
 <div id="footer">Generated by pytest-leela</div>
 <script>
-window.LEELA_DATA = {json_data};
-(function() {{
+window.LEELA_DATA = __LEELA_JSON__;
+(function() {
     "use strict";
     var D = window.LEELA_DATA;
     var summary = D.summary;
     var files = D.files;
     var survivedIndex = D.survived_index;
-    var testSources = D.test_sources || {{}};
-    var testIndex = {{}};
+    var testSources = D.test_sources || {};
+    var testIndex = {};
     var allTestIds = [];
     var testOverlayPos = -1;
     var currentFile = null;
@@ -837,24 +880,24 @@ window.LEELA_DATA = {json_data};
     var survivorPos = -1;
 
     /* --- Helpers --- */
-    function esc(s) {{
+    function esc(s) {
         var d = document.createElement("div");
         d.appendChild(document.createTextNode(s));
         return d.innerHTML;
-    }}
+    }
 
-    function scoreClass(score) {{
+    function scoreClass(score) {
         if (score >= 80) return "score-green";
         if (score >= 60) return "score-yellow";
         return "score-red";
-    }}
+    }
 
-    function fileBadgeColor(score) {{
+    function fileBadgeColor(score) {
         return scoreClass(score);
-    }}
+    }
 
     /* --- Syntax Highlighting --- */
-    function highlight(code) {{
+    function highlight(code) {
         var tokens = [];
         var i = 0;
         var src = code;
@@ -868,15 +911,15 @@ window.LEELA_DATA = {json_data};
             "self","cls","print","len","range","enumerate","zip","map","filter",
             "isinstance","type","super","property","staticmethod","classmethod"
         ]);
-        while (i < src.length) {{
+        while (i < src.length) {
             var ch = src[i];
             // Comments
-            if (ch === "#") {{
+            if (ch === "#") {
                 tokens.push('<span class="syn-com">' + esc(src.slice(i)) + "</span>");
                 break;
-            }}
+            }
             // Triple-quoted strings
-            if ((ch === '"' || ch === "'") && src.slice(i, i + 3) === ch + ch + ch) {{
+            if ((ch === '"' || ch === "'") && src.slice(i, i + 3) === ch + ch + ch) {
                 var q3 = ch + ch + ch;
                 var end3 = src.indexOf(q3, i + 3);
                 if (end3 === -1) end3 = src.length - 3;
@@ -884,62 +927,62 @@ window.LEELA_DATA = {json_data};
                 tokens.push('<span class="syn-str">' + esc(s3) + "</span>");
                 i = end3 + 3;
                 continue;
-            }}
+            }
             // Strings
-            if (ch === '"' || ch === "'") {{
+            if (ch === '"' || ch === "'") {
                 var j = i + 1;
-                while (j < src.length) {{
-                    if (src[j] === "\\\\") {{ j += 2; continue; }}
-                    if (src[j] === ch) {{ j++; break; }}
+                while (j < src.length) {
+                    if (src[j] === "\\\\") { j += 2; continue; }
+                    if (src[j] === ch) { j++; break; }
                     j++;
-                }}
+                }
                 tokens.push('<span class="syn-str">' + esc(src.slice(i, j)) + "</span>");
                 i = j;
                 continue;
-            }}
+            }
             // Decorators
-            if (ch === "@" && (i === 0 || /\\s/.test(src[i - 1]))) {{
+            if (ch === "@" && (i === 0 || /\\s/.test(src[i - 1]))) {
                 var m = src.slice(i).match(/^@[\\w.]+/);
-                if (m) {{
+                if (m) {
                     tokens.push('<span class="syn-dec">' + esc(m[0]) + "</span>");
                     i += m[0].length;
                     continue;
-                }}
-            }}
+                }
+            }
             // Numbers
-            if (/[0-9]/.test(ch) && (i === 0 || !/[\\w]/.test(src[i - 1]))) {{
+            if (/[0-9]/.test(ch) && (i === 0 || !/[\\w]/.test(src[i - 1]))) {
                 var nm = src.slice(i).match(/^(\\d+\\.?\\d*([eE][+-]?\\d+)?|0[xXoObB][\\da-fA-F_]+)/);
-                if (nm) {{
+                if (nm) {
                     tokens.push('<span class="syn-num">' + esc(nm[0]) + "</span>");
                     i += nm[0].length;
                     continue;
-                }}
-            }}
+                }
+            }
             // Words (keywords / builtins / identifiers)
-            if (/[a-zA-Z_]/.test(ch)) {{
+            if (/[a-zA-Z_]/.test(ch)) {
                 var wm = src.slice(i).match(/^[a-zA-Z_]\\w*/);
-                if (wm) {{
+                if (wm) {
                     var w = wm[0];
-                    if (kwSet.has(w)) {{
+                    if (kwSet.has(w)) {
                         tokens.push('<span class="syn-kw">' + esc(w) + "</span>");
-                    }} else if (biSet.has(w)) {{
+                    } else if (biSet.has(w)) {
                         tokens.push('<span class="syn-bi">' + esc(w) + "</span>");
-                    }} else {{
+                    } else {
                         tokens.push(esc(w));
-                    }}
+                    }
                     i += w.length;
                     continue;
-                }}
-            }}
+                }
+            }
             // Default character
             tokens.push(esc(ch));
             i++;
-        }}
+        }
         return tokens.join("");
-    }}
+    }
 
     /* --- Header --- */
-    function renderHeader() {{
+    function renderHeader() {
         var scoreVal = summary.mutation_score;
         var badge = document.getElementById("score-badge");
         badge.textContent = scoreVal.toFixed(1) + "%";
@@ -947,14 +990,14 @@ window.LEELA_DATA = {json_data};
         var sc = document.getElementById("survived-count");
         sc.textContent = summary.survived + " survived";
         if (summary.survived === 0) sc.style.color = "#a6e3a1";
-    }}
+    }
 
     /* --- Sidebar --- */
-    function renderSidebar() {{
+    function renderSidebar() {
         var list = document.getElementById("file-list");
         var sortedFiles = Object.keys(files).sort();
         var html = "";
-        sortedFiles.forEach(function(fname) {{
+        sortedFiles.forEach(function(fname) {
             var f = files[fname];
             var st = f.stats;
             var cls = fname === currentFile ? " active" : "";
@@ -963,53 +1006,53 @@ window.LEELA_DATA = {json_data};
             html += '<span class="file-badge ' + fileBadgeColor(st.score) + '">' + st.score.toFixed(0) + "%</span>";
             html += '<span class="fstats">' + st.killed + "/" + st.total + "</span>";
             html += "</div>";
-        }});
+        });
         list.innerHTML = html;
-        list.querySelectorAll(".file-entry").forEach(function(el) {{
-            el.addEventListener("click", function() {{
+        list.querySelectorAll(".file-entry").forEach(function(el) {
+            el.addEventListener("click", function() {
                 loadFile(el.getAttribute("data-file"));
-            }});
-        }});
-    }}
+            });
+        });
+    }
 
     /* --- Source View --- */
-    function loadFile(fname) {{
+    function loadFile(fname) {
         if (!files[fname]) return;
         currentFile = fname;
         selectedLine = null;
         renderSidebar();
         renderSource();
         renderDetail();
-    }}
+    }
 
-    function renderSource() {{
+    function renderSource() {
         var f = files[currentFile];
         var lines = f.source.split("\\n");
         // Remove trailing empty line from trailing newline
         if (lines.length > 0 && lines[lines.length - 1] === "") lines.pop();
         // Build line->mutant info
-        var lineMutants = {{}};
-        f.mutants.forEach(function(m) {{
+        var lineMutants = {};
+        f.mutants.forEach(function(m) {
             if (!lineMutants[m.lineno]) lineMutants[m.lineno] = [];
             lineMutants[m.lineno].push(m);
-        }});
+        });
         var linesCov = f.lines;
         var tbody = document.getElementById("source-body");
         var html = "";
-        lines.forEach(function(line, idx) {{
+        lines.forEach(function(line, idx) {
             var ln = idx + 1;
             var lnStr = String(ln);
             // Survived?
             var hasSurvived = false;
             var hasKilled = false;
             var mutCount = 0;
-            if (lineMutants[ln]) {{
-                lineMutants[ln].forEach(function(m) {{
+            if (lineMutants[ln]) {
+                lineMutants[ln].forEach(function(m) {
                     if (m.killed) hasKilled = true;
                     else hasSurvived = true;
                     mutCount++;
-                }});
-            }}
+                });
+            }
             var trClass = hasSurvived ? "survived-line" : "";
             html += '<tr class="' + trClass + '" data-ln="' + ln + '">';
             // Line number
@@ -1017,121 +1060,121 @@ window.LEELA_DATA = {json_data};
             // Coverage dot
             var covInfo = linesCov[lnStr];
             var covHtml = "";
-            if (covInfo && covInfo.coverage && covInfo.coverage.length > 0) {{
+            if (covInfo && covInfo.coverage && covInfo.coverage.length > 0) {
                 var cnt = covInfo.coverage.length;
                 var dotCls = cnt <= 2 ? "cov-low" : (cnt <= 5 ? "cov-med" : "cov-high");
                 covHtml = '<span class="cov-dot ' + dotCls + '" title="' + cnt + ' tests"></span>';
-            }}
+            }
             html += '<td class="cov-cell">' + covHtml + "</td>";
             // Mutation indicator
             var mutHtml = "";
-            if (mutCount > 0) {{
-                if (hasSurvived) {{
-                    var sCount = lineMutants[ln].filter(function(m) {{ return !m.killed; }}).length;
+            if (mutCount > 0) {
+                if (hasSurvived) {
+                    var sCount = lineMutants[ln].filter(function(m) { return !m.killed; }).length;
                     mutHtml = '<span class="mut-survived">' + (sCount > 1 ? "\u2717" + sCount : "\u2717") + "</span>";
-                    if (hasKilled) {{
-                        var kCount = lineMutants[ln].filter(function(m) {{ return m.killed; }}).length;
+                    if (hasKilled) {
+                        var kCount = lineMutants[ln].filter(function(m) { return m.killed; }).length;
                         mutHtml += ' <span class="mut-killed">' + (kCount > 1 ? "\u2713" + kCount : "\u2713") + "</span>";
-                    }}
-                }} else {{
+                    }
+                } else {
                     var kc = mutCount;
                     mutHtml = '<span class="mut-killed">' + (kc > 1 ? "\u2713" + kc : "\u2713") + "</span>";
-                }}
-            }}
+                }
+            }
             html += '<td class="mut-cell">' + mutHtml + "</td>";
             // Code
             html += '<td class="code-cell">' + highlight(line) + "</td>";
             html += "</tr>";
-        }});
+        });
         tbody.innerHTML = html;
         // Click handler
-        tbody.querySelectorAll("tr").forEach(function(tr) {{
-            tr.addEventListener("click", function() {{
+        tbody.querySelectorAll("tr").forEach(function(tr) {
+            tr.addEventListener("click", function() {
                 var ln = parseInt(tr.getAttribute("data-ln"), 10);
                 selectLine(ln);
-            }});
-        }});
-    }}
+            });
+        });
+    }
 
-    function selectLine(ln) {{
+    function selectLine(ln) {
         selectedLine = ln;
-        document.querySelectorAll("#source-body tr.selected-line").forEach(function(el) {{
+        document.querySelectorAll("#source-body tr.selected-line").forEach(function(el) {
             el.classList.remove("selected-line");
-        }});
+        });
         var row = document.querySelector('#source-body tr[data-ln="' + ln + '"]');
         if (row) row.classList.add("selected-line");
         renderDetail();
-    }}
+    }
 
-    function scrollToLine(ln) {{
+    function scrollToLine(ln) {
         var row = document.querySelector('#source-body tr[data-ln="' + ln + '"]');
-        if (row) {{
-            row.scrollIntoView({{ block: "center" }});
-        }}
-    }}
+        if (row) {
+            row.scrollIntoView({ block: "center" });
+        }
+    }
 
     /* --- Detail Panel --- */
-    function renderDetail() {{
+    function renderDetail() {
         var panel = document.getElementById("detail-panel");
-        if (!currentFile || !selectedLine) {{
+        if (!currentFile || !selectedLine) {
             panel.className = "empty";
             panel.innerHTML = "Click a line to see details";
             return;
-        }}
+        }
         panel.className = "";
         var f = files[currentFile];
         var lnStr = String(selectedLine);
         var html = '<div style="margin-bottom:8px;font-weight:600;color:#89b4fa;">Line ' + selectedLine + "</div>";
         // Coverage
         var covInfo = f.lines[lnStr];
-        if (covInfo && covInfo.coverage && covInfo.coverage.length > 0) {{
+        if (covInfo && covInfo.coverage && covInfo.coverage.length > 0) {
             html += '<div class="detail-section"><h3>Coverage (' + covInfo.coverage.length + " tests)</h3>";
-            covInfo.coverage.forEach(function(t) {{
+            covInfo.coverage.forEach(function(t) {
                 html += '<div class="detail-test"><span class="test-link" data-test-id="' + esc(t.id) + '">' + esc(t.display) + "</span></div>";
-            }});
+            });
             html += "</div>";
-        }} else {{
+        } else {
             html += '<div class="detail-section"><h3>Coverage</h3><div class="detail-test" style="color:#6c7086;">No coverage data</div></div>';
-        }}
+        }
         // Mutants on this line
-        var mutants = f.mutants.filter(function(m) {{ return m.lineno === selectedLine; }});
-        if (mutants.length > 0) {{
+        var mutants = f.mutants.filter(function(m) { return m.lineno === selectedLine; });
+        if (mutants.length > 0) {
             html += '<div class="detail-section"><h3>Mutants (' + mutants.length + ")</h3>";
-            mutants.forEach(function(m) {{
+            mutants.forEach(function(m) {
                 var sclass = m.killed ? "" : " survived";
                 html += '<div class="mutant-card' + sclass + '">';
                 html += '<div class="mc-header">';
-                if (m.killed) {{
+                if (m.killed) {
                     html += '<span class="status-badge status-killed">Killed</span>';
-                }} else {{
+                } else {
                     html += '<span class="status-badge status-survived">Survived</span>';
-                }}
+                }
                 html += '<span class="mc-desc">' + esc(m.description) + "</span>";
                 html += "</div>";
                 html += '<div class="mc-meta">' + esc(m.node_type) + " col " + m.col_offset + " &middot; " + (m.time_seconds * 1000).toFixed(0) + "ms</div>";
-                if (m.killed && m.killing_tests && m.killing_tests.length > 0) {{
+                if (m.killed && m.killing_tests && m.killing_tests.length > 0) {
                     html += '<div class="mc-tests"><div class="mc-label">Killing tests:</div>';
-                    m.killing_tests.forEach(function(t) {{
+                    m.killing_tests.forEach(function(t) {
                         html += '<div class="detail-test"><span class="test-link" data-test-id="' + esc(t.id) + '" style="color:#a6e3a1;">' + esc(t.display) + "</span></div>";
-                    }});
+                    });
                     html += "</div>";
-                }}
-                if (m.test_ids_run && m.test_ids_run.length > 0) {{
+                }
+                if (m.test_ids_run && m.test_ids_run.length > 0) {
                     html += '<div class="mc-tests"><div class="mc-label">Tests run (' + m.tests_run + "):</div>";
-                    m.test_ids_run.forEach(function(t) {{
+                    m.test_ids_run.forEach(function(t) {
                         html += '<div class="detail-test"><span class="test-link" data-test-id="' + esc(t.id) + '">' + esc(t.display) + "</span></div>";
-                    }});
+                    });
                     html += "</div>";
-                }}
+                }
                 html += "</div>";
-            }});
+            });
             html += "</div>";
-        }}
+        }
         panel.innerHTML = html;
-    }}
+    }
 
     /* --- Survivor Navigation --- */
-    function navigateSurvivor(pos) {{
+    function navigateSurvivor(pos) {
         if (survivedIndex.length === 0) return;
         if (pos < 0) pos = survivedIndex.length - 1;
         if (pos >= survivedIndex.length) pos = 0;
@@ -1141,89 +1184,89 @@ window.LEELA_DATA = {json_data};
         selectLine(s.lineno);
         scrollToLine(s.lineno);
         renderOverlayHighlight();
-    }}
+    }
 
-    function nextSurvivor() {{ navigateSurvivor(survivorPos + 1); }}
-    function prevSurvivor() {{ navigateSurvivor(survivorPos - 1); }}
+    function nextSurvivor() { navigateSurvivor(survivorPos + 1); }
+    function prevSurvivor() { navigateSurvivor(survivorPos - 1); }
 
     /* --- Overlay --- */
-    function renderOverlay() {{
+    function renderOverlay() {
         var list = document.getElementById("overlay-list");
         var html = "";
         var lastFile = null;
-        survivedIndex.forEach(function(s, idx) {{
-            if (s.file !== lastFile) {{
+        survivedIndex.forEach(function(s, idx) {
+            if (s.file !== lastFile) {
                 lastFile = s.file;
                 html += '<div class="overlay-group-header">' + esc(s.file) + "</div>";
-            }}
+            }
             var cls = idx === survivorPos ? " current" : "";
             html += '<div class="overlay-item' + cls + '" data-idx="' + idx + '">';
             html += '<span class="oi-line">L' + s.lineno + "</span>";
             html += '<span class="oi-desc">' + esc(s.description) + "</span>";
             html += "</div>";
-        }});
+        });
         list.innerHTML = html;
-        list.querySelectorAll(".overlay-item").forEach(function(el) {{
-            el.addEventListener("click", function() {{
+        list.querySelectorAll(".overlay-item").forEach(function(el) {
+            el.addEventListener("click", function() {
                 var idx = parseInt(el.getAttribute("data-idx"), 10);
                 toggleOverlay(false);
                 navigateSurvivor(idx);
-            }});
-        }});
-    }}
+            });
+        });
+    }
 
-    function renderOverlayHighlight() {{
-        document.querySelectorAll(".overlay-item.current").forEach(function(el) {{
+    function renderOverlayHighlight() {
+        document.querySelectorAll(".overlay-item.current").forEach(function(el) {
             el.classList.remove("current");
-        }});
+        });
         var el = document.querySelector('.overlay-item[data-idx="' + survivorPos + '"]');
         if (el) el.classList.add("current");
-    }}
+    }
 
-    function toggleOverlay(show) {{
+    function toggleOverlay(show) {
         var ov = document.getElementById("overlay");
         if (show === undefined) show = !ov.classList.contains("visible");
-        if (show) {{
+        if (show) {
             renderOverlay();
             ov.classList.add("visible");
-        }} else {{
+        } else {
             ov.classList.remove("visible");
-        }}
-    }}
+        }
+    }
 
     /* --- Test Index --- */
-    function buildTestIndex() {{
-        var idSet = {{}};
-        Object.keys(files).forEach(function(fname) {{
+    function buildTestIndex() {
+        var idSet = {};
+        Object.keys(files).forEach(function(fname) {
             var f = files[fname];
-            f.mutants.forEach(function(m) {{
-                if (m.killing_tests) m.killing_tests.forEach(function(t) {{
+            f.mutants.forEach(function(m) {
+                if (m.killing_tests) m.killing_tests.forEach(function(t) {
                     idSet[t.id] = true;
-                    if (!testIndex[t.id]) testIndex[t.id] = {{mutants_killed: [], lines_covered: {{}}}};
-                    testIndex[t.id].mutants_killed.push({{file: fname, lineno: m.lineno, description: m.description}});
-                }});
-                if (m.test_ids_run) m.test_ids_run.forEach(function(t) {{ idSet[t.id] = true; }});
-            }});
-            Object.keys(f.lines).forEach(function(lnStr) {{
+                    if (!testIndex[t.id]) testIndex[t.id] = {mutants_killed: [], lines_covered: {}};
+                    testIndex[t.id].mutants_killed.push({file: fname, lineno: m.lineno, description: m.description});
+                });
+                if (m.test_ids_run) m.test_ids_run.forEach(function(t) { idSet[t.id] = true; });
+            });
+            Object.keys(f.lines).forEach(function(lnStr) {
                 var covInfo = f.lines[lnStr];
-                if (covInfo && covInfo.coverage) {{
-                    covInfo.coverage.forEach(function(t) {{
+                if (covInfo && covInfo.coverage) {
+                    covInfo.coverage.forEach(function(t) {
                         idSet[t.id] = true;
-                        if (!testIndex[t.id]) testIndex[t.id] = {{mutants_killed: [], lines_covered: {{}}}};
+                        if (!testIndex[t.id]) testIndex[t.id] = {mutants_killed: [], lines_covered: {}};
                         if (!testIndex[t.id].lines_covered[fname]) testIndex[t.id].lines_covered[fname] = [];
                         testIndex[t.id].lines_covered[fname].push(parseInt(lnStr, 10));
-                    }});
-                }}
-            }});
-        }});
+                    });
+                }
+            });
+        });
         allTestIds = Object.keys(idSet).sort();
-    }}
+    }
 
     /* --- Test Overlay --- */
-    function showTestOverlay(testId) {{
+    function showTestOverlay(testId) {
         toggleOverlay(false);
         var source = testSources[testId];
-        var info = testIndex[testId] || {{mutants_killed: [], lines_covered: {{}}}};
+        var info = testIndex[testId] || {mutants_killed: [], lines_covered: {}};
         var pos = allTestIds.indexOf(testId);
         testOverlayPos = pos;
 
@@ -1234,98 +1277,98 @@ window.LEELA_DATA = {json_data};
         document.getElementById("test-overlay-file").textContent = filePath;
 
         var sourceEl = document.getElementById("test-overlay-source");
-        if (source) {{
+        if (source) {
             var lines = source.split("\\n");
             var shtml = "<table><tbody>";
-            lines.forEach(function(line, idx) {{
+            lines.forEach(function(line, idx) {
                 shtml += '<tr><td class="ln">' + (idx + 1) + '</td><td class="code-cell">' + highlight(line) + "</td></tr>";
-            }});
+            });
             shtml += "</tbody></table>";
             sourceEl.innerHTML = shtml;
-        }} else {{
+        } else {
             sourceEl.innerHTML = '<div style="padding:16px;color:#6c7086;">Source not available</div>';
-        }}
+        }
 
         var footerEl = document.getElementById("test-overlay-footer");
         var fhtml = "";
-        if (info.mutants_killed.length > 0) {{
+        if (info.mutants_killed.length > 0) {
             fhtml += '<div class="to-section"><div class="to-label">Kills ' + info.mutants_killed.length + " mutant(s)</div>";
-            info.mutants_killed.forEach(function(mk) {{
+            info.mutants_killed.forEach(function(mk) {
                 fhtml += '<div class="to-mutant">' + esc(mk.file) + ":" + mk.lineno + " " + esc(mk.description) + "</div>";
-            }});
+            });
             fhtml += "</div>";
-        }}
+        }
         var covFiles = Object.keys(info.lines_covered).sort();
-        if (covFiles.length > 0) {{
+        if (covFiles.length > 0) {
             fhtml += '<div class="to-section"><div class="to-label">Covers lines</div>';
-            covFiles.forEach(function(cf) {{
-                var lineNums = info.lines_covered[cf].sort(function(a, b) {{ return a - b; }});
+            covFiles.forEach(function(cf) {
+                var lineNums = info.lines_covered[cf].sort(function(a, b) { return a - b; });
                 fhtml += '<div class="to-lines">' + esc(cf) + ": " + lineNums.join(", ") + "</div>";
-            }});
+            });
             fhtml += "</div>";
-        }}
+        }
         footerEl.innerHTML = fhtml;
 
         document.getElementById("test-overlay-pos").textContent = (pos + 1) + " / " + allTestIds.length;
         document.getElementById("test-overlay").classList.add("visible");
-    }}
+    }
 
-    function closeTestOverlay() {{
+    function closeTestOverlay() {
         document.getElementById("test-overlay").classList.remove("visible");
-    }}
+    }
 
-    function nextTest() {{
+    function nextTest() {
         if (allTestIds.length === 0) return;
         var pos = testOverlayPos + 1;
         if (pos >= allTestIds.length) pos = 0;
         showTestOverlay(allTestIds[pos]);
-    }}
+    }
 
-    function prevTest() {{
+    function prevTest() {
         if (allTestIds.length === 0) return;
         var pos = testOverlayPos - 1;
         if (pos < 0) pos = allTestIds.length - 1;
         showTestOverlay(allTestIds[pos]);
-    }}
+    }
 
     /* --- Event Binding --- */
     document.getElementById("btn-next").addEventListener("click", nextSurvivor);
     document.getElementById("btn-prev").addEventListener("click", prevSurvivor);
-    document.getElementById("btn-list").addEventListener("click", function() {{ toggleOverlay(); }});
-    document.getElementById("overlay-close").addEventListener("click", function() {{ toggleOverlay(false); }});
-    document.getElementById("overlay").addEventListener("click", function(e) {{
+    document.getElementById("btn-list").addEventListener("click", function() { toggleOverlay(); });
+    document.getElementById("overlay-close").addEventListener("click", function() { toggleOverlay(false); });
+    document.getElementById("overlay").addEventListener("click", function(e) {
         if (e.target === this) toggleOverlay(false);
-    }});
+    });
     document.getElementById("btn-test-prev").addEventListener("click", prevTest);
     document.getElementById("btn-test-next").addEventListener("click", nextTest);
     document.getElementById("test-overlay-close").addEventListener("click", closeTestOverlay);
-    document.getElementById("test-overlay").addEventListener("click", function(e) {{
+    document.getElementById("test-overlay").addEventListener("click", function(e) {
         if (e.target === this) closeTestOverlay();
-    }});
-    document.addEventListener("click", function(e) {{
+    });
+    document.addEventListener("click", function(e) {
         var link = e.target.closest(".test-link");
-        if (link) {{
+        if (link) {
             e.stopPropagation();
             var testId = link.getAttribute("data-test-id");
             if (testId) showTestOverlay(testId);
-        }}
-    }});
-    document.addEventListener("keydown", function(e) {{
+        }
+    });
+    document.addEventListener("keydown", function(e) {
         if (e.target.tagName === "INPUT" || e.target.tagName === "TEXTAREA") return;
         var testOvVisible = document.getElementById("test-overlay").classList.contains("visible");
         var survivorOvVisible = document.getElementById("overlay").classList.contains("visible");
-        if (e.key === "Escape") {{
+        if (e.key === "Escape") {
             if (testOvVisible) closeTestOverlay();
             else if (survivorOvVisible) toggleOverlay(false);
-        }} else if (testOvVisible) {{
+        } else if (testOvVisible) {
             if (e.key === "ArrowRight" || e.key === "n") nextTest();
             else if (e.key === "ArrowLeft" || e.key === "p") prevTest();
-        }} else {{
+        } else {
             if (e.key === "n") nextSurvivor();
             else if (e.key === "p") prevSurvivor();
             else if (e.key === "l") toggleOverlay();
-        }}
-    }});
+        }
+    });
 
     /* --- Init --- */
     buildTestIndex();
@@ -1333,18 +1376,29 @@ window.LEELA_DATA = {json_data};
     var sortedFileNames = Object.keys(files).sort();
     if (sortedFileNames.length > 0) loadFile(sortedFileNames[0]);
     renderSidebar();
-}})();
+})();
 </script>
 </body>
 </html>
 """
+_HTML_PREFIX, _HTML_SUFFIX = (
+    part.encode("utf-8") for part in _HTML_TEMPLATE.split("__LEELA_JSON__")
+)
+
+
+def _build_html_viewer(json_data: bytes) -> bytes:
+    """Build a full interactive HTML viewer with inline JSON data.
+
+    Returns a self-contained UTF-8 HTML document with inline CSS, JS, and data.
+    The viewer renders a three-panel layout (sidebar / source / detail)
+    with survivor navigation, syntax highlighting, and a dark
+    Catppuccin-Mocha theme.
+    """
+    return _HTML_PREFIX + json_data + _HTML_SUFFIX
 
 
 def generate_html_report(result: RunResult, output_path: str) -> None:
     """Generate a single self-contained HTML mutation testing report."""
     data = _build_report_data(result)
-    json_str = json.dumps(data)
-    escaped = _escape_json_for_html(json_str)
-    html_content = _build_html_viewer(escaped)
-    with open(output_path, "w") as f:
-        f.write(html_content)
+    escaped = _escape_json_for_html(_dumps_json(data))
+    Path(output_path).write_bytes(_build_html_viewer(escaped))
@@ -8,12 +8,12 @@ import importlib.abc
 import importlib.machinery
 import sys
 import types
-from typing import Any, Callable
+from typing import Any, Callable, Mapping
 
 from pytest_leela.models import Mutant
 
 # AST operator classes by name
-_OP_CLASSES: dict[str, type] = {
+_OP_CLASSES: Mapping[str, type] = types.MappingProxyType({
     "Add": ast.Add,
     "Sub": ast.Sub,
     "Mult": ast.Mult,
@@ -41,156 +41,329 @@ _OP_CLASSES: dict[str, type] = {
     "BitXor": ast.BitXor,
     "LShift": ast.LShift,
     "RShift": ast.RShift,
-}
+})
+
+# Node types whose only mutation is an operator swap from _OP_CLASSES
+_OP_NODE_TYPES = frozenset({"BinOp", "BoolOp", "AugAssign", "Compare"})
 
 
 class MutantApplier(ast.NodeTransformer):
     """Apply a single mutation to an AST."""
 
+    # Node type -> unbound visitor, resolved once per subclass.
+    _visit_cache: dict[type, Callable[..., Any]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._visit_cache = {}
+
     def __init__(self, mutant: Mutant) -> None:
+        self.reset(mutant)
+
+    def reset(self, mutant: Mutant) -> None:
+        """Reuse this applier for another mutant."""
         self.mutant = mutant
         self.applied = False
+        # Target location, unpacked once for the per-node checks.
+        point = mutant.point
+        self._line = point.lineno
+        self._col = point.col_offset
+        self._node_type = point.node_type
+        self._replacement_cls = _OP_CLASSES.get(mutant.replacement_op)
+        # An operator mutant naming no known operator can never apply.
+        self._fast_skip = self._replacement_cls is None and (
+            self._node_type in _OP_NODE_TYPES
+            or (self._node_type == "UnaryOp" and mutant.replacement_op != "_remove")
+        )
+
+    def visit(self, node: ast.AST) -> Any:
+        if self._fast_skip:
+            return node
+        node_cls = type(node)
+        fn = self._visit_cache.get(node_cls)
+        if fn is None:
+            cls = type(self)
+            fn = getattr(cls, "visit_" + node_cls.__name__, None) or cls.generic_visit
+            self._visit_cache[node_cls] = fn
+        return fn(self, node)
 
     def _matches(self, node: ast.AST) -> bool:
         return (
-            hasattr(node, "lineno")
-            and node.lineno == self.mutant.point.lineno
-            and hasattr(node, "col_offset")
-            and node.col_offset == self.mutant.point.col_offset
+            getattr(node, "lineno", None) == self._line
+            and getattr(node, "col_offset", None) == self._col
         )
 
-    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
-        if self._matches(node) and self.mutant.point.node_type == "BinOp":
-            op_class = _OP_CLASSES.get(self.mutant.replacement_op)
-            if op_class is not None:
-                node.op = op_class()
-                self.applied = True
+    def _may_contain_target(self, node: ast.AST) -> bool:
+        """False when no descendant of ``node`` can sit at the mutant's location.
+
+        Children never start before their parent (decorators excepted) and
+        never end after it, so subtrees that end above the target line or
+        start after the target position are skipped.
+        """
+        end_lineno = getattr(node, "end_lineno", None)
+        if end_lineno is None:
+            return True
+        target_line = self._line
+        if end_lineno < target_line:
+            return False
+        lineno = node.lineno  # type: ignore[attr-defined]
+        if lineno < target_line or (
+            lineno == target_line and node.col_offset <= self._col  # type: ignore[attr-defined]
+        ):
+            return True
+        return bool(getattr(node, "decorator_list", None))
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        # NodeTransformer.generic_visit, except that children which cannot
+        # hold the target (nor be it) are skipped without a visit() call.
+        may_contain = self._may_contain_target
+        for field, old_value in ast.iter_fields(node):
+            if type(old_value) is list:
+                new_values: list[Any] = []
+                for value in old_value:
+                    if isinstance(value, ast.AST) and may_contain(value):
+                        value = self.visit(value)
+                        if value is None:
+                            continue
+                        if not isinstance(value, ast.AST):
+                            new_values.extend(value)
+                            continue
+                    new_values.append(value)
+                old_value[:] = new_values
+            elif isinstance(old_value, ast.AST) and may_contain(old_value):
+                new_node = self.visit(old_value)
+                if new_node is None:
+                    delattr(node, field)
+                else:
+                    setattr(node, field, new_node)
+        return node
+
+    def _apply(self, node: ast.AST) -> ast.AST:
+        handler = self._APPLY_HANDLERS.get(type(node).__name__)
+        if handler is None:
+            return node
+        return handler(self, node)
+
+    def _visit_candidate(self, node: ast.AST) -> ast.AST:
+        if self._matches(node) and self._node_type == type(node).__name__:
+            new_node = self._apply(node)
+            if new_node is not node:
+                return new_node
         return self.generic_visit(node)
 
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        return self._visit_candidate(node)
+
     def visit_Compare(self, node: ast.Compare) -> ast.AST:
-        if self._matches(node) and self.mutant.point.node_type == "Compare":
-            op_class = _OP_CLASSES.get(self.mutant.replacement_op)
-            if op_class is not None:
-                # Replace all comparison ops (single comparison case)
-                node.ops = [op_class() for _ in node.ops]
-                self.applied = True
-        return self.generic_visit(node)
+        return self._visit_candidate(node)
 
     def visit_BoolOp(self, node: ast.BoolOp) -> ast.AST:
-        if self._matches(node) and self.mutant.point.node_type == "BoolOp":
-            op_class = _OP_CLASSES.get(self.mutant.replacement_op)
-            if op_class is not None:
-                node.op = op_class()
-                self.applied = True
-        return self.generic_visit(node)
+        return self._visit_candidate(node)
 
     def visit_AugAssign(self, node: ast.AugAssign) -> ast.AST:
-        if self._matches(node) and self.mutant.point.node_type == "AugAssign":
-            op_class = _OP_CLASSES.get(self.mutant.replacement_op)
-            if op_class is not None:
-                node.op = op_class()
-                self.applied = True
-        return self.generic_visit(node)
+        return self._visit_candidate(node)
 
     def visit_IfExp(self, node: ast.IfExp) -> ast.AST:
-        if self._matches(node) and self.mutant.point.node_type == "IfExp":
-            replacement = self.mutant.replacement_op
-            if replacement == "swap_branches":
-                node.body, node.orelse = node.orelse, node.body
-                self.applied = True
-            elif replacement == "always_true":
-                self.applied = True
-                return ast.copy_location(node.body, node)
-            elif replacement == "always_false":
-                self.applied = True
-                return ast.copy_location(node.orelse, node)
-        return self.generic_visit(node)
+        return self._visit_candidate(node)
 
     def visit_Break(self, node: ast.Break) -> ast.AST:
-        if self._matches(node) and self.mutant.point.node_type == "Break":
-            if self.mutant.replacement_op == "continue":
-                self.applied = True
-                return ast.copy_location(ast.Continue(), node)
-        return self.generic_visit(node)
+        return self._visit_candidate(node)
 
     def visit_Continue(self, node: ast.Continue) -> ast.AST:
-        if self._matches(node) and self.mutant.point.node_type == "Continue":
-            if self.mutant.replacement_op == "break":
-                self.applied = True
-                return ast.copy_location(ast.Break(), node)
-        return self.generic_visit(node)
+        return self._visit_candidate(node)
 
     def visit_ExceptHandler(self, node: ast.ExceptHandler) -> ast.AST:
-        if self._matches(node) and self.mutant.point.node_type == "ExceptHandler":
-            replacement = self.mutant.replacement_op
-            if replacement == "broaden" and node.type is not None:
-                original_type = node.type
-                node.type = ast.Name(id="Exception", ctx=ast.Load())
-                ast.copy_location(node.type, original_type)
-                self.applied = True
-            elif replacement == "body_to_raise":
-                raise_stmt = ast.Raise()
-                ast.copy_location(raise_stmt, node)
-                node.body = [raise_stmt]
-                self.applied = True
-        return self.generic_visit(node)
+        return self._visit_candidate(node)
 
     def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
-        if self._matches(node) and self.mutant.point.node_type == "UnaryOp":
-            if self.mutant.replacement_op == "_remove":
-                self.applied = True
-                return node.operand
-            op_class = _OP_CLASSES.get(self.mutant.replacement_op)
-            if op_class is not None:
-                node.op = op_class()
-                self.applied = True
-        return self.generic_visit(node)
+        return self._visit_candidate(node)
 
     def visit_Return(self, node: ast.Return) -> ast.AST:
-        if self._matches(node) and self.mutant.point.node_type == "Return":
-            node = self._mutate_return(node)
-        return self.generic_visit(node)
+        return self._visit_candidate(node)
 
-    def _mutate_return(self, node: ast.Return) -> ast.Return:
+    def _replace_op(self, node: ast.BinOp | ast.BoolOp | ast.AugAssign) -> ast.AST:
+        op_class = self._replacement_cls
+        if op_class is not None:
+            node.op = op_class()
+            self.applied = True
+        return node
+
+    def _apply_BinOp(self, node: ast.BinOp) -> ast.AST:
+        return self._replace_op(node)
+
+    def _apply_BoolOp(self, node: ast.BoolOp) -> ast.AST:
+        return self._replace_op(node)
+
+    def _apply_AugAssign(self, node: ast.AugAssign) -> ast.AST:
+        return self._replace_op(node)
+
+    def _apply_Compare(self, node: ast.Compare) -> ast.AST:
+        op_class = self._replacement_cls
+        if op_class is not None:
+            # Replace all comparison ops (single comparison case)
+            node.ops = [op_class() for _ in node.ops]
+            self.applied = True
+        return node
+
+    def _apply_IfExp(self, node: ast.IfExp) -> ast.AST:
         replacement = self.mutant.replacement_op
+        if replacement == "swap_branches":
+            node.body, node.orelse = node.orelse, node.body
+            self.applied = True
+        elif replacement == "always_true":
+            self.applied = True
+            return ast.copy_location(node.body, node)
+        elif replacement == "always_false":
+            self.applied = True
+            return ast.copy_location(node.orelse, node)
+        return node
+
+    def _apply_Break(self, node: ast.Break) -> ast.AST:
+        if self.mutant.replacement_op == "continue":
+            self.applied = True
+            return ast.copy_location(ast.Continue(), node)
+        return node
 
-        if replacement == "False":
-            node.value = ast.Constant(value=False)
+    def _apply_Continue(self, node: ast.Continue) -> ast.AST:
+        if self.mutant.replacement_op == "break":
             self.applied = True
-        elif replacement == "True":
-            node.value = ast.Constant(value=True)
+            return ast.copy_location(ast.Break(), node)
+        return node
+
+    def _apply_ExceptHandler(self, node: ast.ExceptHandler) -> ast.AST:
+        replacement = self.mutant.replacement_op
+        if replacement == "broaden" and node.type is not None:
+            original_type = node.type
+            node.type = ast.Name(id="Exception", ctx=ast.Load())
+            ast.copy_location(node.type, original_type)
             self.applied = True
-        elif replacement == "None":
-            node.value = ast.Constant(value=None)
+        elif replacement == "body_to_raise":
+            raise_stmt = ast.Raise()
+            ast.copy_location(raise_stmt, node)
+            node.body = [raise_stmt]
             self.applied = True
-        elif replacement == "negate" and node.value is not None:
-            node.value = ast.UnaryOp(op=ast.USub(), operand=node.value)
+        return node
+
+    def _apply_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        if self.mutant.replacement_op == "_remove":
             self.applied = True
-        elif replacement == "negate_expr" and node.value is not None:
-            node.value = ast.UnaryOp(op=ast.Not(), operand=node.value)
+            return node.operand
+        op_class = self._replacement_cls
+        if op_class is not None:
+            node.op = op_class()
             self.applied = True
-        elif replacement == "remove_negation" and isinstance(node.value, ast.UnaryOp):
-            node.value = node.value.operand
+        return node
+
+    def _apply_Return(self, node: ast.Return) -> ast.AST:
+        return self._mutate_return(node)
+
+    # node_type -> mutation handler
+    _APPLY_HANDLERS: dict[str, Callable[[MutantApplier, Any], ast.AST]] = {
+        "BinOp": _apply_BinOp,
+        "BoolOp": _apply_BoolOp,
+        "AugAssign": _apply_AugAssign,
+        "Compare": _apply_Compare,
+        "IfExp": _apply_IfExp,
+        "Break": _apply_Break,
+        "Continue": _apply_Continue,
+        "ExceptHandler": _apply_ExceptHandler,
+        "UnaryOp": _apply_UnaryOp,
+        "Return": _apply_Return,
+    }
+
+    def _mutate_return(self, node: ast.Return) -> ast.Return:
+        handler = self._RETURN_HANDLERS.get(self.mutant.replacement_op)
+        if handler is None:
+            return node
+        return handler(self, node)
+
+    # Synthesized nodes take their location from the node they replace or
+    # wrap, so mutated trees compile without ast.fix_missing_locations.
+
+    def _return_constant(self, node: ast.Return, value: str | bool | None) -> ast.Return:
+        node.value = ast.copy_location(ast.Constant(value=value), node.value or node)
+        self.applied = True
+        return node
+
+    def _return_false(self, node: ast.Return) -> ast.Return:
+        return self._return_constant(node, False)
+
+    def _return_true(self, node: ast.Return) -> ast.Return:
+        return self._return_constant(node, True)
+
+    def _return_none(self, node: ast.Return) -> ast.Return:
+        return self._return_constant(node, None)
+
+    def _return_empty_str(self, node: ast.Return) -> ast.Return:
+        return self._return_constant(node, "")
+
+    def _return_negate(self, node: ast.Return) -> ast.Return:
+        if node.value is not None:
+            node.value = ast.copy_location(
+                ast.UnaryOp(op=ast.USub(), operand=node.value), node.value
+            )
             self.applied = True
-        elif replacement == "empty_str":
-            node.value = ast.Constant(value="")
+        return node
+
+    def _return_negate_expr(self, node: ast.Return) -> ast.Return:
+        if node.value is not None:
+            node.value = ast.copy_location(
+                ast.UnaryOp(op=ast.Not(), operand=node.value), node.value
+            )
             self.applied = True
-        elif replacement == "expr" and node.value is not None and isinstance(node.value, ast.Constant) and node.value.value is None:
-            node.value = ast.Constant(value=True)
+        return node
+
+    def _return_remove_negation(self, node: ast.Return) -> ast.Return:
+        if type(node.value) is ast.UnaryOp:
+            node.value = node.value.operand
             self.applied = True
+        return node
 
+    def _return_expr(self, node: ast.Return) -> ast.Return:
+        if type(node.value) is ast.Constant and node.value.value is None:
+            return self._return_constant(node, True)
         return node
 
+    # Return replacement_op -> handler
+    _RETURN_HANDLERS: dict[str, Callable[[MutantApplier, ast.Return], ast.Return]] = {
+        "False": _return_false,
+        "True": _return_true,
+        "None": _return_none,
+        "negate": _return_negate,
+        "negate_expr": _return_negate_expr,
+        "remove_negation": _return_remove_negation,
+        "empty_str": _return_empty_str,
+        "expr": _return_expr,
+    }
+
 
 def apply_mutation(source: str, mutant: Mutant) -> tuple[str, bool]:
     """Apply a mutation to source code, return (mutated_source_compiled, was_applied)."""
     tree = ast.parse(source)
     applier = MutantApplier(mutant)
     tree = applier.visit(tree)
-    ast.fix_missing_locations(tree)
     return tree, applier.applied
 
 
+# (filename, source) -> (unmutated code, {(lineno, col_offset, node_type)})
+_SRC_CACHE: dict[tuple[str, str], tuple[types.CodeType, frozenset[tuple[int, int, str]]]] = {}
+
+
+def _cached_source(source: str, filename: str) -> tuple[types.CodeType, frozenset[tuple[int, int, str]]]:
+    """Compile ``source`` once and index the node locations a mutant can target."""
+    key = (filename, source)
+    cached = _SRC_CACHE.get(key)
+    if cached is None:
+        tree = ast.parse(source, filename=filename)
+        locations = frozenset(
+            (node.lineno, node.col_offset, type(node).__name__)
+            for node in ast.walk(tree)
+            if isinstance(node, (ast.expr, ast.stmt, ast.excepthandler))
+        )
+        cached = _SRC_CACHE[key] = (compile(tree, filename, "exec"), locations)
+    return cached
+
+
 class MutatingLoader(importlib.abc.Loader):
     """Loader that applies a mutation to source before executing."""
 
@@ -203,11 +376,14 @@ class MutatingLoader(importlib.abc.Loader):
         return None
 
     def exec_module(self, module: types.ModuleType) -> None:
-        tree = ast.parse(self.source, filename=self.filename)
-        applier = MutantApplier(self.mutant)
-        tree = applier.visit(tree)
-        ast.fix_missing_locations(tree)
-        code = compile(tree, self.filename, "exec")
+        # Target modules the mutant does not touch reuse their cached code.
+        code, locations = _cached_source(self.source, self.filename)
+        point = self.mutant.point
+        if (point.lineno, point.col_offset, point.node_type) in locations:
+            tree = ast.parse(self.source, filename=self.filename)
+            applier = MutantApplier(self.mutant)
+            tree = applier.visit(tree)
+            code = compile(tree, self.filename, "exec")
         exec(code, module.__dict__)
 
 
@@ -221,6 +397,8 @@ class MutatingFinder(importlib.abc.MetaPathFinder):
     ) -> None:
         # target_modules: {module_name: source_code}
         self.target_modules = target_modules
+        # find_spec runs for every import; most names are not targets.
+        self._target_names = frozenset(target_modules)
         self.mutant = mutant
         self._module_to_file: dict[str, str] = {}
         for mod_name in target_modules:
@@ -235,15 +413,15 @@ class MutatingFinder(importlib.abc.MetaPathFinder):
         path: Any = None,
         target: Any = None,
     ) -> importlib.machinery.ModuleSpec | None:
-        if fullname in self.target_modules:
-            filename = self._module_to_file.get(fullname, f"<mutated:{fullname}>")
-            loader = MutatingLoader(
-                self.target_modules[fullname],
-                self.mutant,
-                filename,
-            )
-            return importlib.machinery.ModuleSpec(fullname, loader, origin=filename)
-        return None
+        if fullname not in self._target_names:
+            return None
+        filename = self._module_to_file.get(fullname, f"<mutated:{fullname}>")
+        loader = MutatingLoader(
+            self.target_modules[fullname],
+            self.mutant,
+            filename,
+        )
+        return importlib.machinery.ModuleSpec(fullname, loader, origin=filename)
 
 
 def install_hook(
@@ -269,9 +447,10 @@ def remove_hook(finder: MutatingFinder) -> None:
 
 def clear_target_modules(module_names: list[str]) -> None:
     """Remove target modules from sys.modules to force re-import."""
-    for name in module_names:
-        sys.modules.pop(name, None)
-        # Also clear submodules
-        to_remove = [k for k in sys.modules if k.startswith(name + ".")]
-        for k in to_remove:
-            del sys.modules[k]
+    if not module_names:
+        return
+    exact = frozenset(module_names)
+    # Also clear submodules
+    prefixes = tuple(name + "." for name in module_names)
+    for key in [k for k in sys.modules if k in exact or k.startswith(prefixes)]:
+        sys.modules.pop(key, None)
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MutationPoint:
     """A location in source code where a mutation can be applied."""
 
@@ -17,8 +18,17 @@ class MutationPoint:
     original_op: str  # "Add", "Lt", "And", "True", etc.
     inferred_type: str | None  # "int", "str", "bool", "Optional[int]", None
 
+    def __post_init__(self) -> None:
+        # Small vocabularies shared by every point; interning lets equal
+        # values share one object and compare by identity.
+        object.__setattr__(self, "module_name", sys.intern(self.module_name))
+        object.__setattr__(self, "node_type", sys.intern(self.node_type))
+        object.__setattr__(self, "original_op", sys.intern(self.original_op))
+        if self.inferred_type is not None:
+            object.__setattr__(self, "inferred_type", sys.intern(self.inferred_type))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Mutant:
     """A specific mutation to apply."""
 
@@ -27,7 +37,7 @@ class Mutant:
     mutant_id: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MutantResult:
     """Result of testing a single mutant."""
 
@@ -56,7 +66,7 @@ class CoverageMap:
         self.line_to_tests[key].add(test_id)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RunResult:
     """Complete result of a mutation testing run."""
 
@@ -69,13 +79,29 @@ class RunResult:
     coverage_map: CoverageMap | None = None
     target_sources: dict[str, str] = field(default_factory=dict)  # file_path -> source
 
+    # (killed count, survived results), filled on first access
+    _summary_cache: tuple[int, tuple[MutantResult, ...]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def _summary(self) -> tuple[int, tuple[MutantResult, ...]]:
+        summary = self._summary_cache
+        if summary is None:
+            # One pass over results; the run is not modified after construction.
+            survived = tuple(r for r in self.results if not r.killed)
+            summary = (len(self.results) - len(survived), survived)
+            object.__setattr__(self, "_summary_cache", summary)
+        return summary
+
     @property
     def killed(self) -> int:
-        return sum(1 for r in self.results if r.killed)
+        return self._summary[0]
 
     @property
     def survived(self) -> list[MutantResult]:
-        return [r for r in self.results if not r.killed]
+        # A fresh list each time so callers cannot alter the cached summary.
+        return list(self._summary[1])
 
     @property
     def mutation_score(self) -> float:
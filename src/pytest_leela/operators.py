@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 from pytest_leela.models import MutationPoint
 
 # Untyped mutations: applied when no type info is available
@@ -173,16 +175,31 @@ TYPED_MUTATIONS: dict[tuple[str, str, str], list[str]] = {
 }
 
 
-def mutations_for(point: MutationPoint, use_types: bool = True) -> list[str]:
-    """Get the list of mutations applicable to a mutation point."""
-    if use_types and point.inferred_type:
-        key = (point.node_type, point.original_op, point.inferred_type)
+@functools.lru_cache(maxsize=4096)
+def _mutations_cached(
+    node_type: str, original_op: str, inferred_type: str | None, use_types: bool
+) -> tuple[str, ...]:
+    if use_types and inferred_type:
+        key = (node_type, original_op, inferred_type)
         if key in TYPED_MUTATIONS:
-            return TYPED_MUTATIONS[key]
+            return tuple(TYPED_MUTATIONS[key])
         # Fall through to untyped if no typed rule matches
 
-    key_untyped = (point.node_type, point.original_op)
-    return UNTYPED_MUTATIONS.get(key_untyped, [])
+    return tuple(UNTYPED_MUTATIONS.get((node_type, original_op), []))
+
+
+def mutations_for(point: MutationPoint, use_types: bool = True) -> list[str]:
+    """Get the list of mutations applicable to a mutation point."""
+    return list(
+        _mutations_cached(point.node_type, point.original_op, point.inferred_type, use_types)
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _pruned_count(node_type: str, original_op: str, inferred_type: str | None) -> int:
+    untyped = _mutations_cached(node_type, original_op, inferred_type, False)
+    typed = _mutations_cached(node_type, original_op, inferred_type, True)
+    return len(untyped) - len(typed)
 
 
 def count_pruned(points: list[MutationPoint], use_types: bool = True) -> int:
@@ -190,9 +207,4 @@ def count_pruned(points: list[MutationPoint], use_types: bool = True) -> int:
     if not use_types:
         return 0
 
-    pruned = 0
-    for point in points:
-        untyped = mutations_for(point, use_types=False)
-        typed = mutations_for(point, use_types=True)
-        pruned += len(untyped) - len(typed)
-    return pruned
+    return sum(_pruned_count(p.node_type, p.original_op, p.inferred_type) for p in points)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import os
+from typing import Any
 
 from pytest_leela.models import MutantResult, RunResult
 
@@ -100,9 +101,9 @@ def format_terminal_report(result: RunResult) -> str:
     return "\n".join(lines)
 
 
-def format_json_report(result: RunResult) -> str:
-    """Format a JSON mutation testing report."""
-    data = {
+def _build_report_dict(result: RunResult) -> dict[str, Any]:
+    """Build the JSON-serializable report structure."""
+    return {
         "target_files": result.target_files,
         "total_mutants": result.total_mutants,
         "mutants_tested": result.mutants_tested,
@@ -124,4 +125,8 @@ def format_json_report(result: RunResult) -> str:
             for r in result.survived
         ],
     }
-    return json.dumps(data, indent=2)
+
+
+def format_json_report(result: RunResult) -> str:
+    """Format a JSON mutation testing report."""
+    return json.dumps(_build_report_dict(result), indent=2)
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-import glob as _glob
+import argparse
+import functools
+import operator
 import os
-from pathlib import Path
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
 
 import pytest
 
@@ -14,17 +18,35 @@ from pytest_leela.output import format_terminal_report
 from pytest_leela.resources import ResourceLimits
 
 
+_TEST_FILE_NAMES = frozenset({"conftest.py", "tests.py"})
+_TEST_FILE_PREFIXES = ("test_", "tests_")
+
+# Directories that never hold mutation targets but can be huge.  Dot-prefixed
+# ones (.git, .venv, .tox, ...) are already skipped as hidden entries; names
+# such as "build" or "env" are left alone since they can be real packages.
+_SKIP_DIRS = frozenset({"__pycache__", "node_modules", "site-packages", "venv"})
+
+
 def _is_test_file(basename: str) -> bool:
     """Return True if the filename looks like a test file."""
     return (
-        basename.startswith("test_")
-        or basename.startswith("tests_")
+        basename in _TEST_FILE_NAMES
+        or basename.startswith(_TEST_FILE_PREFIXES)
         or basename.endswith("_test.py")
-        or basename == "conftest.py"
-        or basename == "tests.py"
     )
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for ``--leela-workers``: an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def pytest_addoption(parser: pytest.Parser) -> None:
     group = parser.getgroup("leela", "mutation testing")
     group.addoption(
@@ -42,6 +64,10 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     group.addoption(
         "--max-memory", type=int, default=None, help="Max memory percent"
     )
+    group.addoption(
+        "--leela-workers", type=_positive_int, default=1, metavar="N",
+        help="Test up to N mutants at once in forked worker processes",
+    )
     group.addoption(
         "--leela-html", default=None, metavar="PATH",
         help="Generate interactive HTML mutation report at PATH",
@@ -63,32 +89,78 @@ def pytest_configure(config: pytest.Config) -> None:
         config.pluginmanager.register(BenchmarkPlugin(config), "leela-benchmark")
 
 
-def _find_target_files(target: str) -> list[str]:
-    """Resolve a --target path to a list of .py files."""
-    target_path = os.path.abspath(target)
-    if os.path.isfile(target_path) and target_path.endswith(".py"):
-        return [target_path]
-    if os.path.isdir(target_path):
-        return sorted(
-            os.path.abspath(p)
-            for p in _glob.glob(os.path.join(target_path, "**", "*.py"), recursive=True)
-            if not os.path.basename(p).startswith("__")
-            and not _is_test_file(os.path.basename(p))
-        )
-    return []
+def pytest_sessionstart(session: pytest.Session) -> None:
+    _find_target_files_cached.cache_clear()
+
+
+def _scan_py_files(root: str) -> Iterator[str]:
+    """Yield non-test, non-dunder .py files under *root*, recursively.
+
+    Uses ``os.scandir`` so each entry's type comes from the directory
+    listing rather than a separate ``stat``.  Hidden entries are skipped
+    (as ``glob`` does), directories in ``_SKIP_DIRS`` are never entered,
+    and symlinked directories are not followed.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith("."):
+                continue
+            # Cheap name checks first; only candidate names pay for is_file().
+            # The "__" prefix covers __init__.py, __main__.py and friends.
+            if (
+                name.endswith(".py")
+                and not name.startswith("__")
+                and not _is_test_file(name)
+                and entry.is_file()
+            ):
+                yield entry.path
+            elif name not in _SKIP_DIRS and entry.is_dir(follow_symlinks=False):
+                yield from _scan_py_files(entry.path)
 
 
-def _find_default_targets(rootpath: Path) -> list[str]:
+def _find_target_files(target: str) -> list[str]:
+    """Resolve a --target path to a list of .py files."""
+    return list(_find_target_files_cached(os.path.abspath(target)))
+
+
+@functools.lru_cache(maxsize=128)
+def _find_target_files_cached(target_path: str) -> tuple[str, ...]:
+    # Repeated --target values are walked once per session; the cache is
+    # cleared by the module-level pytest_sessionstart hook, which runs in
+    # both normal and benchmark mode.
+    try:
+        mode = os.stat(target_path).st_mode
+    except OSError:
+        return ()
+    if stat.S_ISREG(mode) and target_path.endswith(".py"):
+        return (target_path,)
+    if stat.S_ISDIR(mode):
+        return tuple(sorted(_scan_py_files(target_path)))
+    return ()
+
+
+def _find_all_target_files(targets: list[str]) -> list[str]:
+    """Resolve every --target, walking independent targets concurrently."""
+    if len(targets) == 1:
+        return _find_target_files(targets[0])
+    # Directory walks are I/O-bound and scandir releases the GIL.
+    with ThreadPoolExecutor(max_workers=min(8, len(targets))) as pool:
+        return [path for files in pool.map(_find_target_files, targets) for path in files]
+
+
+def _find_default_targets(rootpath: str | os.PathLike[str]) -> list[str]:
     """Look for common source directories to use as default targets."""
+    root = os.path.abspath(os.fspath(rootpath))
     for candidate in ("target", "src"):
-        candidate_dir = rootpath / candidate
-        if candidate_dir.is_dir():
-            return sorted(
-                os.path.abspath(str(p))
-                for p in candidate_dir.rglob("*.py")
-                if not p.name.startswith("__")
-                and not _is_test_file(p.name)
-            )
+        candidate_dir = os.path.join(root, candidate)
+        if os.path.isdir(candidate_dir):
+            # Shares the per-session discovery cache with --target walks.
+            return _find_target_files(candidate_dir)
     return []
 
 
@@ -105,10 +177,7 @@ class LeelaPlugin:
 
         # Determine target files
         if targets:
-            target_files: list[str] = []
-            for t in targets:
-                target_files.extend(_find_target_files(t))
-            target_files = sorted(set(target_files))
+            target_files = sorted(set(_find_all_target_files(targets)))
         elif diff_base:
             target_files = changed_files(diff_base)
         else:
@@ -120,14 +189,14 @@ class LeelaPlugin:
         # Collect test node IDs from the session instead of hardcoding a
         # ``tests/`` directory.  This lets pytest-leela work with any test
         # layout (Django apps, flat repos, monorepos, etc.).
-        test_node_ids = [item.nodeid for item in session.items]
+        test_node_ids = list(map(operator.attrgetter("nodeid"), session.items))
 
         limits = ResourceLimits(
             max_cores=self.config.getoption("max_cores", default=None),
             max_memory_percent=self.config.getoption("max_memory", default=None),
         )
 
-        engine = Engine()
+        engine = Engine(workers=self.config.getoption("leela_workers", default=1) or 1)
         result = engine.run(
             target_files, test_node_ids=test_node_ids, limits=limits, diff_base=diff_base
         )
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import os
+import re
+import time
 from dataclasses import dataclass
 
 
@@ -33,25 +35,47 @@ def apply_cpu_limit(max_cores: int) -> None:
         pass
 
 
-def check_memory_usage() -> float:
-    """Return current memory usage as a percentage (0-100)."""
+# is_memory_ok() is polled between mutants; reuse a reading for this many
+# seconds instead of re-reading /proc/meminfo every time.
+_MEMINFO_TTL = 0.1
+
+# MemTotal is always listed before MemAvailable.
+_MEMINFO_RE = re.compile(r"MemTotal:\s+(\d+).*?MemAvailable:\s+(\d+)", re.S)
+
+# (time.monotonic() of the reading, usage percent)
+_meminfo_cache: tuple[float, float] | None = None
+
+
+def _read_memory_usage() -> float:
+    """Read /proc/meminfo and return memory usage as a percentage."""
     try:
         with open("/proc/meminfo") as f:
-            lines = f.readlines()
-        mem_total = 0
-        mem_available = 0
-        for line in lines:
-            if line.startswith("MemTotal:"):
-                mem_total = int(line.split()[1])
-            elif line.startswith("MemAvailable:"):
-                mem_available = int(line.split()[1])
-        if mem_total > 0:
-            return (1 - mem_available / mem_total) * 100.0
-    except (OSError, ValueError, IndexError):
+            match = _MEMINFO_RE.search(f.read())
+        if match is not None:
+            mem_total = int(match.group(1))
+            mem_available = int(match.group(2))
+            if mem_total > 0:
+                return (1 - mem_available / mem_total) * 100.0
+    except OSError:
         pass
     return 0.0
 
 
+def check_memory_usage() -> float:
+    """Return current memory usage as a percentage (0-100).
+
+    Readings are cached for ``_MEMINFO_TTL`` seconds.
+    """
+    global _meminfo_cache
+    now = time.monotonic()
+    cached = _meminfo_cache
+    if cached is not None and now - cached[0] < _MEMINFO_TTL:
+        return cached[1]
+    usage = _read_memory_usage()
+    _meminfo_cache = (now, usage)
+    return usage
+
+
 def is_memory_ok(limits: ResourceLimits) -> bool:
     """Check if memory usage is within configured limits."""
     if limits.max_memory_percent is None:
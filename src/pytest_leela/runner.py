@@ -6,10 +6,14 @@ import contextlib
 import io
 import ntpath  # noqa: F401 — keep in sys.modules (see engine.py comment)
 import os
+import pickle
 import posixpath  # noqa: F401 — same as ntpath
+import selectors
+import signal
 import sys
 import time
-from typing import Any
+import traceback
+from typing import Any, Iterable
 
 # Save references to stdlib path modules.  During self-mutation the inner
 # pytest.main() may evict these from sys.modules; we need to restore them
@@ -91,6 +95,8 @@ class _ResultCollector:
         self.failed: list[str] = []
         self.errors: list[str] = []
         self.total = 0
+        # First failing or erroring test; the mutant is killed once this is set.
+        self.killed_by: str | None = None
 
     def pytest_runtest_logreport(self, report: Any) -> None:
         if report.when == "call":
@@ -101,6 +107,10 @@ class _ResultCollector:
                 self.failed.append(report.nodeid)
         elif report.when in ("setup", "teardown") and report.failed:
             self.errors.append(report.nodeid)
+        else:
+            return
+        if report.failed and self.killed_by is None:
+            self.killed_by = report.nodeid
 
 
 def run_tests_for_mutant(
@@ -129,12 +139,16 @@ def run_tests_for_mutant(
     try:
         collector = _ResultCollector()
 
-        # Build pytest args — disable leela plugin to prevent recursion
+        # Build pytest args — disable leela plugin to prevent recursion.
+        # The cache provider is disabled too: it would read and rewrite
+        # .pytest_cache on every mutant and record mutant failures in the
+        # user's lastfailed set.
         args: list[str] = [
             "--tb=no", "-q", "--no-header", "-x",
             "--override-ini=addopts=",
             "-p", "no:leela",
             "-p", "no:leela-benchmark",
+            "-p", "no:cacheprovider",
             "--capture=sys",
         ]
 
@@ -184,19 +198,14 @@ def run_tests_for_mutant(
             # the inner run added.
             sys.modules.update(saved_modules)
             cwd_prefix = os.getcwd() + os.sep
-            for key in list(sys.modules.keys()):
-                if key not in saved_modules:
-                    mod = sys.modules.get(key)
-                    mod_file = getattr(mod, "__file__", None) if mod is not None else None
-                    if mod_file is not None and mod_file.startswith(cwd_prefix):
-                        sys.modules.pop(key, None)
-
-        killed = len(collector.failed) > 0 or len(collector.errors) > 0
-        killing_test = None
-        if collector.failed:
-            killing_test = collector.failed[0]
-        elif collector.errors:
-            killing_test = collector.errors[0]
+            for key in sys.modules.keys() - saved_modules.keys():
+                mod = sys.modules.get(key)
+                mod_file = getattr(mod, "__file__", None) if mod is not None else None
+                if mod_file is not None and mod_file.startswith(cwd_prefix):
+                    sys.modules.pop(key, None)
+
+        killing_test = collector.killed_by
+        killed = killing_test is not None
 
         elapsed = time.monotonic() - start
 
@@ -229,3 +238,210 @@ def run_tests_for_mutant(
         # assertion rewriter → PurePath → import ntpath → recursion.
         for mod_name, mod_obj in _STDLIB_PATH_MODULES.items():
             sys.modules.setdefault(mod_name, mod_obj)
+
+
+# Exit status of a forked child whose own machinery failed (not the mutant).
+_HARNESS_ERROR_EXIT = 70
+
+
+def _fork_mutant(
+    mutant: Mutant,
+    target_sources: dict[str, str],
+    module_to_file: dict[str, str],
+    test_ids: list[str] | None,
+    test_dir: str | None,
+    cpu: int | None = None,
+) -> tuple[int, int]:
+    """Fork a child that runs *mutant* and pickles its result into a pipe.
+
+    Returns ``(pid, read_fd)``; the caller reads the pipe to EOF and then
+    hands both to :func:`_reap_mutant`.  When *cpu* is given the child is
+    pinned to that core.
+    """
+    read_fd, write_fd = os.pipe()
+    try:
+        pid = os.fork()
+    except BaseException:
+        os.close(read_fd)
+        os.close(write_fd)
+        raise
+    if pid == 0:
+        # Child: never return into the caller's stack — always _exit.
+        # A harness failure sends its traceback instead of a result and
+        # exits with _HARNESS_ERROR_EXIT so the parent can tell it apart
+        # from a mutant that crashed the process.
+        os.close(read_fd)
+        status = _HARNESS_ERROR_EXIT
+        try:
+            with os.fdopen(write_fd, "wb") as f:
+                try:
+                    if cpu is not None:
+                        with contextlib.suppress(AttributeError, OSError):
+                            os.sched_setaffinity(0, {cpu})
+                    child_result = run_tests_for_mutant(
+                        mutant, target_sources, module_to_file,
+                        test_ids=test_ids, test_dir=test_dir,
+                    )
+                    payload = pickle.dumps(child_result)
+                except BaseException:
+                    f.write(traceback.format_exc().encode())
+                else:
+                    f.write(payload)
+                    status = 0
+        finally:
+            os._exit(status)
+
+    os.close(write_fd)
+    return pid, read_fd
+
+
+def _reap_mutant(mutant: Mutant, pid: int, payload: bytes, start: float) -> MutantResult:
+    """Wait for a forked child and turn its pipe payload into a result.
+
+    Raises ``RuntimeError`` when the child failed for reasons of its own
+    rather than because of the mutant.
+    """
+    _, status = os.waitpid(pid, 0)
+    exit_code = os.waitstatus_to_exitcode(status)
+
+    if exit_code == 0 and payload:
+        result: MutantResult = pickle.loads(payload)
+        return result
+    if exit_code == _HARNESS_ERROR_EXIT:
+        raise RuntimeError(
+            f"leela worker failed while testing mutant {mutant.mutant_id}:\n"
+            + payload.decode(errors="replace")
+        )
+    if exit_code == 0:
+        raise RuntimeError(
+            f"leela worker exited without a result for mutant {mutant.mutant_id}"
+        )
+
+    # Killed by a signal or exited non-zero mid-run — a mutation that
+    # takes down the whole process counts as killed.
+    return MutantResult(
+        mutant=mutant,
+        killed=True,
+        tests_run=0,
+        killing_test="<crashed>",
+        time_seconds=time.monotonic() - start,
+        test_ids_run=[],
+        killing_tests=["<crashed>"],
+    )
+
+
+def run_tests_for_mutant_forked(
+    mutant: Mutant,
+    target_sources: dict[str, str],
+    module_to_file: dict[str, str],
+    test_ids: list[str] | None = None,
+    test_dir: str | None = None,
+) -> MutantResult:
+    """Run tests against a single mutant in a forked child process.
+
+    The child shares the parent's already-imported modules copy-on-write,
+    so whatever state the mutant corrupts dies with the child instead of
+    leaking into later runs.  Falls back to :func:`run_tests_for_mutant`
+    on platforms without ``os.fork``.
+    """
+    if not hasattr(os, "fork"):
+        return run_tests_for_mutant(
+            mutant, target_sources, module_to_file,
+            test_ids=test_ids, test_dir=test_dir,
+        )
+
+    start = time.monotonic()
+    pid, read_fd = _fork_mutant(
+        mutant, target_sources, module_to_file, test_ids, test_dir
+    )
+    with os.fdopen(read_fd, "rb") as f:
+        payload = f.read()
+    return _reap_mutant(mutant, pid, payload, start)
+
+
+def _worker_cpus() -> list[int]:
+    """Return the CPUs this process may run on, in order."""
+    try:
+        return sorted(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return []
+
+
+def run_tests_for_mutants_parallel(
+    jobs: Iterable[tuple[Mutant, list[str] | None]],
+    target_sources: dict[str, str],
+    module_to_file: dict[str, str],
+    test_dir: str | None = None,
+    workers: int = 2,
+) -> list[MutantResult]:
+    """Run ``(mutant, test_ids)`` jobs in up to *workers* forked children.
+
+    Each running child is pinned to its own CPU from this process's
+    affinity set.  *jobs* is consumed lazily, one item per free worker, so
+    a generator can stop dispatching (e.g. on a memory limit) at any point.
+    Results are returned in job order.  Without ``os.fork`` the jobs run
+    one after another in-process.
+    """
+    if workers <= 1 or not hasattr(os, "fork"):
+        return [
+            run_tests_for_mutant_forked(
+                mutant, target_sources, module_to_file,
+                test_ids=test_ids, test_dir=test_dir,
+            )
+            for mutant, test_ids in jobs
+        ]
+
+    cpus = _worker_cpus()
+    free_slots = list(range(workers - 1, -1, -1))
+    # read_fd -> (job index, mutant, pid, slot, start, payload chunks)
+    running: dict[int, tuple[int, Mutant, int, int, float, list[bytes]]] = {}
+    results: dict[int, MutantResult] = {}
+    pending = enumerate(jobs)
+    exhausted = False
+
+    with selectors.DefaultSelector() as selector:
+        try:
+            while True:
+                while free_slots and not exhausted:
+                    job = next(pending, None)
+                    if job is None:
+                        exhausted = True
+                        break
+                    index, (mutant, test_ids) = job
+                    slot = free_slots.pop()
+                    cpu = cpus[slot % len(cpus)] if cpus else None
+                    start = time.monotonic()
+                    pid, read_fd = _fork_mutant(
+                        mutant, target_sources, module_to_file, test_ids, test_dir, cpu
+                    )
+                    running[read_fd] = (index, mutant, pid, slot, start, [])
+                    selector.register(read_fd, selectors.EVENT_READ)
+
+                if not running:
+                    break
+
+                # Drain pipes as data arrives so no child blocks on a full pipe.
+                for key, _ in selector.select():
+                    fd = key.fd
+                    index, mutant, pid, slot, start, chunks = running[fd]
+                    chunk = os.read(fd, 65536)
+                    if chunk:
+                        chunks.append(chunk)
+                        continue
+                    selector.unregister(fd)
+                    os.close(fd)
+                    del running[fd]
+                    results[index] = _reap_mutant(mutant, pid, b"".join(chunks), start)
+                    free_slots.append(slot)
+        finally:
+            # Empty after a normal run.  On an error or interrupt (a harness
+            # failure, a raising jobs iterable, ^C) kill and reap whatever
+            # children are still running so none are left behind.
+            for fd, (_, _, pid, *_) in running.items():
+                with contextlib.suppress(ProcessLookupError):
+                    os.kill(pid, signal.SIGKILL)
+                with contextlib.suppress(ChildProcessError):
+                    os.waitpid(pid, 0)
+                os.close(fd)
+
+    return [results[i] for i in sorted(results)]
@@ -0,0 +1,21 @@
+"""Shared fixtures for the pytest-leela test suite."""
+
+from typing import Any
+
+import pytest
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run ``@pytest.mark.slow`` tests last so fast failures surface first."""
+    items.sort(key=lambda item: item.get_closest_marker("slow") is not None)
+
+
+def _git_unavailable(*args: Any, **kwargs: Any) -> Any:
+    raise FileNotFoundError("git")
+
+
+@pytest.fixture(autouse=True)
+def _no_git(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make ``git`` look missing for tests marked ``@pytest.mark.no_git``."""
+    if request.node.get_closest_marker("no_git") is not None:
+        monkeypatch.setattr("pytest_leela.git_diff._run", _git_unavailable)
@@ -1,9 +1,12 @@
 """Tests for pytest_leela.engine."""
 
+import copy
 import os
 import sys
 import tempfile
 import types
+from dataclasses import dataclass
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -12,6 +15,9 @@ from pytest_leela.engine import Engine, _clean_process_state, _module_name_from_
 from pytest_leela.import_hook import MutatingFinder
 from pytest_leela.models import CoverageMap, Mutant, MutantResult, MutationPoint, RunResult
 from pytest_leela.resources import ResourceLimits
+from pytest_leela.runner import run_tests_for_mutant_forked
+
+_TMP_PREFIX = tempfile.gettempdir() + os.sep
 
 
 def describe_engine():
@@ -20,9 +26,14 @@ def describe_engine():
 
         assert Engine is not None
 
+    def it_rejects_a_custom_executor_with_parallel_workers():
+        with pytest.raises(ValueError, match="workers"):
+            Engine(executor=MagicMock(), workers=2)
+
 
-def _make_dummy_finder() -> MutatingFinder:
-    """Create a MutatingFinder with minimal dummy data."""
+@pytest.fixture(scope="module")
+def dummy_finder() -> MutatingFinder:
+    """A MutatingFinder with minimal dummy data, built once per module."""
     point = MutationPoint(
         file_path="dummy.py",
         module_name="dummy",
@@ -37,10 +48,10 @@ def _make_dummy_finder() -> MutatingFinder:
 
 
 def describe_clean_process_state():
-    def it_removes_stale_mutating_finders_from_meta_path():
+    def it_removes_stale_mutating_finders_from_meta_path(dummy_finder):
         """Kills engine.py line 67: not isinstance(f, MutatingFinder) → isinstance(...)."""
-        stale_finder = _make_dummy_finder()
-        original_meta_path = sys.meta_path[:]
+        stale_finder = copy.copy(dummy_finder)
+        original_meta_path = tuple(sys.meta_path)
         try:
             sys.meta_path.insert(0, stale_finder)
             assert stale_finder in sys.meta_path
@@ -51,12 +62,12 @@ def describe_clean_process_state():
         finally:
             sys.meta_path[:] = original_meta_path
 
-    def it_preserves_non_mutating_finders_in_meta_path():
-        original_meta_path = sys.meta_path[:]
+    def it_preserves_non_mutating_finders_in_meta_path(dummy_finder):
+        original_meta_path = tuple(sys.meta_path)
         original_non_mutating = [
             f for f in sys.meta_path if not isinstance(f, MutatingFinder)
         ]
-        stale_finder = _make_dummy_finder()
+        stale_finder = copy.copy(dummy_finder)
         try:
             sys.meta_path.insert(0, stale_finder)
 
@@ -70,9 +81,8 @@ def describe_clean_process_state():
             sys.meta_path[:] = original_meta_path
 
     def it_removes_modules_loaded_from_temp_directories():
-        tmp_dir = tempfile.gettempdir()
         fake_mod = types.ModuleType("_stale_tmp_fixture_mod")
-        fake_mod.__file__ = os.path.join(tmp_dir, "stale_target.py")
+        fake_mod.__file__ = _TMP_PREFIX + "stale_target.py"
         try:
             sys.modules["_stale_tmp_fixture_mod"] = fake_mod
             assert "_stale_tmp_fixture_mod" in sys.modules
@@ -83,20 +93,62 @@ def describe_clean_process_state():
         finally:
             sys.modules.pop("_stale_tmp_fixture_mod", None)
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="TMPDIR is not used on Windows")
+    def it_still_detects_temp_modules_after_TMPDIR_env_change(tmp_path, monkeypatch):
+        """The temp prefix is resolved once at import; TMPDIR changes are ignored."""
+        elsewhere = tmp_path / "elsewhere"
+        elsewhere.mkdir()
+        monkeypatch.setenv("TMPDIR", str(elsewhere))
+        # Drop tempfile's own cache so a call-time gettempdir() would now
+        # return ``elsewhere`` and miss the module below.
+        monkeypatch.setattr(tempfile, "tempdir", None)
+        fake_mod = types.ModuleType("_stale_tmpdir_env_mod")
+        fake_mod.__file__ = _TMP_PREFIX + "stale_target.py"
+        try:
+            sys.modules["_stale_tmpdir_env_mod"] = fake_mod
+
+            _clean_process_state()
+
+            assert "_stale_tmpdir_env_mod" not in sys.modules
+        finally:
+            sys.modules.pop("_stale_tmpdir_env_mod", None)
+
+    def it_keeps_none_placeholders_in_sys_modules():
+        try:
+            sys.modules["_none_placeholder_mod"] = None
+
+            _clean_process_state()
+
+            assert "_none_placeholder_mod" in sys.modules
+        finally:
+            sys.modules.pop("_none_placeholder_mod", None)
+
+    def it_does_not_trigger_module_level_getattr():
+        calls: list[str] = []
+        lazy_mod = types.ModuleType("_lazy_getattr_mod")
+        lazy_mod.__getattr__ = lambda name: calls.append(name)
+        try:
+            sys.modules["_lazy_getattr_mod"] = lazy_mod
+
+            _clean_process_state()
+
+            assert calls == []
+            assert "_lazy_getattr_mod" in sys.modules
+        finally:
+            sys.modules.pop("_lazy_getattr_mod", None)
+
     def it_keeps_non_temp_modules():
-        original_keys = set(sys.modules.keys())
+        original_modules = tuple(sys.modules.items())
 
         _clean_process_state()
 
         # All non-temp modules should still be present
-        for key in original_keys:
-            mod = sys.modules.get(key)
-            if mod is None:
-                continue
+        for key, mod in original_modules:
             mod_file = getattr(mod, "__file__", None)
             if mod_file is None:
                 assert key in sys.modules
-            elif not mod_file.startswith(tempfile.gettempdir() + os.sep):
+                continue
+            if not mod_file.startswith(_TMP_PREFIX):
                 assert key in sys.modules
 
 
@@ -148,26 +200,104 @@ def describe_module_name_from_path():
         assert result == "standalone"
 
 
-def describe_Engine_run():
-    def it_finds_and_kills_mutants_in_a_tiny_module(tmp_path, monkeypatch):
-        target = tmp_path / "eng_target.py"
-        target.write_text("def add(a, b):\n    return a + b\n")
+_ADD_SOURCE = "def add(a, b):\n    return a + b\n"
 
-        test_dir = tmp_path / "eng_tests"
-        test_dir.mkdir()
-        (test_dir / "test_eng_target.py").write_text(
-            "from eng_target import add\n\n"
-            "def test_add():\n"
-            "    assert add(1, 2) == 3\n\n"
-            "def test_add_zero():\n"
-            "    assert add(0, 0) == 0\n"
-        )
 
-        monkeypatch.chdir(tmp_path)
-        monkeypatch.syspath_prepend(str(tmp_path))
+@dataclass(frozen=True)
+class _EngineFS:
+    """Paths of the prebuilt target/test tree shared by describe_Engine_run."""
+
+    root: Path
+    add: Path
+    add_tests: Path
+    noop: Path
+    noop_tests: Path
+    arith: Path
+    arith_tests: Path
 
-        engine = Engine(use_types=False, use_coverage=False)
-        result = engine.run([str(target)], str(test_dir))
+
+@pytest.fixture(scope="module")
+def engine_fs(tmp_path_factory: pytest.TempPathFactory) -> _EngineFS:
+    """Write the Engine.run targets and their tests once per module."""
+    root = tmp_path_factory.mktemp("engine_fs")
+
+    add = root / "eng_add.py"
+    add.write_text(_ADD_SOURCE)
+    add_tests = root / "eng_add_tests"
+    add_tests.mkdir()
+    (add_tests / "test_eng_add.py").write_text(
+        "from eng_add import add\n\n"
+        "def test_add():\n"
+        "    assert add(1, 2) == 3\n\n"
+        "def test_add_zero():\n"
+        "    assert add(0, 0) == 0\n"
+    )
+
+    noop = root / "eng_noop.py"
+    noop.write_text("def noop():\n    return 1\n")
+    noop_tests = root / "eng_noop_tests"
+    noop_tests.mkdir()
+    (noop_tests / "test_eng_noop.py").write_text(
+        "from eng_noop import noop\n\n"
+        "def test_noop():\n"
+        "    assert noop() == 1\n"
+    )
+
+    arith = root / "eng_arith.py"
+    arith.write_text(
+        "def add(a, b):\n"
+        "    return a + b\n"
+        "\n"
+        "def sub(a, b):\n"
+        "    return a - b\n"
+    )
+    arith_tests = root / "eng_arith_tests"
+    arith_tests.mkdir()
+    (arith_tests / "test_eng_arith.py").write_text(
+        "from eng_arith import add, sub\n\n"
+        "def test_add():\n"
+        "    assert add(1, 2) == 3\n\n"
+        "def test_sub():\n"
+        "    assert sub(3, 1) == 2\n"
+    )
+
+    return _EngineFS(
+        root=root,
+        add=add,
+        add_tests=add_tests,
+        noop=noop,
+        noop_tests=noop_tests,
+        arith=arith,
+        arith_tests=arith_tests,
+    )
+
+
+@pytest.fixture
+def fs(engine_fs: _EngineFS, monkeypatch: pytest.MonkeyPatch) -> _EngineFS:
+    """Make the shared tree the CWD and importable for one test."""
+    monkeypatch.chdir(engine_fs.root)
+    monkeypatch.syspath_prepend(str(engine_fs.root))
+    return engine_fs
+
+
+@dataclass(slots=True)
+class _FakeTime:
+    """Stand-in for the ``time`` module that replays monotonic readings."""
+
+    readings: list[float]
+    calls: int = 0
+
+    def monotonic(self) -> float:
+        value = self.readings[self.calls]
+        self.calls += 1
+        return value
+
+
+@pytest.mark.slow
+def describe_Engine_run():
+    def it_finds_and_kills_mutants_in_a_tiny_module(fs):
+        engine = Engine(use_types=False, use_coverage=False, executor=run_tests_for_mutant_forked)
+        result = engine.run([str(fs.add)], str(fs.add_tests))
 
         assert isinstance(result, RunResult)
         # BinOp Add -> [Sub, Mult] and Return expr -> [None] = 3 mutants
@@ -176,95 +306,57 @@ def describe_Engine_run():
         assert result.killed >= 1
         assert result.wall_time_seconds > 0
 
-    def it_reports_wall_time_as_positive(tmp_path, monkeypatch):
-        target = tmp_path / "eng_t2.py"
-        target.write_text("def noop():\n    return 1\n")
-        test_dir = tmp_path / "eng_t2_tests"
-        test_dir.mkdir()
-        (test_dir / "test_noop.py").write_text(
-            "from eng_t2 import noop\n\n"
-            "def test_noop():\n"
-            "    assert noop() == 1\n"
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def it_runs_mutants_in_parallel_workers(fs):
+        serial = Engine(
+            use_types=False, use_coverage=False, executor=run_tests_for_mutant_forked
+        ).run([str(fs.add)], str(fs.add_tests))
+        parallel = Engine(use_types=False, use_coverage=False, workers=2).run(
+            [str(fs.add)], str(fs.add_tests)
         )
-        monkeypatch.chdir(tmp_path)
-        monkeypatch.syspath_prepend(str(tmp_path))
-        engine = Engine(use_types=False, use_coverage=False)
-        result = engine.run([str(target)], str(test_dir))
+
+        assert [r.mutant for r in parallel.results] == [r.mutant for r in serial.results]
+        assert [r.killed for r in parallel.results] == [r.killed for r in serial.results]
+
+    def it_reports_wall_time_as_positive(fs):
+        engine = Engine(use_types=False, use_coverage=False, executor=run_tests_for_mutant_forked)
+        result = engine.run([str(fs.noop)], str(fs.noop_tests))
         # wall_time = time.monotonic() - start; start < end, so positive
         assert result.wall_time_seconds > 0
 
-    def it_counts_total_mutants_including_pruned(tmp_path, monkeypatch):
+    def it_counts_total_mutants_including_pruned(fs):
         """total_mutants = len(all_mutants) + total_pruned."""
-        target = tmp_path / "eng_t3.py"
-        target.write_text("def add(a, b):\n    return a + b\n")
-        test_dir = tmp_path / "eng_t3_tests"
-        test_dir.mkdir()
-        (test_dir / "test_t3.py").write_text(
-            "from eng_t3 import add\ndef test_add():\n    assert add(1, 2) == 3\n"
-        )
-        monkeypatch.chdir(tmp_path)
-        monkeypatch.syspath_prepend(str(tmp_path))
-        engine = Engine(use_types=False, use_coverage=False)
-        result = engine.run([str(target)], str(test_dir))
+        engine = Engine(use_types=False, use_coverage=False, executor=run_tests_for_mutant_forked)
+        result = engine.run([str(fs.add)], str(fs.add_tests))
         # total_mutants should be at least mutants_tested + mutants_pruned
         assert result.total_mutants == result.mutants_tested + result.mutants_pruned
 
-    def it_adds_pruned_count_to_total_mutants(tmp_path, monkeypatch):
+    def it_adds_pruned_count_to_total_mutants(fs):
         """total_mutants = len(all_mutants) + total_pruned (not minus).
 
         Kills line 108: + → -
         """
-        target = tmp_path / "t_pruned.py"
-        target.write_text("def add(a, b):\n    return a + b\n")
-        test_dir = tmp_path / "t_pruned_tests"
-        test_dir.mkdir()
-        (test_dir / "test_pruned.py").write_text(
-            "from t_pruned import add\n"
-            "def test_add():\n"
-            "    assert add(1, 2) == 3\n"
-        )
-        monkeypatch.chdir(tmp_path)
-        monkeypatch.syspath_prepend(str(tmp_path))
-
         # Mock count_pruned to return a non-zero value so + vs - matters
         with patch("pytest_leela.engine.count_pruned", return_value=5):
-            engine = Engine(use_types=False, use_coverage=False)
-            result = engine.run([str(target)], str(test_dir))
+            engine = Engine(
+                use_types=False, use_coverage=False, executor=run_tests_for_mutant_forked
+            )
+            result = engine.run([str(fs.add)], str(fs.add_tests))
 
         assert result.mutants_pruned == 5
         assert result.total_mutants == result.mutants_tested + 5
 
-    def it_tests_only_mutants_on_diff_changed_lines(tmp_path, monkeypatch):
+    def it_tests_only_mutants_on_diff_changed_lines(fs):
         """diff_base filters mutants to only changed lines.
 
         Kills line 116: and → or, in → not in
         Kills line 117: in → not in
         """
-        target = tmp_path / "t_diff.py"
-        target.write_text(
-            "def add(a, b):\n"
-            "    return a + b\n"
-            "\n"
-            "def sub(a, b):\n"
-            "    return a - b\n"
-        )
-        abs_target = os.path.abspath(str(target))
-        test_dir = tmp_path / "t_diff_tests"
-        test_dir.mkdir()
-        (test_dir / "test_diff.py").write_text(
-            "from t_diff import add, sub\n\n"
-            "def test_add():\n"
-            "    assert add(1, 2) == 3\n\n"
-            "def test_sub():\n"
-            "    assert sub(3, 1) == 2\n"
-        )
-        monkeypatch.chdir(tmp_path)
-        monkeypatch.syspath_prepend(str(tmp_path))
-
-        engine = Engine(use_types=False, use_coverage=False)
+        abs_target = os.path.abspath(str(fs.arith))
+        engine = Engine(use_types=False, use_coverage=False, executor=run_tests_for_mutant_forked)
 
         # Baseline: all mutants tested (no diff filter)
-        result_all = engine.run([str(target)], str(test_dir))
+        result_all = engine.run([str(fs.arith)], str(fs.arith_tests))
         all_lines = {r.mutant.point.lineno for r in result_all.results}
         assert len(all_lines) > 1, "need mutants on multiple lines"
 
@@ -272,41 +364,34 @@ def describe_Engine_run():
         with patch("pytest_leela.engine.changed_lines") as mock_cl:
             mock_cl.return_value = {abs_target: {2}}
             result_diff = engine.run(
-                [str(target)], str(test_dir), diff_base="main"
+                [str(fs.arith)], str(fs.arith_tests), diff_base="main"
             )
 
+        # git diff is consulted once per run, not per target or mutant
+        mock_cl.assert_called_once_with("main")
         # Fewer mutants tested (only line 2), and all on line 2
         assert 0 < result_diff.mutants_tested < result_all.mutants_tested
         tested_lines = {r.mutant.point.lineno for r in result_diff.results}
         assert tested_lines == {2}
 
-    def it_stops_testing_when_memory_limit_exceeded(tmp_path, monkeypatch):
+    def it_stops_testing_when_memory_limit_exceeded(fs):
         """Engine breaks when is_memory_ok returns False.
 
         Kills line 129: not x → x
         """
-        target = tmp_path / "t_mem.py"
-        target.write_text("def add(a, b):\n    return a + b\n")
-        test_dir = tmp_path / "t_mem_tests"
-        test_dir.mkdir()
-        (test_dir / "test_mem.py").write_text(
-            "from t_mem import add\n"
-            "def test_add():\n"
-            "    assert add(1, 2) == 3\n"
-        )
-        monkeypatch.chdir(tmp_path)
-        monkeypatch.syspath_prepend(str(tmp_path))
-
         limits = ResourceLimits(max_memory_percent=90)
+        executor = MagicMock()
 
         # is_memory_ok returns False → engine should break immediately
         with patch("pytest_leela.engine.is_memory_ok", return_value=False), \
              patch("pytest_leela.engine.apply_limits"):
-            engine = Engine(use_types=False, use_coverage=False)
-            result = engine.run([str(target)], str(test_dir), limits=limits)
+            engine = Engine(use_types=False, use_coverage=False, executor=executor)
+            result = engine.run([str(fs.add)], str(fs.add_tests), limits=limits)
 
         assert result.total_mutants > 0
         assert result.mutants_tested == 0
+        # The memory check runs before any executor is invoked
+        executor.assert_not_called()
 
     def it_computes_wall_time_as_monotonic_difference(tmp_path, monkeypatch):
         """wall_time = end - start, not end + start or end * start.
@@ -325,74 +410,35 @@ def describe_Engine_run():
         monkeypatch.chdir(tmp_path)
         monkeypatch.syspath_prepend(str(tmp_path))
 
-        mock_time = MagicMock()
-        mock_time.monotonic.side_effect = [1000.0, 1000.5]
-
-        with patch("pytest_leela.engine.time", mock_time):
-            engine = Engine(use_types=False, use_coverage=False)
+        with patch("pytest_leela.engine.time", _FakeTime([1000.0, 1000.5])):
+            engine = Engine(
+                use_types=False, use_coverage=False, executor=run_tests_for_mutant_forked
+            )
             result = engine.run([str(target)], str(test_dir))
 
         # 1000.5 - 1000.0 = 0.5 (not 2000.5 from + or 1000500.0 from *)
         assert result.wall_time_seconds == pytest.approx(0.5)
 
-
-    def it_populates_coverage_map_in_run_result(tmp_path, monkeypatch):
-        target = tmp_path / "eng_cov.py"
-        target.write_text("def add(a, b):\n    return a + b\n")
-        test_dir = tmp_path / "eng_cov_tests"
-        test_dir.mkdir()
-        (test_dir / "test_eng_cov.py").write_text(
-            "from eng_cov import add\n\n"
-            "def test_add():\n"
-            "    assert add(1, 2) == 3\n"
-        )
-        monkeypatch.chdir(tmp_path)
-        monkeypatch.syspath_prepend(str(tmp_path))
-
-        engine = Engine(use_types=False, use_coverage=True)
-        result = engine.run([str(target)], str(test_dir))
+    def it_populates_coverage_map_in_run_result(fs):
+        engine = Engine(use_types=False, use_coverage=True, executor=run_tests_for_mutant_forked)
+        result = engine.run([str(fs.add)], str(fs.add_tests))
 
         assert result.coverage_map is not None
         assert isinstance(result.coverage_map, CoverageMap)
 
-    def it_sets_coverage_map_to_none_when_coverage_disabled(tmp_path, monkeypatch):
-        target = tmp_path / "eng_nocov.py"
-        target.write_text("def add(a, b):\n    return a + b\n")
-        test_dir = tmp_path / "eng_nocov_tests"
-        test_dir.mkdir()
-        (test_dir / "test_eng_nocov.py").write_text(
-            "from eng_nocov import add\n\n"
-            "def test_add():\n"
-            "    assert add(1, 2) == 3\n"
-        )
-        monkeypatch.chdir(tmp_path)
-        monkeypatch.syspath_prepend(str(tmp_path))
-
-        engine = Engine(use_types=False, use_coverage=False)
-        result = engine.run([str(target)], str(test_dir))
+    def it_sets_coverage_map_to_none_when_coverage_disabled(fs):
+        engine = Engine(use_types=False, use_coverage=False, executor=run_tests_for_mutant_forked)
+        result = engine.run([str(fs.add)], str(fs.add_tests))
 
         assert result.coverage_map is None
 
-    def it_populates_target_sources_keyed_by_file_path(tmp_path, monkeypatch):
-        target = tmp_path / "eng_src.py"
-        source = "def add(a, b):\n    return a + b\n"
-        target.write_text(source)
-        test_dir = tmp_path / "eng_src_tests"
-        test_dir.mkdir()
-        (test_dir / "test_eng_src.py").write_text(
-            "from eng_src import add\n\n"
-            "def test_add():\n"
-            "    assert add(1, 2) == 3\n"
-        )
-        monkeypatch.chdir(tmp_path)
-        monkeypatch.syspath_prepend(str(tmp_path))
-
-        engine = Engine(use_types=False, use_coverage=False)
-        result = engine.run([str(target)], str(test_dir))
+    def it_populates_target_sources_keyed_by_file_path(fs):
+        engine = Engine(use_types=False, use_coverage=False, executor=run_tests_for_mutant_forked)
+        result = engine.run([str(fs.add)], str(fs.add_tests))
 
-        abs_target = os.path.abspath(str(target))
+        abs_target = os.path.abspath(str(fs.add))
         assert abs_target in result.target_sources
-        assert result.target_sources[abs_target] == source
+        assert result.target_sources[abs_target] == _ADD_SOURCE
 
 
 def _make_fake_runner(captured_test_ids: list) -> callable:
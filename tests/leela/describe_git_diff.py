@@ -2,6 +2,8 @@
 
 import os
 
+import pytest
+
 from pytest_leela.git_diff import _parse_diff_hunks
 
 
@@ -131,13 +133,12 @@ def describe_parse_diff_hunks():
 
 
 def describe_changed_files():
+    @pytest.mark.no_git
     def it_returns_list_type():
         """changed_files must return a list, not None."""
-        from unittest.mock import patch
         from pytest_leela.git_diff import changed_files
 
-        with patch("pytest_leela.git_diff.subprocess.run", side_effect=FileNotFoundError):
-            result = changed_files("main")
+        result = changed_files("main")
         assert isinstance(result, list)
         assert result == []
 
@@ -180,13 +181,12 @@ def describe_changed_files():
 
 
 def describe_changed_lines():
+    @pytest.mark.no_git
     def it_returns_dict_type():
         """changed_lines must return a dict, not None."""
-        from unittest.mock import patch
         from pytest_leela.git_diff import changed_lines
 
-        with patch("pytest_leela.git_diff.subprocess.run", side_effect=FileNotFoundError):
-            result = changed_lines("main")
+        result = changed_lines("main")
         assert isinstance(result, dict)
         assert result == {}
 
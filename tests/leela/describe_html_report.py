@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import json
 import os
+from pathlib import Path
+
+import pytest
 
 from pytest_leela.html_report import (
     _build_html_viewer,
     _build_report_data,
+    _dumps_json,
     _escape_json_for_html,
     _extract_test_sources,
     _format_test_name,
+    _now_iso,
     generate_html_report,
 )
 from pytest_leela.models import (
@@ -22,18 +29,22 @@ from pytest_leela.models import (
 )
 
 
+_FROZEN_NOW = "2024-01-01T00:00:00+00:00"
+
+_BASE_POINT = MutationPoint(
+    file_path="/src/app.py",
+    module_name="app",
+    lineno=10,
+    col_offset=4,
+    node_type="BinOp",
+    original_op="Add",
+    inferred_type=None,
+)
+
+
 def _make_point(**overrides) -> MutationPoint:
-    defaults = dict(
-        file_path="/src/app.py",
-        module_name="app",
-        lineno=10,
-        col_offset=4,
-        node_type="BinOp",
-        original_op="Add",
-        inferred_type=None,
-    )
-    defaults.update(overrides)
-    return MutationPoint(**defaults)
+    # MutationPoint is frozen, so the base instance can be shared as-is
+    return dataclasses.replace(_BASE_POINT, **overrides) if overrides else _BASE_POINT
 
 
 def _make_mutant_result(
@@ -54,6 +65,12 @@ def _make_mutant_result(
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _default_results() -> tuple[MutantResult, ...]:
+    """One killed and one survived mutant, built once and shared read-only."""
+    return (_make_mutant_result(True, 1), _make_mutant_result(False, 2))
+
+
 def _make_run_result(
     results: list[MutantResult] | None = None,
     coverage_map: CoverageMap | None = None,
@@ -65,7 +82,7 @@ def _make_run_result(
     wall_time_seconds: float = 1.5,
 ) -> RunResult:
     if results is None:
-        results = [_make_mutant_result(True, 1), _make_mutant_result(False, 2)]
+        results = list(_default_results())
     if target_files is None:
         target_files = ["/src/app.py"]
     if target_sources is None:
@@ -86,74 +103,66 @@ def _make_run_result(
     )
 
 
-def describe_format_test_name():
-    def it_strips_file_path_prefix():
-        result = _format_test_name("tests/test_views.py::TestHomeView::test_get")
-        assert "tests/test_views.py" not in result
-
-    def it_strips_test_and_describe_prefixes():
-        assert _format_test_name(
-            "tests/test_views.py::TestHomeView::test_get"
-        ) == "TestHomeView > get"
-        assert _format_test_name(
-            "tests/describe_foo.py::describe_bar::it_does_thing"
-        ) == "bar > does thing"
-
-    def it_replaces_underscores_with_spaces():
-        result = _format_test_name(
-            "tests/test_x.py::test_handles_multiple_args"
-        )
-        assert result == "handles multiple args"
+@pytest.fixture(scope="module")
+def baseline_run() -> RunResult:
+    """Default RunResult shared by tests that only read it."""
+    return _make_run_result()
 
-    def it_joins_parts_with_angle_bracket():
-        result = _format_test_name(
-            "tests/test_views.py::TestHomeView::test_get"
-        )
-        assert " > " in result
-        assert result == "TestHomeView > get"
 
-    def it_handles_parametrized_tests():
-        result = _format_test_name(
-            "tests/test_x.py::TestClass::test_method[param1]"
-        )
-        assert result == "TestClass > method[param1]"
-
-    def it_preserves_multiple_parametrize_brackets():
-        result = _format_test_name(
-            "tests/test_x.py::test_thing[a-b]"
-        )
-        assert result == "thing[a-b]"
-
-    def it_returns_simple_name_for_single_test():
-        result = _format_test_name("tests/test_x.py::test_simple")
-        assert result == "simple"
-
-    def it_returns_raw_id_for_simple_input():
-        result = _format_test_name("bare_name")
-        assert result == "bare_name"
-
-    def it_handles_empty_after_stripping():
-        # Edge case: "tests/test_x.py::test_" -> prefix is "test_", rest is ""
-        result = _format_test_name("tests/test_x.py::test_")
-        # After stripping "test_" prefix, nothing remains
-        assert result == "tests/test_x.py::test_"
-
-    def it_handles_deeply_nested_describe_blocks():
-        result = _format_test_name(
-            "tests/describe_auth.py::describe_login::describe_with_valid_creds::it_returns_200"
-        )
-        assert result == "login > with valid creds > returns 200"
-
-    def it_strips_context_prefix():
-        result = _format_test_name("tests/describe_auth.py::describe_login::context_with_valid_creds::it_returns_200")
-        assert result == "login > with valid creds > returns 200"
+def describe_format_test_name():
+    @pytest.mark.parametrize(
+        ("node_id", "expected"),
+        [
+            # Drops the file path, strips test_ prefixes, joins with " > "
+            ("tests/test_views.py::TestHomeView::test_get", "TestHomeView > get"),
+            ("tests/describe_foo.py::describe_bar::it_does_thing", "bar > does thing"),
+            ("tests/test_x.py::test_handles_multiple_args", "handles multiple args"),
+            ("tests/test_x.py::TestClass::test_method[param1]", "TestClass > method[param1]"),
+            ("tests/test_x.py::test_thing[a-b]", "thing[a-b]"),
+            ("tests/test_x.py::test_simple", "simple"),
+            ("bare_name", "bare_name"),
+            # Nothing remains after stripping "test_", so the raw ID is returned
+            ("tests/test_x.py::test_", "tests/test_x.py::test_"),
+            (
+                "tests/describe_auth.py::describe_login::describe_with_valid_creds::it_returns_200",
+                "login > with valid creds > returns 200",
+            ),
+            (
+                "tests/describe_auth.py::describe_login::context_with_valid_creds::it_returns_200",
+                "login > with valid creds > returns 200",
+            ),
+            ("tests/test.py::it_does_thing", "does thing"),
+        ],
+        ids=[
+            "class_method",
+            "describe_it",
+            "underscores_to_spaces",
+            "parametrized",
+            "multiple_params",
+            "single_test",
+            "bare_name",
+            "empty_after_stripping",
+            "nested_describe",
+            "context_prefix",
+            "top_level_it",
+        ],
+    )
+    def it_formats(node_id, expected):
+        assert _format_test_name(node_id) == expected
 
-    def it_strips_it_prefix_from_top_level_test():
-        result = _format_test_name("tests/test.py::it_does_thing")
-        assert result == "does thing"
+    def it_memoizes_repeated_node_ids():
+        node_id = "tests/test_cache.py::describe_cache::it_is_hit"
+        first = _format_test_name(node_id)
+        hits_before = _format_test_name.cache_info().hits
+        assert _format_test_name(node_id) == first
+        assert _format_test_name.cache_info().hits == hits_before + 1
 
 
 def describe_build_report_data():
+    @pytest.fixture(autouse=True)
+    def _freeze_time(monkeypatch):
+        monkeypatch.setattr("pytest_leela.html_report._now_iso", lambda: _FROZEN_NOW)
+
     def it_includes_summary_fields():
         run = _make_run_result(mutants_pruned=3, total_mutants=5)
         data = _build_report_data(run)
@@ -174,7 +183,7 @@ def describe_build_report_data():
         run = _make_run_result(target_sources={"/src/app.py": source})
         data = _build_report_data(run)
 
-        file_data = list(data["files"].values())[0]
+        file_data = next(iter(data["files"].values()))
         assert file_data["source"] == source
 
     def it_serializes_coverage_map_to_per_line_structure():
@@ -186,7 +195,7 @@ def describe_build_report_data():
         run = _make_run_result(coverage_map=cov)
         data = _build_report_data(run)
 
-        file_data = list(data["files"].values())[0]
+        file_data = next(iter(data["files"].values()))
         lines = file_data["lines"]
         assert "10" in lines
         assert "11" in lines
@@ -199,13 +208,34 @@ def describe_build_report_data():
             {"display": "add", "id": "tests/test_app.py::test_add"},
         ]
 
+    def it_splits_coverage_between_files_and_ignores_non_targets():
+        cov = CoverageMap()
+        cov.add("/src/a.py", 1, "tests/test_a.py::test_a")
+        cov.add("/src/b.py", 2, "tests/test_b.py::test_b")
+        cov.add("/src/other.py", 3, "tests/test_o.py::test_o")
+
+        run = _make_run_result(
+            results=[],
+            coverage_map=cov,
+            target_files=["/src/a.py", "/src/b.py"],
+            target_sources={"/src/a.py": "# a\n", "/src/b.py": "# b\n"},
+        )
+        data = _build_report_data(run)
+
+        assert data["files"]["a.py"]["lines"] == {
+            "1": {"coverage": [{"display": "a", "id": "tests/test_a.py::test_a"}]},
+        }
+        assert data["files"]["b.py"]["lines"] == {
+            "2": {"coverage": [{"display": "b", "id": "tests/test_b.py::test_b"}]},
+        }
+
     def it_includes_all_mutants_not_just_survivors():
         killed = _make_mutant_result(True, mutant_id=1)
         survived = _make_mutant_result(False, mutant_id=2)
         run = _make_run_result(results=[killed, survived])
         data = _build_report_data(run)
 
-        file_data = list(data["files"].values())[0]
+        file_data = next(iter(data["files"].values()))
         assert len(file_data["mutants"]) == 2
         assert file_data["mutants"][0]["killed"] is True
         assert file_data["mutants"][1]["killed"] is False
@@ -227,14 +257,14 @@ def describe_build_report_data():
         run = _make_run_result(coverage_map=None)
         data = _build_report_data(run)
 
-        file_data = list(data["files"].values())[0]
+        file_data = next(iter(data["files"].values()))
         assert file_data["lines"] == {}
 
-    def it_uses_op_display_for_descriptions():
-        run = _make_run_result()
+    def it_uses_op_display_for_descriptions(baseline_run):
+        run = baseline_run
         data = _build_report_data(run)
 
-        file_data = list(data["files"].values())[0]
+        file_data = next(iter(data["files"].values()))
         mutant = file_data["mutants"][0]
         # Add -> Sub should show "+ → -" via _op_display
         assert mutant["description"] == "+ \u2192 -"
@@ -246,7 +276,7 @@ def describe_build_report_data():
         run = _make_run_result(results=[mr])
         data = _build_report_data(run)
 
-        mutant_data = list(data["files"].values())[0]["mutants"][0]
+        mutant_data = next(iter(data["files"].values()))["mutants"][0]
         # Test names include display and original ID
         assert mutant_data["test_ids_run"] == [
             {"display": "add", "id": "tests/test_app.py::test_add"},
@@ -259,6 +289,22 @@ def describe_build_report_data():
             "display": "add", "id": "tests/test_app.py::test_add",
         }
 
+    def it_formats_killing_test_missing_from_other_lists():
+        mr = MutantResult(
+            mutant=Mutant(point=_make_point(), replacement_op="Sub", mutant_id=1),
+            killed=True,
+            tests_run=0,
+            killing_test="tests/test_app.py::test_only_here",
+            time_seconds=0.01,
+        )
+        data = _build_report_data(_make_run_result(results=[mr]))
+
+        mutant_data = next(iter(data["files"].values()))["mutants"][0]
+        assert mutant_data["killing_test"] == {
+            "display": "only here", "id": "tests/test_app.py::test_only_here",
+        }
+        assert mutant_data["killing_tests"] == []
+
     def it_handles_empty_results():
         run = _make_run_result(
             results=[],
@@ -274,7 +320,7 @@ def describe_build_report_data():
         assert data["summary"]["survived"] == 0
         assert data["summary"]["mutation_score"] == 0.0
         assert data["survived_index"] == []
-        file_data = list(data["files"].values())[0]
+        file_data = next(iter(data["files"].values()))
         assert file_data["mutants"] == []
         assert file_data["stats"]["total"] == 0
 
@@ -315,19 +361,21 @@ def describe_build_report_data():
         run = _make_run_result(results=[killed, survived])
         data = _build_report_data(run)
 
-        file_data = list(data["files"].values())[0]
+        file_data = next(iter(data["files"].values()))
         stats = file_data["stats"]
         assert stats["total"] == 2
         assert stats["killed"] == 1
         assert stats["survived"] == 1
         assert stats["score"] == 50.0
 
-    def it_has_iso_format_generated_at():
-        run = _make_run_result()
-        data = _build_report_data(run)
+    def it_stamps_generated_at_from_now_iso(baseline_run):
+        data = _build_report_data(baseline_run)
+
+        assert data["generated_at"] == _FROZEN_NOW
 
+    def it_has_iso_format_generated_at():
         # Should be parseable as ISO format and contain timezone info
-        generated_at = data["generated_at"]
+        generated_at = _now_iso()
         assert "T" in generated_at
         assert "+" in generated_at or "Z" in generated_at
 
@@ -336,7 +384,7 @@ def describe_build_report_data():
         run = _make_run_result(results=[mr])
         data = _build_report_data(run)
 
-        mutant_data = list(data["files"].values())[0]["mutants"][0]
+        mutant_data = next(iter(data["files"].values()))["mutants"][0]
         assert mutant_data["col_offset"] == 8
         assert mutant_data["node_type"] == "Compare"
 
@@ -346,7 +394,7 @@ def describe_build_report_data():
         run = _make_run_result(results=[mr1, mr2])
         data = _build_report_data(run)
 
-        mutants = list(data["files"].values())[0]["mutants"]
+        mutants = next(iter(data["files"].values()))["mutants"]
         # id should be index in results list, not mutant_id
         assert mutants[0]["id"] == 0
         assert mutants[1]["id"] == 1
@@ -371,6 +419,48 @@ def describe_build_report_data():
         assert si[0]["file"] == "a.py"
         assert si[1]["file"] == "b.py"
 
+    def it_strips_root_as_common_prefix():
+        results = [
+            _make_mutant_result(True, mutant_id=1, file_path="/app.py"),
+            _make_mutant_result(False, mutant_id=2, file_path="/pkg/views.py"),
+        ]
+        run = _make_run_result(
+            results=results,
+            target_files=["/app.py", "/pkg/views.py"],
+            target_sources={"/app.py": "# app\n", "/pkg/views.py": "# views\n"},
+        )
+        data = _build_report_data(run)
+
+        assert set(data["files"]) == {"app.py", "pkg/views.py"}
+
+    def it_relativizes_unnormalized_target_paths():
+        results = [
+            _make_mutant_result(True, mutant_id=1, file_path="./src/a.py"),
+            _make_mutant_result(False, mutant_id=2, file_path="./src/b.py"),
+        ]
+        run = _make_run_result(
+            results=results,
+            target_files=["./src/a.py", "./src/b.py"],
+            target_sources={"./src/a.py": "# a\n", "./src/b.py": "# b\n"},
+        )
+        data = _build_report_data(run)
+
+        assert set(data["files"]) == {"a.py", "b.py"}
+
+    def it_keeps_paths_unchanged_when_absolute_and_relative_are_mixed():
+        results = [
+            _make_mutant_result(True, mutant_id=1, file_path="/src/app.py"),
+            _make_mutant_result(False, mutant_id=2, file_path="views.py"),
+        ]
+        run = _make_run_result(
+            results=results,
+            target_files=["/src/app.py", "views.py"],
+            target_sources={"/src/app.py": "# app\n", "views.py": "# views\n"},
+        )
+        data = _build_report_data(run)
+
+        assert set(data["files"]) == {"/src/app.py", "views.py"}
+
     def it_handles_empty_target_files():
         result = RunResult(
             target_files=[],
@@ -676,54 +766,74 @@ def describe_extract_test_sources():
         assert "assert True" in sources[node_id]
 
 
+def describe_dumps_json():
+    def it_round_trips_through_json_parser():
+        data = {"key": "value", "nested": {"n": [1, 2.5, None, True]}}
+        assert json.loads(_dumps_json(data)) == data
+
+    def it_falls_back_to_stdlib_json_without_orjson(monkeypatch):
+        monkeypatch.setattr("pytest_leela.html_report.orjson", None)
+        data = {"key": "caf\u00e9", "n": [1, 2]}
+        assert _dumps_json(data) == json.dumps(data).encode("utf-8")
+
+    def it_uses_orjson_when_available():
+        orjson = pytest.importorskip("orjson")
+        data = {"key": "caf\u00e9", "n": [1, 2]}
+        assert _dumps_json(data) == orjson.dumps(data)
+
+
 def describe_escape_json_for_html():
     def it_replaces_closing_script_tag():
-        assert _escape_json_for_html("</script>") == "<\\/script>"
+        assert _escape_json_for_html(b"</script>") == b"<\\/script>"
 
     def it_leaves_safe_json_unchanged():
-        assert _escape_json_for_html('{"key": "value"}') == '{"key": "value"}'
+        assert _escape_json_for_html(b'{"key": "value"}') == b'{"key": "value"}'
+
+    def it_returns_safe_payload_without_copying():
+        payload = b'{"source": "a < b / c"}'
+        assert _escape_json_for_html(payload) is payload
 
     def it_handles_multiple_occurrences():
-        result = _escape_json_for_html("</a></b></c>")
-        assert result == "<\\/a><\\/b><\\/c>"
+        result = _escape_json_for_html(b"</a></b></c>")
+        assert result == b"<\\/a><\\/b><\\/c>"
 
     def it_handles_empty_string():
-        assert _escape_json_for_html("") == ""
+        assert _escape_json_for_html(b"") == b""
 
     def it_round_trips_through_json_parser():
         """Escaped string is still valid JSON per RFC 8259."""
         original = {"key": "</script>", "nested": "</style>"}
-        json_str = json.dumps(original)
-        escaped = _escape_json_for_html(json_str)
+        json_bytes = json.dumps(original).encode("utf-8")
+        escaped = _escape_json_for_html(json_bytes)
         assert json.loads(escaped) == original
 
 
 def describe_build_html_viewer():
     def it_returns_valid_html():
-        html = _build_html_viewer("{}")
+        html = _build_html_viewer(b"{}").decode("utf-8")
         assert html.startswith("<!DOCTYPE html>")
         assert "</html>" in html
 
     def it_embeds_json_data_inline():
-        html = _build_html_viewer('{"test": true}')
+        html = _build_html_viewer(b'{"test": true}').decode("utf-8")
         assert 'window.LEELA_DATA = {"test": true}' in html
 
     def it_references_window_leela_data():
-        html = _build_html_viewer("{}")
+        html = _build_html_viewer(b"{}").decode("utf-8")
         assert "window.LEELA_DATA" in html
 
     def it_includes_title():
-        html = _build_html_viewer("{}")
+        html = _build_html_viewer(b"{}").decode("utf-8")
         assert "<title>Leela Mutation Report</title>" in html
 
     def it_wraps_data_in_script_tags():
-        html = _build_html_viewer('{}')
+        html = _build_html_viewer(b"{}").decode("utf-8")
         # Verify script tag opens before data and closes after the IIFE
         assert '<script>\nwindow.LEELA_DATA' in html
         assert '</script>\n</body>' in html
 
     def it_contains_required_dom_structure():
-        html = _build_html_viewer("{}")
+        html = _build_html_viewer(b"{}").decode("utf-8")
         assert 'id="sidebar"' in html
         assert 'id="source-panel"' in html
         assert 'id="detail-panel"' in html
@@ -733,12 +843,12 @@ def describe_build_html_viewer():
         assert 'id="overlay"' in html
 
     def it_renders_test_names_as_clickable_links():
-        html = _build_html_viewer("{}")
+        html = _build_html_viewer(b"{}").decode("utf-8")
         assert 'class="test-link"' in html
         assert "data-test-id" in html
 
     def it_includes_test_overlay_markup():
-        html = _build_html_viewer("{}")
+        html = _build_html_viewer(b"{}").decode("utf-8")
         assert 'id="test-overlay"' in html
         assert 'id="test-overlay-box"' in html
         assert 'id="test-overlay-close"' in html
@@ -774,26 +884,22 @@ def describe_build_html_viewer():
 
 def _extract_json_from_html(html_content: str) -> dict:
     """Extract the LEELA_DATA JSON from an inline HTML report."""
-    start_marker = "window.LEELA_DATA = "
-    start = html_content.index(start_marker) + len(start_marker)
-    # Find the end: look for the semicolon before (function()
-    end_marker = ";\n(function()"
-    end = html_content.index(end_marker, start)
-    json_str = html_content[start:end]
+    _, _, rest = html_content.partition("window.LEELA_DATA = ")
+    # The data ends at the semicolon before (function()
+    json_str, _, _ = rest.partition(";\n(function()")
     # Unescape the HTML-safe escaping
-    json_str = json_str.replace("<\\/", "</")
-    return json.loads(json_str)
+    return json.loads(json_str.replace("<\\/", "</"))
 
 
 def describe_generate_html_report():
-    def it_creates_html_file_at_given_path(tmp_path):
-        run = _make_run_result()
+    def it_creates_html_file_at_given_path(tmp_path, baseline_run):
+        run = baseline_run
         output = str(tmp_path / "report.html")
         generate_html_report(run, output)
         assert os.path.exists(output)
 
-    def it_embeds_valid_json_in_single_file(tmp_path):
-        run = _make_run_result()
+    def it_embeds_valid_json_in_single_file(tmp_path, baseline_run):
+        run = baseline_run
         output = str(tmp_path / "report.html")
         generate_html_report(run, output)
 
@@ -812,7 +918,7 @@ def describe_generate_html_report():
         with open(output) as f:
             html = f.read()
         data = _extract_json_from_html(html)
-        file_data = list(data["files"].values())[0]
+        file_data = next(iter(data["files"].values()))
         assert file_data["lines"] == {}
 
     def it_preserves_all_mutant_data_through_round_trip(tmp_path):
@@ -827,7 +933,7 @@ def describe_generate_html_report():
             html = f.read()
         data = _extract_json_from_html(html)
 
-        file_data = list(data["files"].values())[0]
+        file_data = next(iter(data["files"].values()))
         assert len(file_data["mutants"]) == 2
         assert file_data["mutants"][0]["killed"] is True
         assert file_data["mutants"][1]["killed"] is False
@@ -835,8 +941,8 @@ def describe_generate_html_report():
         assert file_data["stats"]["survived"] == 1
         assert len(data["survived_index"]) == 1
 
-    def it_produces_single_file_with_no_external_dependencies(tmp_path):
-        run = _make_run_result()
+    def it_produces_single_file_with_no_external_dependencies(tmp_path, baseline_run):
+        run = baseline_run
         output = str(tmp_path / "report.html")
         generate_html_report(run, output)
 
@@ -854,21 +960,31 @@ def describe_generate_html_report():
         output = str(tmp_path / "report.html")
         generate_html_report(run, output)
 
-        with open(output) as f:
-            html = f.read()
+        html_bytes = Path(output).read_bytes()
 
         # The data portion (before the IIFE) must not contain a raw </script>
-        data_end = html.index(";\n(function()")
-        data_portion = html[:data_end]
-        assert "</script>" not in data_portion
+        data_end = html_bytes.index(b";\n(function()")
+        assert html_bytes.find(b"</script>", 0, data_end) == -1
 
         # But the JSON should still be extractable and correct
+        data = _extract_json_from_html(html_bytes.decode("utf-8"))
+        file_data = next(iter(data["files"].values()))
+        assert file_data["source"] == source
+
+    def it_writes_non_ascii_source_as_utf8(tmp_path):
+        source = 'greeting = "h\u00e9llo \u2603"\n'
+        run = _make_run_result(target_sources={"/src/app.py": source})
+        output = str(tmp_path / "report.html")
+        generate_html_report(run, output)
+
+        with open(output, encoding="utf-8") as f:
+            html = f.read()
         data = _extract_json_from_html(html)
-        file_data = list(data["files"].values())[0]
+        file_data = next(iter(data["files"].values()))
         assert file_data["source"] == source
 
-    def it_does_not_create_data_js_file(tmp_path):
-        run = _make_run_result()
+    def it_does_not_create_data_js_file(tmp_path, baseline_run):
+        run = baseline_run
         output = str(tmp_path / "report.html")
         generate_html_report(run, output)
 
@@ -1,17 +1,40 @@
 """Tests for pytest_leela.import_hook — AST mutation application and hook lifecycle."""
 
 import ast
+import functools
+import importlib
 import sys
 
+import pytest
+
 from pytest_leela.import_hook import (
     MutantApplier,
     apply_mutation,
+    clear_target_modules,
     install_hook,
     remove_hook,
 )
 from pytest_leela.models import Mutant, MutationPoint
 
 
+@functools.lru_cache(maxsize=None)
+def _parse(source: str, mode: str = "exec") -> ast.AST:
+    """Parse once per source; a shared read-only reference, never visited."""
+    return ast.parse(source, mode=mode)
+
+
+def _binop(op_class: type[ast.operator] = ast.Add) -> ast.Expression:
+    """Build an ``x <op> y`` expression at line 1, col 0 without the parser."""
+    node = ast.BinOp(
+        left=ast.Name(id="x", ctx=ast.Load(), lineno=1, col_offset=0),
+        op=op_class(),
+        right=ast.Name(id="y", ctx=ast.Load(), lineno=1, col_offset=4),
+        lineno=1,
+        col_offset=0,
+    )
+    return ast.Expression(body=node)
+
+
 def _make_point(
     lineno: int = 1,
     col_offset: int = 0,
@@ -42,8 +65,7 @@ def _make_mutant(
 
 def describe_MutantApplier():
     def it_applies_binop_mutation():
-        source = "x + y"
-        tree = ast.parse(source, mode="eval")
+        tree = _binop(ast.Add)
         # The BinOp is at line 1, col 0
         mutant = _make_mutant(
             lineno=1, col_offset=0,
@@ -51,10 +73,9 @@ def describe_MutantApplier():
         )
         applier = MutantApplier(mutant)
         new_tree = applier.visit(tree)
-        ast.fix_missing_locations(new_tree)
         assert applier.applied is True
         # Verify the operator changed to Sub
-        assert isinstance(new_tree.body.op, ast.Sub)
+        assert type(new_tree.body.op) is ast.Sub
 
     def it_applies_compare_mutation():
         source = "x > y"
@@ -65,9 +86,8 @@ def describe_MutantApplier():
         )
         applier = MutantApplier(mutant)
         new_tree = applier.visit(tree)
-        ast.fix_missing_locations(new_tree)
         assert applier.applied is True
-        assert isinstance(new_tree.body.ops[0], ast.LtE)
+        assert type(new_tree.body.ops[0]) is ast.LtE
 
     def it_applies_boolop_mutation():
         source = "a and b"
@@ -78,9 +98,8 @@ def describe_MutantApplier():
         )
         applier = MutantApplier(mutant)
         new_tree = applier.visit(tree)
-        ast.fix_missing_locations(new_tree)
         assert applier.applied is True
-        assert isinstance(new_tree.body.op, ast.Or)
+        assert type(new_tree.body.op) is ast.Or
 
     def it_applies_return_mutation():
         source = "def f():\n    return True\n"
@@ -92,116 +111,35 @@ def describe_MutantApplier():
         )
         applier = MutantApplier(mutant)
         new_tree = applier.visit(tree)
-        ast.fix_missing_locations(new_tree)
         assert applier.applied is True
         ret_node = new_tree.body[0].body[0]  # FunctionDef -> body[0] = Return
-        assert isinstance(ret_node.value, ast.Constant)
+        assert type(ret_node.value) is ast.Constant
         assert ret_node.value.value is False
 
     def describe_bitwise_operators():
-        def it_applies_bitand_to_bitor():
-            source = "x & y"
-            tree = ast.parse(source, mode="eval")
-            mutant = _make_mutant(
-                lineno=1, col_offset=0,
-                node_type="BinOp", original_op="BitAnd", replacement_op="BitOr",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
-            assert applier.applied is True
-            assert isinstance(new_tree.body.op, ast.BitOr)
-
-        def it_applies_bitand_to_bitxor():
-            source = "x & y"
-            tree = ast.parse(source, mode="eval")
-            mutant = _make_mutant(
-                lineno=1, col_offset=0,
-                node_type="BinOp", original_op="BitAnd", replacement_op="BitXor",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
-            assert applier.applied is True
-            assert isinstance(new_tree.body.op, ast.BitXor)
-
-        def it_applies_bitor_to_bitand():
-            source = "x | y"
-            tree = ast.parse(source, mode="eval")
-            mutant = _make_mutant(
-                lineno=1, col_offset=0,
-                node_type="BinOp", original_op="BitOr", replacement_op="BitAnd",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
-            assert applier.applied is True
-            assert isinstance(new_tree.body.op, ast.BitAnd)
-
-        def it_applies_bitor_to_bitxor():
-            source = "x | y"
-            tree = ast.parse(source, mode="eval")
-            mutant = _make_mutant(
-                lineno=1, col_offset=0,
-                node_type="BinOp", original_op="BitOr", replacement_op="BitXor",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
-            assert applier.applied is True
-            assert isinstance(new_tree.body.op, ast.BitXor)
-
-        def it_applies_bitxor_to_bitand():
-            source = "x ^ y"
-            tree = ast.parse(source, mode="eval")
-            mutant = _make_mutant(
-                lineno=1, col_offset=0,
-                node_type="BinOp", original_op="BitXor", replacement_op="BitAnd",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
-            assert applier.applied is True
-            assert isinstance(new_tree.body.op, ast.BitAnd)
-
-        def it_applies_bitxor_to_bitor():
-            source = "x ^ y"
-            tree = ast.parse(source, mode="eval")
-            mutant = _make_mutant(
-                lineno=1, col_offset=0,
-                node_type="BinOp", original_op="BitXor", replacement_op="BitOr",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
-            assert applier.applied is True
-            assert isinstance(new_tree.body.op, ast.BitOr)
-
-        def it_applies_lshift_to_rshift():
-            source = "x << y"
-            tree = ast.parse(source, mode="eval")
-            mutant = _make_mutant(
-                lineno=1, col_offset=0,
-                node_type="BinOp", original_op="LShift", replacement_op="RShift",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
-            assert applier.applied is True
-            assert isinstance(new_tree.body.op, ast.RShift)
-
-        def it_applies_rshift_to_lshift():
-            source = "x >> y"
-            tree = ast.parse(source, mode="eval")
+        @pytest.mark.parametrize(
+            "original,replacement,expected",
+            [
+                (ast.BitAnd, "BitOr", ast.BitOr),
+                (ast.BitAnd, "BitXor", ast.BitXor),
+                (ast.BitOr, "BitAnd", ast.BitAnd),
+                (ast.BitOr, "BitXor", ast.BitXor),
+                (ast.BitXor, "BitAnd", ast.BitAnd),
+                (ast.BitXor, "BitOr", ast.BitOr),
+                (ast.LShift, "RShift", ast.RShift),
+                (ast.RShift, "LShift", ast.LShift),
+            ],
+        )
+        def it_applies_bitwise(original, replacement, expected):
+            tree = _binop(original)
             mutant = _make_mutant(
                 lineno=1, col_offset=0,
-                node_type="BinOp", original_op="RShift", replacement_op="LShift",
+                node_type="BinOp", original_op=original.__name__, replacement_op=replacement,
             )
             applier = MutantApplier(mutant)
             new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
             assert applier.applied is True
-            assert isinstance(new_tree.body.op, ast.LShift)
+            assert type(new_tree.body.op) is expected
 
     def describe_augmented_assignment():
         def it_applies_augassign_add_to_sub():
@@ -213,9 +151,8 @@ def describe_MutantApplier():
             )
             applier = MutantApplier(mutant)
             new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
             assert applier.applied is True
-            assert isinstance(new_tree.body[0].op, ast.Sub)
+            assert type(new_tree.body[0].op) is ast.Sub
 
         def it_applies_augassign_sub_to_add():
             source = "x -= y\n"
@@ -226,9 +163,8 @@ def describe_MutantApplier():
             )
             applier = MutantApplier(mutant)
             new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
             assert applier.applied is True
-            assert isinstance(new_tree.body[0].op, ast.Add)
+            assert type(new_tree.body[0].op) is ast.Add
 
         def it_applies_augassign_mult_to_floordiv():
             source = "x *= y\n"
@@ -239,9 +175,8 @@ def describe_MutantApplier():
             )
             applier = MutantApplier(mutant)
             new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
             assert applier.applied is True
-            assert isinstance(new_tree.body[0].op, ast.FloorDiv)
+            assert type(new_tree.body[0].op) is ast.FloorDiv
 
         def it_applies_augassign_bitand_to_bitor():
             source = "x &= y\n"
@@ -252,9 +187,8 @@ def describe_MutantApplier():
             )
             applier = MutantApplier(mutant)
             new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
             assert applier.applied is True
-            assert isinstance(new_tree.body[0].op, ast.BitOr)
+            assert type(new_tree.body[0].op) is ast.BitOr
 
         def it_applies_augassign_lshift_to_rshift():
             source = "x <<= y\n"
@@ -265,33 +199,8 @@ def describe_MutantApplier():
             )
             applier = MutantApplier(mutant)
             new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
             assert applier.applied is True
-            assert isinstance(new_tree.body[0].op, ast.RShift)
-
-        def it_does_not_apply_augassign_mutant_to_binop():
-            source = "x + y"
-            tree = ast.parse(source, mode="eval")
-            mutant = _make_mutant(
-                lineno=1, col_offset=0,
-                node_type="AugAssign", original_op="Add", replacement_op="Sub",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            assert applier.applied is False
-            assert isinstance(new_tree.body.op, ast.Add)
-
-        def it_does_not_apply_binop_mutant_to_augassign():
-            source = "x += y\n"
-            tree = ast.parse(source)
-            mutant = _make_mutant(
-                lineno=1, col_offset=0,
-                node_type="BinOp", original_op="Add", replacement_op="Sub",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            assert applier.applied is False
-            assert isinstance(new_tree.body[0].op, ast.Add)
+            assert type(new_tree.body[0].op) is ast.RShift
 
     def describe_ifexp():
         def it_swaps_branches():
@@ -303,10 +212,9 @@ def describe_MutantApplier():
             )
             applier = MutantApplier(mutant)
             new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
             assert applier.applied is True
             # After swap: body should be y (was x), orelse should be x (was y)
-            assert isinstance(new_tree.body, ast.IfExp)
+            assert type(new_tree.body) is ast.IfExp
             assert new_tree.body.body.id == "y"
             assert new_tree.body.orelse.id == "x"
 
@@ -319,10 +227,9 @@ def describe_MutantApplier():
             )
             applier = MutantApplier(mutant)
             new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
             assert applier.applied is True
             # Entire IfExp replaced with just the body (x)
-            assert isinstance(new_tree.body, ast.Name)
+            assert type(new_tree.body) is ast.Name
             assert new_tree.body.id == "x"
 
         def it_replaces_with_always_false_branch():
@@ -334,53 +241,11 @@ def describe_MutantApplier():
             )
             applier = MutantApplier(mutant)
             new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
             assert applier.applied is True
             # Entire IfExp replaced with just the orelse (y)
-            assert isinstance(new_tree.body, ast.Name)
+            assert type(new_tree.body) is ast.Name
             assert new_tree.body.id == "y"
 
-        def it_does_not_apply_ifexp_mutant_to_binop():
-            source = "x + y"
-            tree = ast.parse(source, mode="eval")
-            mutant = _make_mutant(
-                lineno=1, col_offset=0,
-                node_type="IfExp", original_op="ternary", replacement_op="swap_branches",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            assert applier.applied is False
-
-        def it_does_not_apply_binop_mutant_to_ifexp():
-            source = "x if cond else y"
-            tree = ast.parse(source, mode="eval")
-            mutant = _make_mutant(
-                lineno=1, col_offset=0,
-                node_type="BinOp", original_op="Add", replacement_op="Sub",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            assert applier.applied is False
-            assert isinstance(new_tree.body, ast.IfExp)
-
-        def it_does_not_apply_non_ifexp_mutant_to_ifexp_with_valid_replacement():
-            """Kills and→or on visit_IfExp guard: _matches True but wrong node_type."""
-            source = "x if cond else y"
-            tree = ast.parse(source, mode="eval")
-            # Position matches the IfExp, but node_type says BoolOp
-            # replacement_op swap_branches would apply if guard fails
-            mutant = _make_mutant(
-                lineno=1, col_offset=0,
-                node_type="BoolOp", original_op="And", replacement_op="swap_branches",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            assert applier.applied is False
-            # IfExp branches must NOT be swapped
-            assert isinstance(new_tree.body, ast.IfExp)
-            assert new_tree.body.body.id == "x"
-            assert new_tree.body.orelse.id == "y"
-
     def describe_break_continue():
         def it_replaces_break_with_continue():
             source = "for i in range(10):\n    break\n"
@@ -391,9 +256,8 @@ def describe_MutantApplier():
             )
             applier = MutantApplier(mutant)
             new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
             assert applier.applied is True
-            assert isinstance(new_tree.body[0].body[0], ast.Continue)
+            assert type(new_tree.body[0].body[0]) is ast.Continue
 
         def it_replaces_continue_with_break():
             source = "for i in range(10):\n    continue\n"
@@ -404,59 +268,8 @@ def describe_MutantApplier():
             )
             applier = MutantApplier(mutant)
             new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
             assert applier.applied is True
-            assert isinstance(new_tree.body[0].body[0], ast.Break)
-
-        def it_does_not_apply_break_mutant_to_continue():
-            source = "for i in range(10):\n    continue\n"
-            tree = ast.parse(source)
-            mutant = _make_mutant(
-                lineno=2, col_offset=4,
-                node_type="Break", original_op="break", replacement_op="continue",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            assert applier.applied is False
-            assert isinstance(new_tree.body[0].body[0], ast.Continue)
-
-        def it_does_not_apply_continue_mutant_to_break():
-            source = "for i in range(10):\n    break\n"
-            tree = ast.parse(source)
-            mutant = _make_mutant(
-                lineno=2, col_offset=4,
-                node_type="Continue", original_op="continue", replacement_op="break",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            assert applier.applied is False
-            assert isinstance(new_tree.body[0].body[0], ast.Break)
-
-        def it_does_not_apply_non_break_mutant_to_break_node():
-            """Kills and→or on visit_Break guard: _matches True but wrong node_type."""
-            source = "for i in range(10):\n    break\n"
-            tree = ast.parse(source)
-            mutant = _make_mutant(
-                lineno=2, col_offset=4,
-                node_type="BinOp", original_op="Add", replacement_op="continue",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            assert applier.applied is False
-            assert isinstance(new_tree.body[0].body[0], ast.Break)
-
-        def it_does_not_apply_non_continue_mutant_to_continue_node():
-            """Kills and→or on visit_Continue guard: _matches True but wrong node_type."""
-            source = "for i in range(10):\n    continue\n"
-            tree = ast.parse(source)
-            mutant = _make_mutant(
-                lineno=2, col_offset=4,
-                node_type="BinOp", original_op="Add", replacement_op="break",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            assert applier.applied is False
-            assert isinstance(new_tree.body[0].body[0], ast.Continue)
+            assert type(new_tree.body[0].body[0]) is ast.Break
 
     def describe_except_handler():
         def it_broadens_typed_except_to_exception():
@@ -474,10 +287,9 @@ def describe_MutantApplier():
             )
             applier = MutantApplier(mutant)
             new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
             assert applier.applied is True
             handler = new_tree.body[0].handlers[0]
-            assert isinstance(handler.type, ast.Name)
+            assert type(handler.type) is ast.Name
             assert handler.type.id == "Exception"
 
         def it_replaces_body_with_raise():
@@ -494,11 +306,10 @@ def describe_MutantApplier():
             )
             applier = MutantApplier(mutant)
             new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
             assert applier.applied is True
             handler = new_tree.body[0].handlers[0]
             assert len(handler.body) == 1
-            assert isinstance(handler.body[0], ast.Raise)
+            assert type(handler.body[0]) is ast.Raise
 
         def it_replaces_bare_except_body_with_raise():
             source = (
@@ -514,11 +325,10 @@ def describe_MutantApplier():
             )
             applier = MutantApplier(mutant)
             new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
             assert applier.applied is True
             handler = new_tree.body[0].handlers[0]
             assert len(handler.body) == 1
-            assert isinstance(handler.body[0], ast.Raise)
+            assert type(handler.body[0]) is ast.Raise
 
         def it_does_not_broaden_bare_except():
             """Bare except has no type to broaden — broaden should not apply."""
@@ -537,41 +347,6 @@ def describe_MutantApplier():
             new_tree = applier.visit(tree)
             assert applier.applied is False
 
-        def it_does_not_apply_except_mutant_to_other_node():
-            """ExceptHandler mutant should not affect a BinOp."""
-            source = "x + y"
-            tree = ast.parse(source, mode="eval")
-            mutant = _make_mutant(
-                lineno=1, col_offset=0,
-                node_type="ExceptHandler", original_op="typed", replacement_op="broaden",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            assert applier.applied is False
-            assert isinstance(new_tree.body.op, ast.Add)
-
-        def it_does_not_apply_non_except_mutant_to_except_handler():
-            """Kills and→or on visit_ExceptHandler guard: _matches True but wrong node_type."""
-            source = (
-                "try:\n"
-                "    pass\n"
-                "except ValueError:\n"
-                "    pass\n"
-            )
-            tree = ast.parse(source)
-            # Position matches the ExceptHandler, but node_type says BinOp
-            mutant = _make_mutant(
-                lineno=3, col_offset=0,
-                node_type="BinOp", original_op="Add", replacement_op="broaden",
-            )
-            applier = MutantApplier(mutant)
-            new_tree = applier.visit(tree)
-            assert applier.applied is False
-            handler = new_tree.body[0].handlers[0]
-            # Handler type must remain ValueError, not broadened
-            assert isinstance(handler.type, ast.Name)
-            assert handler.type.id == "ValueError"
-
         def it_preserves_exception_name_binding():
             """Broadening should preserve 'as e' binding."""
             source = (
@@ -587,11 +362,10 @@ def describe_MutantApplier():
             )
             applier = MutantApplier(mutant)
             new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
             assert applier.applied is True
             handler = new_tree.body[0].handlers[0]
             assert handler.name == "e"
-            assert isinstance(handler.type, ast.Name)
+            assert type(handler.type) is ast.Name
             assert handler.type.id == "Exception"
 
         def it_copies_location_from_original_type_not_handler():
@@ -611,12 +385,110 @@ def describe_MutantApplier():
             )
             applier = MutantApplier(mutant)
             new_tree = applier.visit(tree)
-            ast.fix_missing_locations(new_tree)
             assert applier.applied is True
             new_handler = new_tree.body[0].handlers[0]
             # Exception name should have col_offset of original ValueError, not handler col 0
             assert new_handler.type.col_offset == original_type_col
 
+    def describe_visit_cache():
+        def it_caches_visitors_per_node_type():
+            tree = _binop(ast.Add)
+            applier = MutantApplier(_make_mutant())
+            applier.visit(tree)
+            assert MutantApplier._visit_cache[ast.BinOp] is MutantApplier.visit_BinOp
+            assert MutantApplier._visit_cache[ast.Name] is MutantApplier.generic_visit
+
+        def it_keeps_a_separate_cache_per_subclass():
+            class Counting(MutantApplier):
+                def visit_Name(self, node):
+                    self.names = getattr(self, "names", 0) + 1
+                    return node
+
+            applier = Counting(_make_mutant())
+            applier.visit(_binop(ast.Add))
+            assert applier.names == 2
+            assert Counting._visit_cache is not MutantApplier._visit_cache
+            assert MutantApplier._visit_cache.get(ast.Name) is not Counting.visit_Name
+
+    def describe_in_place_mutation():
+        def it_mutates_the_tree_in_place():
+            tree = ast.parse("a + b * c", mode="eval")
+            mutant = _make_mutant(lineno=1, col_offset=4, replacement_op="Div")
+            applier = MutantApplier(mutant)
+            new_tree = applier.visit(tree)
+            assert applier.applied is True
+            assert new_tree is tree
+            assert type(tree.body.op) is ast.Add
+            assert type(tree.body.right.op) is ast.Div
+
+        def it_swaps_replacement_nodes_into_the_parent():
+            tree = ast.parse("for i in x:\n    f(i)\n    break\n")
+            mutant = _make_mutant(
+                lineno=3, col_offset=4,
+                node_type="Break", original_op="break", replacement_op="continue",
+            )
+            applier = MutantApplier(mutant)
+            applier.visit(tree)
+            assert applier.applied is True
+            assert type(tree.body[0].body[1]) is ast.Continue
+
+        def it_replaces_single_child_fields():
+            tree = ast.parse("y = a if c else b\n")
+            mutant = _make_mutant(
+                lineno=1, col_offset=4,
+                node_type="IfExp", original_op="ternary", replacement_op="always_false",
+            )
+            applier = MutantApplier(mutant)
+            applier.visit(tree)
+            assert applier.applied is True
+            assert tree.body[0].value.id == "b"
+
+        def it_leaves_the_tree_alone_without_a_match():
+            tree = ast.parse("x > y", mode="eval")
+            applier = MutantApplier(_make_mutant(lineno=1, col_offset=0))
+            applier.visit(tree)
+            assert applier.applied is False
+            assert type(tree.body.ops[0]) is ast.Gt
+
+    def describe_pruning():
+        def it_skips_subtrees_outside_the_target_location():
+            class Recording(MutantApplier):
+                def visit_Name(self, node):
+                    self.seen = getattr(self, "seen", []) + [node.id]
+                    return node
+
+            tree = ast.parse("a = b\nc = d + e\nf = g\n")
+            applier = Recording(_make_mutant(lineno=2, col_offset=4))
+            applier.visit(tree)
+            assert applier.applied is True
+            assert applier.seen == ["c", "d"]
+
+        @pytest.mark.parametrize("node_type", ["BinOp", "Compare", "UnaryOp"])
+        def it_skips_the_walk_for_unknown_operator_replacements(node_type):
+            class Recording(MutantApplier):
+                def visit_Name(self, node):
+                    raise AssertionError("walked")
+
+            applier = Recording(_make_mutant(node_type=node_type, replacement_op="TotallyFake"))
+            applier.visit(_binop(ast.Add))
+            assert applier.applied is False
+
+        def it_still_reaches_decorators_above_the_def_line():
+            tree = ast.parse("@dec(a + b)\ndef f():\n    pass\n")
+            applier = MutantApplier(_make_mutant(lineno=1, col_offset=5))
+            applier.visit(tree)
+            assert applier.applied is True
+            assert type(tree.body[0].decorator_list[0].args[0].op) is ast.Sub
+
+    def it_resets_state_for_the_next_mutant():
+        applier = MutantApplier(_make_mutant(replacement_op="Sub"))
+        applier.visit(_binop(ast.Add))
+        assert applier.applied is True
+        mutant = _make_mutant(lineno=99)
+        applier.reset(mutant)
+        assert applier.mutant is mutant
+        assert applier.applied is False
+
     def it_does_not_apply_when_location_mismatches():
         source = "x + y"
         tree = ast.parse(source, mode="eval")
@@ -639,46 +511,92 @@ def describe_apply_mutation():
         tree, applied = apply_mutation(source, mutant)
         assert applied is True
 
+    @pytest.mark.parametrize(
+        "source,lineno,col_offset,node_type,replacement_op",
+        [
+            ("x + y\n", 1, 0, "BinOp", "Sub"),
+            ("x > y\n", 1, 0, "Compare", "LtE"),
+            ("a if c else b\n", 1, 0, "IfExp", "always_true"),
+            ("-x\n", 1, 0, "UnaryOp", "_remove"),
+            ("for i in x:\n    break\n", 2, 4, "Break", "continue"),
+            ("try:\n    pass\nexcept ValueError:\n    pass\n", 3, 0, "ExceptHandler", "broaden"),
+            ("try:\n    pass\nexcept ValueError:\n    pass\n", 3, 0, "ExceptHandler", "body_to_raise"),
+            ("def f():\n    return x\n", 2, 4, "Return", "negate"),
+            ("def f():\n    return x\n", 2, 4, "Return", "negate_expr"),
+            ("def f():\n    return x\n", 2, 4, "Return", "empty_str"),
+            ("def f():\n    return\n", 2, 4, "Return", "False"),
+            ("def f():\n    return None\n", 2, 4, "Return", "expr"),
+        ],
+    )
+    def it_compiles_without_fixing_locations(
+        source, lineno, col_offset, node_type, replacement_op
+    ):
+        mutant = _make_mutant(
+            lineno=lineno, col_offset=col_offset,
+            node_type=node_type, original_op="", replacement_op=replacement_op,
+        )
+        tree, applied = apply_mutation(source, mutant)
+        assert applied is True
+        compile(tree, "<test>", "exec")
 
-def describe_install_and_remove_hook():
-    def it_installs_and_removes_hook():
-        source = "x = 1\n"
-        point = _make_point(lineno=1, col_offset=0, node_type="BinOp", original_op="Add")
-        mutant = Mutant(point=point, replacement_op="Sub", mutant_id=0)
+    def it_locates_synthesized_return_values_at_the_original_value():
+        tree, _ = apply_mutation(
+            "def f():\n    return  x\n",
+            _make_mutant(
+                lineno=2, col_offset=4,
+                node_type="Return", original_op="expr", replacement_op="negate",
+            ),
+        )
+        value = tree.body[0].body[0].value
+        assert (value.lineno, value.col_offset, value.end_col_offset) == (2, 12, 13)
 
-        target_modules = {"__test_dummy_module__": source}
-        finder = install_hook(target_modules, mutant)
-        try:
-            assert finder in sys.meta_path
-        finally:
-            remove_hook(finder)
-        assert finder not in sys.meta_path
 
-    def it_survives_double_removal():
-        source = "x = 1\n"
-        point = _make_point(lineno=1, col_offset=0, node_type="BinOp", original_op="Add")
-        mutant = Mutant(point=point, replacement_op="Sub", mutant_id=0)
+def describe_install_and_remove_hook():
+    @pytest.fixture(scope="module")
+    def finder():
+        """One installed hook shared by the lifecycle tests."""
+        installed = install_hook({"__test_dummy_module__": "x = 1 + 2\n"}, _make_mutant())
+        yield installed
+        remove_hook(installed)
+
+    @pytest.fixture
+    def reinstall(finder):
+        """Put the shared finder back after a test removes it."""
+        yield
+        if finder not in sys.meta_path:
+            sys.meta_path.insert(0, finder)
+
+    def it_installs_hook(finder):
+        assert finder in sys.meta_path
+
+    def it_removes_hook(finder, reinstall):
+        remove_hook(finder)
+        assert finder not in sys.meta_path
 
-        target_modules = {"__test_dummy_module2__": source}
-        finder = install_hook(target_modules, mutant)
+    def it_survives_double_removal(finder, reinstall):
         remove_hook(finder)
         # Should not raise
         remove_hook(finder)
         assert finder not in sys.meta_path
 
-    def it_propagates_non_valueerror_from_remove():
+    @pytest.mark.parametrize("replacement_op,expected", [("Sub", -1), ("Mult", 2), ("Add", 3)])
+    def it_applies_whichever_mutant_is_swapped_in(finder, monkeypatch, replacement_op, expected):
+        """The finder reads .mutant at import time, so one hook serves many mutants."""
+        monkeypatch.setattr(
+            finder, "mutant", _make_mutant(lineno=1, col_offset=4, replacement_op=replacement_op)
+        )
+        clear_target_modules(["__test_dummy_module__"])
+        try:
+            module = importlib.import_module("__test_dummy_module__")
+        finally:
+            clear_target_modules(["__test_dummy_module__"])
+        assert module.x == expected
+
+    def it_propagates_non_valueerror_from_remove(finder):
         """Non-ValueError exceptions in remove_hook must propagate.
 
         Kills broaden mutation on except ValueError: pass (line 265).
         """
-        import pytest
-
-        source = "x = 1\n"
-        point = _make_point(lineno=1, col_offset=0, node_type="BinOp", original_op="Add")
-        mutant = Mutant(point=point, replacement_op="Sub", mutant_id=0)
-
-        target_modules = {"__test_dummy_module3__": source}
-        finder = install_hook(target_modules, mutant)
 
         class BadRemoveList(list):
             def remove(self, item):
@@ -691,11 +609,6 @@ def describe_install_and_remove_hook():
                 remove_hook(finder)
         finally:
             sys.meta_path = original_meta_path
-            # Clean up the finder from the original list
-            try:
-                sys.meta_path.remove(finder)
-            except ValueError:
-                pass
 
 
 def describe_UnaryOp_mutation():
@@ -709,10 +622,9 @@ def describe_UnaryOp_mutation():
         )
         applier = MutantApplier(mutant)
         new_tree = applier.visit(tree)
-        ast.fix_missing_locations(new_tree)
         assert applier.applied is True
         # The UnaryOp should be gone; body should now be just the Name node
-        assert isinstance(new_tree.body, ast.Name)
+        assert type(new_tree.body) is ast.Name
         assert new_tree.body.id == "x"
 
 
@@ -727,13 +639,12 @@ def describe_Return_mutations():
         )
         applier = MutantApplier(mutant)
         new_tree = applier.visit(tree)
-        ast.fix_missing_locations(new_tree)
         assert applier.applied is True
         ret_node = new_tree.body[0].body[0]  # FunctionDef -> Return
         # Return value should be UnaryOp(USub, original_value)
-        assert isinstance(ret_node.value, ast.UnaryOp)
-        assert isinstance(ret_node.value.op, ast.USub)
-        assert isinstance(ret_node.value.operand, ast.Name)
+        assert type(ret_node.value) is ast.UnaryOp
+        assert type(ret_node.value.op) is ast.USub
+        assert type(ret_node.value.operand) is ast.Name
 
     def it_applies_empty_str_mutation_to_return():
         """Return empty_str replaces the return value with ''."""
@@ -745,10 +656,9 @@ def describe_Return_mutations():
         )
         applier = MutantApplier(mutant)
         new_tree = applier.visit(tree)
-        ast.fix_missing_locations(new_tree)
         assert applier.applied is True
         ret_node = new_tree.body[0].body[0]  # FunctionDef -> Return
-        assert isinstance(ret_node.value, ast.Constant)
+        assert type(ret_node.value) is ast.Constant
         assert ret_node.value.value == ""
 
     def it_applies_negate_expr_mutation():
@@ -761,11 +671,10 @@ def describe_Return_mutations():
         )
         applier = MutantApplier(mutant)
         new_tree = applier.visit(tree)
-        ast.fix_missing_locations(new_tree)
         assert applier.applied is True
         ret_node = new_tree.body[0].body[0]
-        assert isinstance(ret_node.value, ast.UnaryOp)
-        assert isinstance(ret_node.value.op, ast.Not)
+        assert type(ret_node.value) is ast.UnaryOp
+        assert type(ret_node.value.op) is ast.Not
 
     def it_applies_remove_negation_mutation():
         """remove_negation strips UnaryOp from return value."""
@@ -777,11 +686,10 @@ def describe_Return_mutations():
         )
         applier = MutantApplier(mutant)
         new_tree = applier.visit(tree)
-        ast.fix_missing_locations(new_tree)
         assert applier.applied is True
         ret_node = new_tree.body[0].body[0]
         # Should be just the operand (Name 'x'), not UnaryOp
-        assert isinstance(ret_node.value, ast.Name)
+        assert type(ret_node.value) is ast.Name
 
     def it_applies_expr_mutation_to_return_none():
         """return None -> return True when replacement is 'expr'.
@@ -796,10 +704,9 @@ def describe_Return_mutations():
         )
         applier = MutantApplier(mutant)
         new_tree = applier.visit(tree)
-        ast.fix_missing_locations(new_tree)
         assert applier.applied is True
         ret_node = new_tree.body[0].body[0]
-        assert isinstance(ret_node.value, ast.Constant)
+        assert type(ret_node.value) is ast.Constant
         assert ret_node.value.value is True
 
     def it_does_not_apply_expr_mutation_to_non_none_return():
@@ -815,10 +722,9 @@ def describe_Return_mutations():
         )
         applier = MutantApplier(mutant)
         new_tree = applier.visit(tree)
-        ast.fix_missing_locations(new_tree)
         assert applier.applied is False
         ret_node = new_tree.body[0].body[0]
-        assert isinstance(ret_node.value, ast.Constant)
+        assert type(ret_node.value) is ast.Constant
         assert ret_node.value.value == 42
 
     def it_does_not_apply_expr_mutation_to_bare_return():
@@ -834,7 +740,6 @@ def describe_Return_mutations():
         )
         applier = MutantApplier(mutant)
         new_tree = applier.visit(tree)
-        ast.fix_missing_locations(new_tree)
         assert applier.applied is False
         ret_node = new_tree.body[0].body[0]
         assert ret_node.value is None
@@ -852,7 +757,6 @@ def describe_Return_mutations():
         )
         applier = MutantApplier(mutant)
         new_tree = applier.visit(tree)
-        ast.fix_missing_locations(new_tree)
         assert applier.applied is True
         ret_node = new_tree.body[0].body[0]
         # Should be False (from the "False" handler), not True (from "expr" handler)
@@ -875,6 +779,16 @@ def describe_Return_mutations():
         # So applied should be True since the node.value is not None (it's an AST node).
         assert applier.applied is True
 
+    def it_ignores_unknown_return_replacements():
+        tree = ast.parse("def f():\n    return x\n")
+        mutant = _make_mutant(
+            lineno=2, col_offset=4,
+            node_type="Return", original_op="expr", replacement_op="TotallyFake",
+        )
+        applier = MutantApplier(mutant)
+        applier.visit(tree)
+        assert applier.applied is False
+
     def it_does_not_apply_remove_negation_to_non_unary():
         """remove_negation requires isinstance(node.value, ast.UnaryOp)."""
         source = "def f():\n    return x\n"
@@ -885,112 +799,45 @@ def describe_Return_mutations():
         )
         applier = MutantApplier(mutant)
         new_tree = applier.visit(tree)
-        ast.fix_missing_locations(new_tree)
         # remove_negation requires UnaryOp — Name is not UnaryOp
         assert applier.applied is False
 
 
-def describe_node_type_discrimination():
-    """Tests that ensure each visit method only mutates matching node types.
+# (source, mode, mutant kwargs): a mutant positioned on a node of another
+# type.  Each case kills an ``and -> or`` mutant on a visit_* guard such as
+# ``self._matches(node) and self.mutant.point.node_type == "Compare"``; the
+# replacement_op is valid for the real node so a broken guard would apply it.
+_NEGATIVE_CASES = [
+    pytest.param("x + y", "eval", (1, 0, "Compare", "Gt", "LtE"), id="compare-on-binop"),
+    pytest.param("x > y", "eval", (1, 0, "BoolOp", "And", "Or"), id="boolop-on-compare"),
+    pytest.param("a and b", "eval", (1, 0, "UnaryOp", "Not", "_remove"), id="unaryop-on-boolop"),
+    pytest.param("a and b", "eval", (1, 0, "BinOp", "And", "Or"), id="binop-on-boolop"),
+    pytest.param("-x", "eval", (1, 0, "BinOp", "Add", "Sub"), id="binop-on-unaryop"),
+    pytest.param("def f():\n    return x + y\n", "exec", (2, 11, "Return", "expr", "None"), id="return-on-binop"),
+    pytest.param("x + y", "eval", (1, 0, "AugAssign", "Add", "Sub"), id="augassign-on-binop"),
+    pytest.param("x += y\n", "exec", (1, 0, "BinOp", "Add", "Sub"), id="binop-on-augassign"),
+    pytest.param("x + y", "eval", (1, 0, "IfExp", "ternary", "swap_branches"), id="ifexp-on-binop"),
+    pytest.param("x if cond else y", "eval", (1, 0, "BinOp", "Add", "Sub"), id="binop-on-ifexp"),
+    pytest.param("x if cond else y", "eval", (1, 0, "BoolOp", "And", "swap_branches"), id="boolop-on-ifexp"),
+    pytest.param("for i in x:\n    continue\n", "exec", (2, 4, "Break", "break", "continue"), id="break-on-continue"),
+    pytest.param("for i in x:\n    break\n", "exec", (2, 4, "Continue", "continue", "break"), id="continue-on-break"),
+    pytest.param("for i in x:\n    break\n", "exec", (2, 4, "BinOp", "Add", "continue"), id="binop-on-break"),
+    pytest.param("for i in x:\n    continue\n", "exec", (2, 4, "BinOp", "Add", "break"), id="binop-on-continue"),
+    pytest.param("x + y", "eval", (1, 0, "ExceptHandler", "typed", "broaden"), id="except-on-binop"),
+    pytest.param("try:\n    pass\nexcept ValueError:\n    pass\n", "exec", (3, 0, "BinOp", "Add", "broaden"), id="binop-on-except"),
+]
 
-    These kill the `and → or` mutants on compound conditions like
-    `self._matches(node) and self.mutant.point.node_type == "Compare"`.
-    """
 
-    def it_does_not_apply_compare_mutant_to_binop():
-        """A Compare mutant at same location must not affect a BinOp."""
-        source = "x + y\n"
-        tree = ast.parse(source, mode="eval")
-        # Mutant says "Compare" but node is BinOp
-        mutant = _make_mutant(
-            lineno=1, col_offset=0,
-            node_type="Compare", original_op="Gt", replacement_op="LtE",
-        )
-        applier = MutantApplier(mutant)
-        new_tree = applier.visit(tree)
-        # BinOp should be untouched
-        assert applier.applied is False
-        assert isinstance(new_tree.body.op, ast.Add)
-
-    def it_does_not_apply_boolop_mutant_to_compare():
-        """A BoolOp mutant at same location must not affect a Compare."""
-        source = "x > y\n"
-        tree = ast.parse(source, mode="eval")
-        mutant = _make_mutant(
-            lineno=1, col_offset=0,
-            node_type="BoolOp", original_op="And", replacement_op="Or",
-        )
-        applier = MutantApplier(mutant)
-        new_tree = applier.visit(tree)
-        assert applier.applied is False
-        assert isinstance(new_tree.body.ops[0], ast.Gt)
-
-    def it_does_not_apply_unaryop_mutant_to_boolop():
-        """A UnaryOp mutant at same location must not affect a BoolOp."""
-        source = "a and b\n"
-        tree = ast.parse(source, mode="eval")
-        mutant = _make_mutant(
-            lineno=1, col_offset=0,
-            node_type="UnaryOp", original_op="Not", replacement_op="_remove",
-        )
-        applier = MutantApplier(mutant)
-        new_tree = applier.visit(tree)
-        assert applier.applied is False
-        assert isinstance(new_tree.body.op, ast.And)
-
-    def it_does_not_apply_non_boolop_mutant_to_boolop_with_valid_replacement():
-        """A non-BoolOp mutant at matching position must not mutate a BoolOp.
-
-        This kills the `and → or` mutant on line 75 of import_hook.py:
-            if self._matches(node) and self.mutant.point.node_type == "BoolOp"
-        With `or`, the condition would fire when _matches is True regardless
-        of node_type. Using a valid replacement_op (one that exists in
-        _OP_CLASSES) ensures the mutation would actually be applied if the
-        guard fails.
-        """
-        source = "a and b\n"
-        tree = ast.parse(source, mode="eval")
-        # Position matches the BoolOp node, but node_type says "BinOp"
-        # replacement_op "Or" IS in _OP_CLASSES — so if the guard fails,
-        # the mutation would be applied
-        mutant = _make_mutant(
-            lineno=1, col_offset=0,
-            node_type="BinOp", original_op="And", replacement_op="Or",
-        )
-        applier = MutantApplier(mutant)
-        new_tree = applier.visit(tree)
-        assert applier.applied is False
-        # The BoolOp operator must remain And (not changed to Or)
-        assert isinstance(new_tree.body.op, ast.And)
-
-    def it_does_not_apply_return_mutant_to_binop():
-        """A Return mutant at same location must not affect a BinOp in a return."""
-        source = "def f():\n    return x + y\n"
-        tree = ast.parse(source)
-        # Target the BinOp inside the return (line 2, col 11)
-        binop_node = tree.body[0].body[0].value  # The x + y BinOp
-        mutant = _make_mutant(
-            lineno=2, col_offset=binop_node.col_offset,
-            node_type="Return", original_op="expr", replacement_op="None",
-        )
-        applier = MutantApplier(mutant)
-        new_tree = applier.visit(tree)
-        # The return at col 4 is a Return, not at the BinOp's col_offset
-        # The BinOp should be untouched
-        assert isinstance(new_tree.body[0].body[0].value, ast.BinOp)
+def describe_node_type_discrimination():
+    """Tests that ensure each visit method only mutates matching node types."""
 
-    def it_does_not_apply_binop_mutant_to_unaryop():
-        """A BinOp mutant at same location must not affect a UnaryOp."""
-        source = "-x\n"
-        tree = ast.parse(source, mode="eval")
-        mutant = _make_mutant(
-            lineno=1, col_offset=0,
-            node_type="BinOp", original_op="Add", replacement_op="Sub",
-        )
-        applier = MutantApplier(mutant)
+    @pytest.mark.parametrize("source,mode,location", _NEGATIVE_CASES)
+    def it_rejects_mismatched_node_type(source, mode, location):
+        tree = ast.parse(source, mode=mode)
+        applier = MutantApplier(_make_mutant(*location))
         new_tree = applier.visit(tree)
         assert applier.applied is False
-        assert isinstance(new_tree.body.op, ast.USub)
+        assert ast.dump(new_tree) == ast.dump(_parse(source, mode=mode))
 
     def it_does_not_apply_compare_mutation_to_other_compare_at_wrong_location():
         """Compare mutant at line 1 must not affect Compare at line 2."""
@@ -1005,9 +852,9 @@ def describe_node_type_discrimination():
         new_tree = applier.visit(tree)
         assert applier.applied is True
         # Line 1 compare should be mutated
-        assert isinstance(new_tree.body[0].value.ops[0], ast.LtE)
+        assert type(new_tree.body[0].value.ops[0]) is ast.LtE
         # Line 2 compare should be untouched
-        assert isinstance(new_tree.body[1].value.ops[0], ast.Lt)
+        assert type(new_tree.body[1].value.ops[0]) is ast.Lt
 
     def it_does_not_mutate_unaryop_with_unknown_replacement():
         """UnaryOp with an unrecognized replacement_op should not apply."""
@@ -1064,6 +911,51 @@ def describe_MutatingLoader():
         result = loader.create_module(spec)
         assert result is None
 
+    def it_reuses_cached_code_when_the_mutant_is_elsewhere(monkeypatch):
+        import types
+
+        from pytest_leela import import_hook
+        from pytest_leela.import_hook import MutatingLoader
+
+        source = "x = 1 + 2\n"
+        MutatingLoader(source, _make_mutant(lineno=9), "cached.py").exec_module(
+            types.ModuleType("cached")
+        )
+        assert ("cached.py", source) in import_hook._SRC_CACHE
+
+        def no_compile(*args, **kwargs):
+            raise AssertionError("compiled again")
+
+        monkeypatch.setattr(import_hook, "compile", no_compile, raising=False)
+        module = types.ModuleType("cached")
+        MutatingLoader(source, _make_mutant(lineno=9), "cached.py").exec_module(module)
+        assert module.x == 3
+
+    def it_does_not_leak_a_mutation_into_the_cached_code():
+        import types
+
+        from pytest_leela.import_hook import MutatingLoader
+
+        source = "x = 2 * 3\n"
+        mutated = types.ModuleType("isolated")
+        mutant = _make_mutant(lineno=1, col_offset=4, original_op="Mult", replacement_op="Add")
+        MutatingLoader(source, mutant, "isolated.py").exec_module(mutated)
+        clean = types.ModuleType("isolated")
+        MutatingLoader(source, _make_mutant(lineno=9), "isolated.py").exec_module(clean)
+        assert (mutated.x, clean.x) == (5, 6)
+
+    def it_still_mutates_when_the_mutant_is_in_the_module():
+        import types
+
+        from pytest_leela.import_hook import MutatingLoader
+
+        source = "x = 1 + 2\n"
+        for replacement_op, expected in [("Add", 3), ("Sub", -1)]:
+            module = types.ModuleType("cached")
+            mutant = _make_mutant(lineno=1, col_offset=4, replacement_op=replacement_op)
+            MutatingLoader(source, mutant, "cached.py").exec_module(module)
+            assert module.x == expected
+
 
 def describe_clear_target_modules():
     def it_clears_module_and_submodules():
@@ -1083,3 +975,16 @@ def describe_clear_target_modules():
         finally:
             sys.modules.pop("fake_target", None)
             sys.modules.pop("fake_target.sub", None)
+
+    def it_keeps_modules_that_only_share_a_name_prefix():
+        import types
+
+        sys.modules["fake_target"] = types.ModuleType("fake_target")
+        sys.modules["fake_targetx"] = types.ModuleType("fake_targetx")
+        try:
+            clear_target_modules(["fake_target"])
+            assert "fake_target" not in sys.modules
+            assert "fake_targetx" in sys.modules
+        finally:
+            sys.modules.pop("fake_target", None)
+            sys.modules.pop("fake_targetx", None)
@@ -86,6 +86,41 @@ def describe_run_result():
             )
             assert run.survived == []
 
+        def it_returns_a_fresh_list_each_access():
+            results = [_make_result(False, 1), _make_result(True, 2)]
+            run = RunResult(
+                target_files=["test.py"],
+                total_mutants=2,
+                mutants_tested=2,
+                mutants_pruned=0,
+                results=results,
+                wall_time_seconds=1.0,
+            )
+            run.survived.append(_make_result(False, 3))
+            assert run.survived == [results[0]]
+            assert run.killed == 1
+
+    def describe_summary():
+        def it_walks_results_once_for_all_counts():
+            class CountingList(list):
+                iterations = 0
+
+                def __iter__(self):
+                    CountingList.iterations += 1
+                    return super().__iter__()
+
+            results = CountingList([_make_result(True), _make_result(False)])
+            run = RunResult(
+                target_files=["test.py"],
+                total_mutants=2,
+                mutants_tested=2,
+                mutants_pruned=0,
+                results=results,
+                wall_time_seconds=1.0,
+            )
+            assert (run.killed, len(run.survived), run.mutation_score) == (1, 1, 50.0)
+            assert CountingList.iterations == 1
+
     def describe_mutation_score():
         def it_calculates_percentage_of_killed():
             results = [_make_result(True, 1), _make_result(False, 2)]
@@ -211,3 +246,42 @@ def describe_run_result_new_fields():
             target_sources={"app.py": "x = 1\n"},
         )
         assert run.target_sources == {"app.py": "x = 1\n"}
+
+
+def describe_model_slots():
+    def it_has_no_instance_dict():
+        mutant = Mutant(point=_make_point(), replacement_op="Sub", mutant_id=0)
+        assert not hasattr(mutant, "__dict__")
+        assert not hasattr(mutant.point, "__dict__")
+
+    def it_slots_the_result_models():
+        result = _make_result(True)
+        run = RunResult(
+            target_files=[],
+            total_mutants=1,
+            mutants_tested=1,
+            mutants_pruned=0,
+            results=[result],
+            wall_time_seconds=0.0,
+        )
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(run, "__dict__")
+        assert run.killed == 1
+
+    def it_round_trips_through_pickle():
+        import pickle
+
+        mutant = Mutant(point=_make_point(), replacement_op="Sub", mutant_id=0)
+        assert pickle.loads(pickle.dumps(mutant)) == mutant
+
+
+def describe_mutation_point_interning():
+    def it_shares_small_vocabulary_strings():
+        a = _make_point(node_type="".join(["Bin", "Op"]), inferred_type="".join(["in", "t"]))
+        b = _make_point(node_type="BinOp", inferred_type="int")
+        assert a.node_type is b.node_type
+        assert a.inferred_type is b.inferred_type
+        assert a.original_op is b.original_op
+
+    def it_leaves_missing_inferred_type_as_none():
+        assert _make_point().inferred_type is None
@@ -308,6 +308,11 @@ def describe_mutations_for():
         assert muts == []
         assert isinstance(muts, list)
 
+    def it_returns_a_fresh_list_each_call():
+        point = _make_point(node_type="BinOp", original_op="Add", inferred_type="int")
+        mutations_for(point, use_types=True).append("Pow")
+        assert mutations_for(point, use_types=True) == ["Sub", "Mult", "FloorDiv"]
+
 
 def describe_count_pruned():
     def it_counts_pruned_mutations():
@@ -5,7 +5,13 @@ import json
 import pytest
 
 from pytest_leela.models import Mutant, MutantResult, MutationPoint, RunResult
-from pytest_leela.output import _op_display, _pct, format_json_report, format_terminal_report
+from pytest_leela.output import (
+    _build_report_dict,
+    _op_display,
+    _pct,
+    format_json_report,
+    format_terminal_report,
+)
 
 
 def _make_point(
@@ -53,7 +59,7 @@ def _make_run_result(results: list[MutantResult] | None = None) -> RunResult:
             _make_result(killed=True, mutant_id=1),
             _make_result(killed=False, mutant_id=2, replacement_op="Mult"),
         ]
-    target_files = list({r.mutant.point.file_path for r in results}) if results else []
+    target_files = list(dict.fromkeys(r.mutant.point.file_path for r in results)) if results else []
     return RunResult(
         target_files=target_files,
         total_mutants=len(results) + 2,
@@ -64,24 +70,56 @@ def _make_run_result(results: list[MutantResult] | None = None) -> RunResult:
     )
 
 
+def _index_lines(report: str) -> tuple[list[str], dict[str, list[int]]]:
+    """Split a report once and index line numbers by their first token."""
+    lines = report.split("\n")
+    anchors: dict[str, list[int]] = {}
+    for i, line in enumerate(lines):
+        words = line.split(None, 1)
+        if words:
+            anchors.setdefault(words[0], []).append(i)
+    return lines, anchors
+
+
+# The default two-mutant run and its renderings; tests only read them.
+@pytest.fixture(scope="module")
+def default_run() -> RunResult:
+    return _make_run_result()
+
+
+@pytest.fixture(scope="module")
+def default_terminal_report(default_run: RunResult) -> str:
+    return format_terminal_report(default_run)
+
+
+@pytest.fixture(scope="module")
+def default_json_data(default_run: RunResult) -> dict:
+    return _build_report_dict(default_run)
+
+
 def describe_op_display():
-    def it_maps_known_arithmetic_operators():
-        assert _op_display("Add", "Sub") == "+ \u2192 -"
-        assert _op_display("Mult", "Div") == "* \u2192 /"
-        assert _op_display("FloorDiv", "Mod") == "// \u2192 %"
-        assert _op_display("Pow", "Mult") == "** \u2192 *"
-
-    def it_maps_known_comparison_operators():
-        assert _op_display("Eq", "NotEq") == "== \u2192 !="
-        assert _op_display("Lt", "GtE") == "< \u2192 >="
-        assert _op_display("Gt", "LtE") == "> \u2192 <="
-        assert _op_display("Is", "IsNot") == "is \u2192 is not"
-        assert _op_display("In", "NotIn") == "in \u2192 not in"
-
-    def it_maps_boolean_and_unary_operators():
-        assert _op_display("And", "Or") == "and \u2192 or"
-        assert _op_display("USub", "UAdd") == "- \u2192 +"
-        assert _op_display("Not", "UAdd") == "not \u2192 +"
+    @pytest.mark.parametrize(
+        "original,replacement,expected",
+        [
+            # Arithmetic
+            ("Add", "Sub", "+ \u2192 -"),
+            ("Mult", "Div", "* \u2192 /"),
+            ("FloorDiv", "Mod", "// \u2192 %"),
+            ("Pow", "Mult", "** \u2192 *"),
+            # Comparison
+            ("Eq", "NotEq", "== \u2192 !="),
+            ("Lt", "GtE", "< \u2192 >="),
+            ("Gt", "LtE", "> \u2192 <="),
+            ("Is", "IsNot", "is \u2192 is not"),
+            ("In", "NotIn", "in \u2192 not in"),
+            # Boolean and unary
+            ("And", "Or", "and \u2192 or"),
+            ("USub", "UAdd", "- \u2192 +"),
+            ("Not", "UAdd", "not \u2192 +"),
+        ],
+    )
+    def it_maps_operators(original, replacement, expected):
+        assert _op_display(original, replacement) == expected
 
     def it_passes_through_unknown_operators():
         assert _op_display("FooOp", "BarOp") == "FooOp \u2192 BarOp"
@@ -118,17 +156,13 @@ def describe_op_display():
 
 
 def describe_format_terminal_report():
-    def it_includes_header_and_score():
-        run = _make_run_result()
-        report = format_terminal_report(run)
-        assert "leela mutation testing" in report
-        assert "=" * 70 in report
-        assert "1/2 killed (50.0%)" in report
+    def it_includes_header_and_score(default_terminal_report):
+        assert "leela mutation testing" in default_terminal_report
+        assert "=" * 70 in default_terminal_report
+        assert "1/2 killed (50.0%)" in default_terminal_report
 
-    def it_shows_target_file_count():
-        run = _make_run_result()
-        report = format_terminal_report(run)
-        assert "Target: 1 file" in report
+    def it_shows_target_file_count(default_terminal_report):
+        assert "Target: 1 file" in default_terminal_report
 
     def it_pluralizes_files_correctly():
         results = [
@@ -146,28 +180,20 @@ def describe_format_terminal_report():
         report = format_terminal_report(run)
         assert "Target: 2 files" in report
 
-    def it_shows_per_file_kill_stats():
-        run = _make_run_result()
-        report = format_terminal_report(run)
+    def it_shows_per_file_kill_stats(default_terminal_report):
         # app.py: 1 killed out of 2
-        assert "app.py" in report
-        assert "1/2 killed (50.0%)" in report
+        assert "app.py" in default_terminal_report
+        assert "1/2 killed (50.0%)" in default_terminal_report
 
-    def it_lists_survived_mutants():
-        run = _make_run_result()
-        report = format_terminal_report(run)
-        assert "SURVIVED" in report
-        assert "line 10" in report
+    def it_lists_survived_mutants(default_terminal_report):
+        assert "SURVIVED" in default_terminal_report
+        assert "line 10" in default_terminal_report
 
-    def it_shows_pruning_info():
-        run = _make_run_result()
-        report = format_terminal_report(run)
-        assert "2 pruned by type analysis" in report
+    def it_shows_pruning_info(default_terminal_report):
+        assert "2 pruned by type analysis" in default_terminal_report
 
-    def it_shows_wall_time():
-        run = _make_run_result()
-        report = format_terminal_report(run)
-        assert "1.5s" in report
+    def it_shows_wall_time(default_terminal_report):
+        assert "1.5s" in default_terminal_report
 
     def it_handles_empty_results():
         run = RunResult(
@@ -183,10 +209,8 @@ def describe_format_terminal_report():
         assert "Target: 0 files" in report
         assert "0/0 killed" in report
 
-    def it_shows_overall_summary():
-        run = _make_run_result()
-        report = format_terminal_report(run)
-        assert "Overall: 1/2 killed (50.0%) in 1.5s" in report
+    def it_shows_overall_summary(default_terminal_report):
+        assert "Overall: 1/2 killed (50.0%) in 1.5s" in default_terminal_report
 
     def it_does_not_show_pruning_line_when_zero():
         run = RunResult(
@@ -197,10 +221,9 @@ def describe_format_terminal_report():
             results=[_make_result(killed=True), _make_result(killed=True, mutant_id=2)],
             wall_time_seconds=1.0,
         )
-        report = format_terminal_report(run)
-        lines = report.split("\n")
+        lines, anchors = _index_lines(format_terminal_report(run))
         # The pruning detail line appears in the overall summary only when pruned > 0
-        overall_idx = next(i for i, l in enumerate(lines) if l.startswith("Overall:"))
+        overall_idx = anchors["Overall:"][0]
         # Next non-empty line after Overall should not be a pruning line
         remaining = [l for l in lines[overall_idx + 1 :] if l.strip()]
         if remaining:
@@ -303,22 +326,18 @@ def describe_format_json_report():
         data = json.loads(output)
         assert isinstance(data, dict)
 
-    def it_includes_all_summary_fields():
-        run = _make_run_result()
-        data = json.loads(format_json_report(run))
-        assert data["total_mutants"] == 4
-        assert data["mutants_tested"] == 2
-        assert data["mutants_pruned"] == 2
-        assert data["killed"] == 1
-        assert data["survived"] == 1
-        assert data["mutation_score"] == 50.0
-        assert data["wall_time_seconds"] == 1.5
-
-    def it_includes_survived_mutant_details():
-        run = _make_run_result()
-        data = json.loads(format_json_report(run))
-        assert len(data["survived_mutants"]) == 1
-        survived = data["survived_mutants"][0]
+    def it_includes_all_summary_fields(default_json_data):
+        assert default_json_data["total_mutants"] == 4
+        assert default_json_data["mutants_tested"] == 2
+        assert default_json_data["mutants_pruned"] == 2
+        assert default_json_data["killed"] == 1
+        assert default_json_data["survived"] == 1
+        assert default_json_data["mutation_score"] == 50.0
+        assert default_json_data["wall_time_seconds"] == 1.5
+
+    def it_includes_survived_mutant_details(default_json_data):
+        assert len(default_json_data["survived_mutants"]) == 1
+        survived = default_json_data["survived_mutants"][0]
         assert survived["file"] == "src/app.py"
         assert survived["line"] == 10
         assert survived["original"] == "Add"
@@ -334,13 +353,11 @@ def describe_format_json_report():
             results=[],
             wall_time_seconds=0.0,
         )
-        data = json.loads(format_json_report(run))
+        data = _build_report_dict(run)
         assert data["killed"] == 0
         assert data["survived"] == 0
         assert data["survived_mutants"] == []
         assert data["mutation_score"] == 0.0
 
-    def it_includes_target_files():
-        run = _make_run_result()
-        data = json.loads(format_json_report(run))
-        assert data["target_files"] == run.target_files
+    def it_includes_target_files(default_json_data, default_run):
+        assert default_json_data["target_files"] == default_run.target_files
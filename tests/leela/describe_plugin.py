@@ -1,18 +1,84 @@
 """Tests for pytest_leela.plugin — target file discovery and plugin behavior."""
 
+import argparse
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import MagicMock, call, patch
 
+import pytest
+
+from pytest_leela.models import Mutant, MutantResult, MutationPoint, RunResult
 from pytest_leela.plugin import (
+    _find_all_target_files,
     _find_default_targets,
     _find_target_files,
     _is_test_file,
     pytest_addoption,
     pytest_configure,
+    pytest_sessionstart,
 )
 
 
+@dataclass
+class _FakeConfig:
+    """Just enough of pytest.Config for LeelaPlugin; records requested options."""
+
+    options: dict[str, Any] = field(default_factory=dict)
+    rootpath: Path = Path("/tmp/project")
+    requested: list[str] = field(default_factory=list)
+
+    def getoption(self, key: str, default: Any = None) -> Any:
+        self.requested.append(key)
+        return self.options.get(key, default)
+
+
+def _fake_session(config: _FakeConfig, *node_ids: str) -> SimpleNamespace:
+    items = [SimpleNamespace(nodeid=node_id) for node_id in node_ids]
+    return SimpleNamespace(config=config, items=items, exitstatus=0)
+
+
+def _empty_run() -> RunResult:
+    return RunResult(
+        target_files=["/fake/mod.py"],
+        total_mutants=0,
+        mutants_tested=0,
+        mutants_pruned=0,
+        results=[],
+        wall_time_seconds=0.1,
+    )
+
+
+def _single_mutant_run(killed: bool) -> RunResult:
+    point = MutationPoint(
+        file_path="/fake/mod.py",
+        module_name="mod",
+        lineno=10,
+        col_offset=0,
+        node_type="BinOp",
+        original_op="Add",
+        inferred_type="int",
+    )
+    mutant = Mutant(point=point, replacement_op="Sub", mutant_id=1)
+    result = MutantResult(
+        mutant=mutant,
+        killed=killed,
+        tests_run=5,
+        killing_test="test_a.py::test_one" if killed else None,
+        time_seconds=0.1,
+    )
+    return RunResult(
+        target_files=["/fake/mod.py"],
+        total_mutants=1,
+        mutants_tested=1,
+        mutants_pruned=0,
+        results=[result],
+        wall_time_seconds=0.5,
+    )
+
+
 def describe_is_test_file():
     def it_detects_test_prefix():
         assert _is_test_file("test_foo.py") is True
@@ -47,7 +113,7 @@ def describe_find_target_files():
         target = tmp_path / "module.py"
         target.write_text("x = 1\n")
         result = _find_target_files(str(target))
-        assert result == [str(target.resolve())]
+        assert result == [os.path.abspath(str(target))]
 
     def it_returns_empty_for_nonexistent_path():
         result = _find_target_files("/nonexistent/path/nope.py")
@@ -84,6 +150,21 @@ def describe_find_target_files():
         assert "deep.py" in basenames
         assert "top.py" in basenames
 
+    def it_skips_subtrees_that_cannot_be_scanned(tmp_path):
+        (tmp_path / "gone").mkdir()
+        (tmp_path / "gone" / "lost.py").write_text("x = 1\n")
+        (tmp_path / "kept.py").write_text("y = 2\n")
+        real_scandir = os.scandir
+
+        def flaky_scandir(path):
+            if os.path.basename(path) == "gone":
+                raise NotADirectoryError(path)
+            return real_scandir(path)
+
+        with patch("pytest_leela.plugin.os.scandir", side_effect=flaky_scandir):
+            result = _find_target_files(str(tmp_path))
+        assert [os.path.basename(f) for f in result] == ["kept.py"]
+
     def it_requires_both_is_file_and_py_extension(tmp_path):
         """The `and` condition: file must be an actual file AND end with .py."""
         # A directory ending with .py should NOT be returned as a single file
@@ -132,6 +213,69 @@ def describe_find_target_files():
         assert "tests.py" not in basenames
         assert "tests_mailerlite.py" not in basenames
 
+    def it_skips_hidden_cache_and_symlinked_directories(tmp_path):
+        pkg = tmp_path / "pkg"
+        pkg.mkdir()
+        (pkg / "real.py").write_text("x = 1\n")
+        hidden = tmp_path / ".venv"
+        hidden.mkdir()
+        (hidden / "vendored.py").write_text("y = 2\n")
+        cache = tmp_path / "__pycache__"
+        cache.mkdir()
+        (cache / "stale.py").write_text("z = 3\n")
+        (tmp_path / "loop").symlink_to(tmp_path, target_is_directory=True)
+        result = _find_target_files(str(tmp_path))
+        assert [os.path.basename(f) for f in result] == ["real.py"]
+
+    def it_skips_environment_and_tooling_dirs(tmp_path):
+        (tmp_path / "app.py").write_text("x = 1\n")
+        for name in ("venv", "node_modules", "site-packages"):
+            d = tmp_path / name
+            d.mkdir()
+            (d / "vendored.py").write_text("y = 2\n")
+        result = _find_target_files(str(tmp_path))
+        assert [os.path.basename(f) for f in result] == ["app.py"]
+
+    def it_returns_sorted_path_strings(tmp_path):
+        sub = tmp_path / "pkg"
+        sub.mkdir()
+        for path in (tmp_path / "b.py", sub / "a.py", tmp_path / "a.py"):
+            path.write_text("x = 1\n")
+        result = _find_target_files(str(tmp_path))
+        assert all(type(f) is str for f in result)
+        assert result == sorted(result)
+        assert len(result) == 3
+
+    def it_reuses_the_walk_until_the_next_session(tmp_path):
+        (tmp_path / "a.py").write_text("x = 1\n")
+        first = _find_target_files(str(tmp_path))
+        (tmp_path / "b.py").write_text("y = 2\n")
+        assert _find_target_files(str(tmp_path)) == first
+        # Callers get their own list, not the cached tuple
+        assert _find_target_files(str(tmp_path)) is not first
+
+        pytest_sessionstart(_fake_session(_FakeConfig()))
+        assert len(_find_target_files(str(tmp_path))) == 2
+
+
+def describe_find_all_target_files():
+    def it_walks_a_single_target_directly(tmp_path):
+        (tmp_path / "a.py").write_text("x = 1\n")
+        assert _find_all_target_files([str(tmp_path)]) == _find_target_files(str(tmp_path))
+
+    def it_concatenates_targets_in_argument_order(tmp_path):
+        one = tmp_path / "one"
+        two = tmp_path / "two"
+        for d in (one, two):
+            d.mkdir()
+            (d / "mod.py").write_text("x = 1\n")
+        result = _find_all_target_files([str(two), str(one), str(two / "mod.py")])
+        assert result == [
+            str(two / "mod.py"),
+            str(one / "mod.py"),
+            str(two / "mod.py"),
+        ]
+
 
 def describe_find_default_targets():
     def it_finds_files_in_target_directory(tmp_path):
@@ -173,6 +317,23 @@ def describe_find_default_targets():
         assert "__init__.py" not in basenames
         assert "real.py" in basenames
 
+    def it_accepts_a_plain_string_root(tmp_path):
+        src_dir = tmp_path / "src"
+        src_dir.mkdir()
+        (src_dir / "lib.py").write_text("y = 2\n")
+        assert _find_default_targets(str(tmp_path)) == _find_default_targets(tmp_path)
+
+    def it_reuses_the_walk_within_a_session(tmp_path):
+        src_dir = tmp_path / "src"
+        src_dir.mkdir()
+        (src_dir / "a.py").write_text("x = 1\n")
+        first = _find_default_targets(tmp_path)
+        (src_dir / "b.py").write_text("y = 2\n")
+        assert _find_default_targets(tmp_path) == first
+
+        pytest_sessionstart(_fake_session(_FakeConfig()))
+        assert len(_find_default_targets(tmp_path)) == 2
+
     def it_returns_empty_when_no_standard_dirs(tmp_path):
         result = _find_default_targets(tmp_path)
         assert result == []
@@ -212,286 +373,124 @@ def describe_find_default_targets():
 
 
 def describe_LeelaPlugin():
+    @pytest.fixture
+    def plugin_env():
+        """A plugin wired to fakes; the engine returns an empty run by default."""
+        from pytest_leela.plugin import LeelaPlugin
+
+        config = _FakeConfig({"target": ["/fake/mod.py"]})
+        session = _fake_session(config, "tests/test_a.py::test_one")
+        engine_cls = MagicMock()
+        engine_cls.return_value.run.return_value = _empty_run()
+        generate = MagicMock()
+        plugin = LeelaPlugin(config)
+
+        with (
+            patch.multiple(
+                "pytest_leela.plugin",
+                _find_target_files=MagicMock(return_value=["/fake/mod.py"]),
+                Engine=engine_cls,
+                format_terminal_report=MagicMock(return_value=""),
+            ),
+            patch("pytest_leela.html_report.generate_html_report", generate),
+        ):
+            yield SimpleNamespace(
+                config=config,
+                session=session,
+                engine_cls=engine_cls,
+                engine=engine_cls.return_value,
+                generate=generate,
+                run=lambda: plugin.pytest_sessionfinish(session, exitstatus=0),
+            )
+
     def it_skips_mutation_when_exit_status_nonzero():
         """exitstatus != 0 should cause early return."""
         from pytest_leela.plugin import LeelaPlugin
 
-        config = MagicMock()
+        config = _FakeConfig()
         plugin = LeelaPlugin(config)
-        session = MagicMock()
+        session = _fake_session(config)
         # Should not crash, just return
         result = plugin.pytest_sessionfinish(session, exitstatus=1)
         assert result is None
         # Engine should NOT have been called
-        config.getoption.assert_not_called()
+        assert config.requested == []
 
     def it_does_not_skip_when_exit_status_zero():
         """exitstatus == 0 should proceed (the != mutation would skip it)."""
         from pytest_leela.plugin import LeelaPlugin
 
-        config = MagicMock()
-        config.getoption.side_effect = lambda key, default=None: default
+        config = _FakeConfig(rootpath=Path("/tmp/fake"))
         plugin = LeelaPlugin(config)
-        session = MagicMock()
-        session.config = config
-        session.config.rootpath = Path("/tmp/fake")
+        session = _fake_session(config)
 
         # When exitstatus is 0, getoption WILL be called
         plugin.pytest_sessionfinish(session, exitstatus=0)
-        config.getoption.assert_called()
+        assert config.requested
 
     def it_skips_when_no_target_files_found():
         """If target_files is empty, should return early."""
         from pytest_leela.plugin import LeelaPlugin
 
-        config = MagicMock()
-        config.getoption.return_value = None
+        config = _FakeConfig(rootpath=Path("/tmp/nonexistent_root"))
         plugin = LeelaPlugin(config)
-        session = MagicMock()
-        session.config = config
-        session.config.rootpath = Path("/tmp/nonexistent_root")
+        session = _fake_session(config)
 
         with patch("pytest_leela.plugin._find_default_targets", return_value=[]):
             # Should not crash — just returns when no target files
             plugin.pytest_sessionfinish(session, exitstatus=0)
 
-    def it_runs_engine_when_target_files_found():
+    def it_runs_engine_when_target_files_found(plugin_env):
         """When target_files is non-empty, engine must run (line 95 guard).
 
         The `not target_files` → `target_files` mutation would cause early
         return when files ARE found, skipping the engine entirely.
         """
-        from pytest_leela.plugin import LeelaPlugin
-
-        config = MagicMock()
-        config.getoption.side_effect = lambda key, default=None: {
-            "target": ["/fake/target.py"],
-            "diff": None,
-            "max_cores": None,
-            "max_memory": None,
-        }.get(key, default)
-
-        plugin = LeelaPlugin(config)
-        session = MagicMock()
-        session.config = config
-        session.config.rootpath = Path("/tmp/project")
-        session.items = [MagicMock(nodeid="tests/test_a.py::test_one")]
-
-        mock_engine = MagicMock()
-        mock_result = MagicMock()
-        mock_engine.return_value.run.return_value = mock_result
-
-        with (
-            patch("pytest_leela.plugin._find_target_files", return_value=["/fake/target.py"]),
-            patch("pytest_leela.plugin.Engine", mock_engine),
-            patch("pytest_leela.plugin.format_terminal_report", return_value="report"),
-        ):
-            plugin.pytest_sessionfinish(session, exitstatus=0)
+        plugin_env.run()
 
         # Engine.run MUST have been called — the `not target_files` guard
         # should NOT have triggered early return
-        mock_engine.return_value.run.assert_called_once()
+        plugin_env.engine.run.assert_called_once()
 
-    def it_collects_test_node_ids_from_session():
+    def it_collects_test_node_ids_from_session(plugin_env):
         """test_node_ids are collected from session.items (line 116).
 
         This replaced the old hardcoded ``rootpath / 'tests'`` approach,
         letting pytest-leela work with any test layout.
         """
-        from pytest_leela.plugin import LeelaPlugin
-
-        config = MagicMock()
-        config.getoption.side_effect = lambda key, default=None: {
-            "target": ["/fake/mod.py"],
-            "diff": None,
-            "max_cores": None,
-            "max_memory": None,
-        }.get(key, default)
-
-        plugin = LeelaPlugin(config)
-        session = MagicMock()
-        session.config = config
-        session.config.rootpath = Path("/tmp/myproject")
-        session.items = [
-            MagicMock(nodeid="tests/test_a.py::test_one"),
-            MagicMock(nodeid="tests/test_b.py::test_two"),
-        ]
-
-        mock_engine_cls = MagicMock()
-        mock_engine = mock_engine_cls.return_value
-        mock_engine.run.return_value = MagicMock()
-
-        with (
-            patch("pytest_leela.plugin._find_target_files", return_value=["/fake/mod.py"]),
-            patch("pytest_leela.plugin.Engine", mock_engine_cls),
-            patch("pytest_leela.plugin.format_terminal_report", return_value=""),
-        ):
-            plugin.pytest_sessionfinish(session, exitstatus=0)
+        plugin_env.session.items.append(SimpleNamespace(nodeid="tests/test_b.py::test_two"))
+        plugin_env.run()
 
         # Verify engine.run was called with test_node_ids from session.items
-        call_kwargs = mock_engine.run.call_args.kwargs
+        call_kwargs = plugin_env.engine.run.call_args.kwargs
         assert "test_node_ids" in call_kwargs
         assert call_kwargs["test_node_ids"] == [
             "tests/test_a.py::test_one",
             "tests/test_b.py::test_two",
         ]
 
-    def it_sets_exitstatus_to_1_when_mutants_survived():
+    def it_sets_exitstatus_to_1_when_mutants_survived(plugin_env):
         """When result.survived is non-empty, exitstatus should be 1."""
-        from pytest_leela.plugin import LeelaPlugin
-        from pytest_leela.models import RunResult, MutantResult, Mutant, MutationPoint
-
-        config = MagicMock()
-        config.getoption.side_effect = lambda key, default=None: {
-            "target": ["/fake/mod.py"],
-            "diff": None,
-            "max_cores": None,
-            "max_memory": None,
-        }.get(key, default)
-
-        plugin = LeelaPlugin(config)
-        session = MagicMock()
-        session.config = config
-        session.config.rootpath = Path("/tmp/project")
-        session.items = [MagicMock(nodeid="tests/test_a.py::test_one")]
-
-        # Create a RunResult with one survived mutant
-        point = MutationPoint(
-            file_path="/fake/mod.py",
-            module_name="mod",
-            lineno=10,
-            col_offset=0,
-            node_type="BinOp",
-            original_op="Add",
-            inferred_type="int",
-        )
-        mutant = Mutant(point=point, replacement_op="Sub", mutant_id=1)
-        survived_result = MutantResult(
-            mutant=mutant, killed=False, tests_run=5, killing_test=None, time_seconds=0.1
-        )
-        run_result = RunResult(
-            target_files=["/fake/mod.py"],
-            total_mutants=1,
-            mutants_tested=1,
-            mutants_pruned=0,
-            results=[survived_result],
-            wall_time_seconds=0.5,
-        )
-
-        mock_engine_cls = MagicMock()
-        mock_engine = mock_engine_cls.return_value
-        mock_engine.run.return_value = run_result
-
-        with (
-            patch("pytest_leela.plugin._find_target_files", return_value=["/fake/mod.py"]),
-            patch("pytest_leela.plugin.Engine", mock_engine_cls),
-            patch("pytest_leela.plugin.format_terminal_report", return_value=""),
-        ):
-            plugin.pytest_sessionfinish(session, exitstatus=0)
+        plugin_env.engine.run.return_value = _single_mutant_run(killed=False)
+        plugin_env.run()
 
         # Verify exitstatus was set to 1
-        assert session.exitstatus == 1
+        assert plugin_env.session.exitstatus == 1
 
-    def it_keeps_exitstatus_0_when_all_mutants_killed():
+    def it_keeps_exitstatus_0_when_all_mutants_killed(plugin_env):
         """When result.survived is empty, exitstatus should remain 0."""
-        from pytest_leela.plugin import LeelaPlugin
-        from pytest_leela.models import RunResult, MutantResult, Mutant, MutationPoint
-
-        config = MagicMock()
-        config.getoption.side_effect = lambda key, default=None: {
-            "target": ["/fake/mod.py"],
-            "diff": None,
-            "max_cores": None,
-            "max_memory": None,
-        }.get(key, default)
-
-        plugin = LeelaPlugin(config)
-        session = MagicMock()
-        session.config = config
-        session.config.rootpath = Path("/tmp/project")
-        session.items = [MagicMock(nodeid="tests/test_a.py::test_one")]
-        session.exitstatus = 0  # Start with 0
-
-        # Create a RunResult with no survived mutants (all killed)
-        point = MutationPoint(
-            file_path="/fake/mod.py",
-            module_name="mod",
-            lineno=10,
-            col_offset=0,
-            node_type="BinOp",
-            original_op="Add",
-            inferred_type="int",
-        )
-        mutant = Mutant(point=point, replacement_op="Sub", mutant_id=1)
-        killed_result = MutantResult(
-            mutant=mutant, killed=True, tests_run=5, killing_test="test_a.py::test_one", time_seconds=0.1
-        )
-        run_result = RunResult(
-            target_files=["/fake/mod.py"],
-            total_mutants=1,
-            mutants_tested=1,
-            mutants_pruned=0,
-            results=[killed_result],
-            wall_time_seconds=0.5,
-        )
-
-        mock_engine_cls = MagicMock()
-        mock_engine = mock_engine_cls.return_value
-        mock_engine.run.return_value = run_result
-
-        with (
-            patch("pytest_leela.plugin._find_target_files", return_value=["/fake/mod.py"]),
-            patch("pytest_leela.plugin.Engine", mock_engine_cls),
-            patch("pytest_leela.plugin.format_terminal_report", return_value=""),
-        ):
-            plugin.pytest_sessionfinish(session, exitstatus=0)
+        plugin_env.engine.run.return_value = _single_mutant_run(killed=True)
+        plugin_env.run()
 
         # Verify exitstatus remained 0
-        assert session.exitstatus == 0
+        assert plugin_env.session.exitstatus == 0
 
-    def it_keeps_exitstatus_0_when_no_mutants_found():
+    def it_keeps_exitstatus_0_when_no_mutants_found(plugin_env):
         """When total_mutants is 0, exitstatus should remain 0."""
-        from pytest_leela.plugin import LeelaPlugin
-        from pytest_leela.models import RunResult
-
-        config = MagicMock()
-        config.getoption.side_effect = lambda key, default=None: {
-            "target": ["/fake/mod.py"],
-            "diff": None,
-            "max_cores": None,
-            "max_memory": None,
-        }.get(key, default)
-
-        plugin = LeelaPlugin(config)
-        session = MagicMock()
-        session.config = config
-        session.config.rootpath = Path("/tmp/project")
-        session.items = [MagicMock(nodeid="tests/test_a.py::test_one")]
-        session.exitstatus = 0  # Start with 0
-
-        # Create a RunResult with no mutants found
-        run_result = RunResult(
-            target_files=["/fake/mod.py"],
-            total_mutants=0,
-            mutants_tested=0,
-            mutants_pruned=0,
-            results=[],
-            wall_time_seconds=0.1,
-        )
-
-        mock_engine_cls = MagicMock()
-        mock_engine = mock_engine_cls.return_value
-        mock_engine.run.return_value = run_result
-
-        with (
-            patch("pytest_leela.plugin._find_target_files", return_value=["/fake/mod.py"]),
-            patch("pytest_leela.plugin.Engine", mock_engine_cls),
-            patch("pytest_leela.plugin.format_terminal_report", return_value=""),
-        ):
-            plugin.pytest_sessionfinish(session, exitstatus=0)
+        plugin_env.run()
 
         # Verify exitstatus remained 0
-        assert session.exitstatus == 0
+        assert plugin_env.session.exitstatus == 0
 
     def it_registers_leela_html_option():
         """--leela-html should be registered as a plugin option."""
@@ -511,6 +510,23 @@ def describe_LeelaPlugin():
         assert kwargs["default"] is None
         assert kwargs["metavar"] == "PATH"
 
+    def it_rejects_worker_counts_below_one():
+        parser = MagicMock()
+        group = MagicMock()
+        parser.getgroup.return_value = group
+
+        pytest_addoption(parser)
+
+        workers_call = next(
+            c for c in group.addoption.call_args_list
+            if c.args and c.args[0] == "--leela-workers"
+        )
+        to_workers = workers_call.kwargs["type"]
+        assert to_workers("3") == 3
+        for bad in ("0", "-2", "many"):
+            with pytest.raises(argparse.ArgumentTypeError):
+                to_workers(bad)
+
     def it_activates_plugin_with_leela_html_only():
         """Plugin should register even without --leela when --leela-html is set."""
         config = MagicMock()
@@ -528,92 +544,24 @@ def describe_LeelaPlugin():
         # Second positional arg is the name
         assert args[0][1] == "leela-plugin"
 
-    def it_calls_generate_html_report_when_flag_set():
-        """generate_html_report should be called with result and path."""
-        from pytest_leela.plugin import LeelaPlugin
-        from pytest_leela.models import RunResult
-
-        config = MagicMock()
-        config.getoption.side_effect = lambda key, default=None: {
-            "target": ["/fake/mod.py"],
-            "diff": None,
-            "max_cores": None,
-            "max_memory": None,
-            "leela_html": "/tmp/report.html",
-        }.get(key, default)
-
-        plugin = LeelaPlugin(config)
-        session = MagicMock()
-        session.config = config
-        session.config.rootpath = Path("/tmp/project")
-        session.items = [MagicMock(nodeid="tests/test_a.py::test_one")]
-        session.exitstatus = 0
-
-        run_result = RunResult(
-            target_files=["/fake/mod.py"],
-            total_mutants=0,
-            mutants_tested=0,
-            mutants_pruned=0,
-            results=[],
-            wall_time_seconds=0.1,
-        )
-
-        mock_engine_cls = MagicMock()
-        mock_engine_cls.return_value.run.return_value = run_result
-
-        mock_generate = MagicMock()
+    def it_passes_the_worker_count_to_the_engine(plugin_env):
+        plugin_env.config.options["leela_workers"] = 4
+        plugin_env.run()
 
-        with (
-            patch("pytest_leela.plugin._find_target_files", return_value=["/fake/mod.py"]),
-            patch("pytest_leela.plugin.Engine", mock_engine_cls),
-            patch("pytest_leela.plugin.format_terminal_report", return_value=""),
-            patch("pytest_leela.html_report.generate_html_report", mock_generate),
-        ):
-            plugin.pytest_sessionfinish(session, exitstatus=0)
+        plugin_env.engine_cls.assert_called_once_with(workers=4)
 
-        mock_generate.assert_called_once_with(run_result, "/tmp/report.html")
-
-    def it_does_not_generate_html_report_without_flag():
-        """No HTML report when --leela-html is not set."""
-        from pytest_leela.plugin import LeelaPlugin
-        from pytest_leela.models import RunResult
-
-        config = MagicMock()
-        config.getoption.side_effect = lambda key, default=None: {
-            "target": ["/fake/mod.py"],
-            "diff": None,
-            "max_cores": None,
-            "max_memory": None,
-            "leela_html": None,
-        }.get(key, default)
+    def it_calls_generate_html_report_when_flag_set(plugin_env):
+        """generate_html_report should be called with result and path."""
+        plugin_env.config.options["leela_html"] = "/tmp/report.html"
+        plugin_env.run()
 
-        plugin = LeelaPlugin(config)
-        session = MagicMock()
-        session.config = config
-        session.config.rootpath = Path("/tmp/project")
-        session.items = [MagicMock(nodeid="tests/test_a.py::test_one")]
-        session.exitstatus = 0
-
-        run_result = RunResult(
-            target_files=["/fake/mod.py"],
-            total_mutants=0,
-            mutants_tested=0,
-            mutants_pruned=0,
-            results=[],
-            wall_time_seconds=0.1,
+        plugin_env.generate.assert_called_once_with(
+            plugin_env.engine.run.return_value, "/tmp/report.html"
         )
 
-        mock_engine_cls = MagicMock()
-        mock_engine_cls.return_value.run.return_value = run_result
-
-        mock_generate = MagicMock()
-
-        with (
-            patch("pytest_leela.plugin._find_target_files", return_value=["/fake/mod.py"]),
-            patch("pytest_leela.plugin.Engine", mock_engine_cls),
-            patch("pytest_leela.plugin.format_terminal_report", return_value=""),
-            patch("pytest_leela.html_report.generate_html_report", mock_generate),
-        ):
-            plugin.pytest_sessionfinish(session, exitstatus=0)
+    def it_does_not_generate_html_report_without_flag(plugin_env):
+        """No HTML report when --leela-html is not set."""
+        plugin_env.config.options["leela_html"] = None
+        plugin_env.run()
 
-        mock_generate.assert_not_called()
+        plugin_env.generate.assert_not_called()
@@ -3,6 +3,9 @@
 import math
 from unittest.mock import mock_open, patch
 
+import pytest
+
+from pytest_leela import resources
 from pytest_leela.resources import (
     ResourceLimits,
     apply_cpu_limit,
@@ -81,6 +84,10 @@ def describe_apply_cpu_limit():
 
 
 def describe_check_memory_usage():
+    @pytest.fixture(autouse=True)
+    def fresh_reading(monkeypatch):
+        monkeypatch.setattr(resources, "_meminfo_cache", None)
+
     def it_returns_correct_percentage():
         """Verify arithmetic: (1 - available/total) * 100."""
         meminfo = (
@@ -157,6 +164,13 @@ def describe_check_memory_usage():
             result = check_memory_usage()
         assert result == 0.0
 
+    def it_returns_zero_when_mem_available_is_missing():
+        """Kernels without MemAvailable report unknown usage, not 100%."""
+        meminfo = "MemTotal:       8000000 kB\nMemFree:        1000000 kB\n"
+        with patch("builtins.open", mock_open(read_data=meminfo)):
+            result = check_memory_usage()
+        assert result == 0.0
+
     def it_returns_positive_zero_on_error():
         """Fallback must return +0.0, not -0.0.
 
@@ -167,6 +181,26 @@ def describe_check_memory_usage():
             result = check_memory_usage()
         assert math.copysign(1, result) == 1.0
 
+    def it_reuses_a_reading_within_the_ttl():
+        meminfo = "MemTotal:       8000000 kB\nMemAvailable:   4000000 kB\n"
+        with (
+            patch("builtins.open", mock_open(read_data=meminfo)) as m,
+            patch("pytest_leela.resources.time.monotonic", side_effect=[10.0, 10.05]),
+        ):
+            assert check_memory_usage() == 50.0
+            assert check_memory_usage() == 50.0
+        assert m.call_count == 1
+
+    def it_rereads_once_the_ttl_expires():
+        meminfo = "MemTotal:       8000000 kB\nMemAvailable:   4000000 kB\n"
+        with (
+            patch("builtins.open", mock_open(read_data=meminfo)) as m,
+            patch("pytest_leela.resources.time.monotonic", side_effect=[10.0, 10.5]),
+        ):
+            check_memory_usage()
+            check_memory_usage()
+        assert m.call_count == 2
+
 
 def describe_apply_limits():
     def it_applies_cpu_limit_when_max_cores_set():
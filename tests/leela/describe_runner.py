@@ -1,6 +1,9 @@
 """Tests for pytest_leela.runner — test execution against mutants."""
 
+import os
+import signal
 import sys
+import time
 import types
 from unittest.mock import MagicMock, patch
 
@@ -13,7 +16,10 @@ from pytest_leela.runner import (
     _ResultCollector,
     _clear_framework_caches,
     _clear_user_modules,
+    _fork_mutant,
     run_tests_for_mutant,
+    run_tests_for_mutant_forked,
+    run_tests_for_mutants_parallel,
 )
 
 
@@ -73,6 +79,21 @@ def describe_ResultCollector():
         assert collector.passed == ["test_1", "test_3"]
         assert collector.failed == ["test_2"]
 
+    def it_sets_killed_by_on_first_failure():
+        collector = _ResultCollector()
+        assert collector.killed_by is None
+        collector.pytest_runtest_logreport(
+            _FakeReport("test_1", when="call", passed=True, failed=False)
+        )
+        assert collector.killed_by is None
+        collector.pytest_runtest_logreport(
+            _FakeReport("test_2", when="setup", passed=False, failed=True)
+        )
+        collector.pytest_runtest_logreport(
+            _FakeReport("test_3", when="call", passed=False, failed=True)
+        )
+        assert collector.killed_by == "test_2"
+
 
 def describe_clear_framework_caches():
     def it_does_not_raise_when_django_is_not_installed():
@@ -488,6 +509,35 @@ def describe_run_tests_for_mutant():
             # Restore sys.meta_path if the mutation clobbered it
             sys.meta_path[:] = saved_meta_path
 
+    def it_runs_inner_sessions_without_the_cache_provider(tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        source = "def add(a, b):\n    return a + b\n"
+        target = tmp_path / "no_cache_target.py"
+        target.write_text(source)
+        (tmp_path / "test_no_cache.py").write_text(
+            "from no_cache_target import add\n\n"
+            "def test_add():\n"
+            "    assert add(1, 2) == 3\n"
+        )
+
+        points = find_mutation_points(source, str(target), "no_cache_target")
+        binop_point = next(
+            p for p in points if p.node_type == "BinOp" and p.original_op == "Add"
+        )
+        mutant = Mutant(point=binop_point, replacement_op="Sub", mutant_id=0)
+
+        result = run_tests_for_mutant(
+            mutant,
+            {"no_cache_target": source},
+            {"no_cache_target": str(target)},
+            test_dir=str(tmp_path),
+        )
+
+        assert result.killed
+        assert not (tmp_path / ".pytest_cache").exists()
+
 
 def describe_clear_user_modules():
     def it_removes_cwd_local_modules(monkeypatch, tmp_path):
@@ -530,3 +580,213 @@ def describe_clear_user_modules():
         _clear_user_modules()
 
         assert "pytest_leela._test_keep_me" in sys.modules
+
+
+def describe_run_tests_for_mutant_forked():
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def it_kills_a_detectable_mutant_in_a_child_process(tmp_path, monkeypatch):
+        source = "def add(a, b):\n    return a + b\n"
+        target = tmp_path / "forked_target.py"
+        target.write_text(source)
+
+        test_dir = tmp_path / "forked_tests"
+        test_dir.mkdir()
+        (test_dir / "test_forked_target.py").write_text(
+            "from forked_target import add\n\n"
+            "def test_add():\n"
+            "    assert add(1, 2) == 3\n"
+        )
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        points = find_mutation_points(source, str(target), "forked_target")
+        binop_point = next(
+            p for p in points if p.node_type == "BinOp" and p.original_op == "Add"
+        )
+        mutant = Mutant(point=binop_point, replacement_op="Sub", mutant_id=0)
+        modules_before = set(sys.modules)
+
+        result = run_tests_for_mutant_forked(
+            mutant,
+            {"forked_target": source},
+            {"forked_target": str(target)},
+            test_dir=str(test_dir),
+        )
+
+        assert isinstance(result, MutantResult)
+        assert result.killed is True
+        assert result.killing_test is not None
+        # The mutated module was only ever imported in the child
+        assert "forked_target" not in sys.modules
+        assert "forked_target" not in modules_before
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    @pytest.mark.parametrize(
+        "die",
+        [
+            lambda: os.kill(os.getpid(), signal.SIGKILL),
+            lambda: os._exit(3),
+        ],
+        ids=["signal", "nonzero-exit"],
+    )
+    def it_reports_crashed_when_the_mutant_takes_down_the_child(die):
+        point = find_mutation_points("x = 1 + 2\n", "crash.py", "crash")[0]
+        mutant = Mutant(point=point, replacement_op="Sub", mutant_id=0)
+
+        with patch("pytest_leela.runner.run_tests_for_mutant", side_effect=lambda *a, **k: die()):
+            result = run_tests_for_mutant_forked(mutant, {"crash": ""}, {})
+
+        assert result.killed is True
+        assert result.killing_test == "<crashed>"
+        assert result.killing_tests == ["<crashed>"]
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def it_raises_when_the_child_harness_fails():
+        point = find_mutation_points("x = 1 + 2\n", "broken.py", "broken")[0]
+        mutant = Mutant(point=point, replacement_op="Sub", mutant_id=7)
+
+        with (
+            patch("pytest_leela.runner.run_tests_for_mutant", side_effect=ValueError("boom")),
+            pytest.raises(RuntimeError, match="mutant 7") as excinfo,
+        ):
+            run_tests_for_mutant_forked(mutant, {"broken": ""}, {})
+
+        assert "ValueError: boom" in str(excinfo.value)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def it_raises_when_the_child_exits_cleanly_without_a_result():
+        point = find_mutation_points("x = 1 + 2\n", "silent.py", "silent")[0]
+        mutant = Mutant(point=point, replacement_op="Sub", mutant_id=0)
+
+        with (
+            patch("pytest_leela.runner.run_tests_for_mutant", side_effect=lambda *a, **k: os._exit(0)),
+            pytest.raises(RuntimeError, match="without a result"),
+        ):
+            run_tests_for_mutant_forked(mutant, {"silent": ""}, {})
+
+    def it_falls_back_to_in_process_without_fork(monkeypatch):
+        point = find_mutation_points("x = 1 + 2\n", "nofork.py", "nofork")[0]
+        mutant = Mutant(point=point, replacement_op="Sub", mutant_id=0)
+        expected = MutantResult(
+            mutant=mutant, killed=False, tests_run=0,
+            killing_test=None, time_seconds=0.0,
+        )
+        monkeypatch.delattr(os, "fork", raising=False)
+
+        with patch("pytest_leela.runner.run_tests_for_mutant", return_value=expected) as run:
+            result = run_tests_for_mutant_forked(mutant, {"nofork": ""}, {})
+
+        assert result is expected
+        run.assert_called_once()
+
+
+def describe_run_tests_for_mutants_parallel():
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def it_runs_jobs_in_workers_and_keeps_job_order(tmp_path, monkeypatch):
+        source = "def add(a, b):\n    return a + b\n"
+        target = tmp_path / "parallel_target.py"
+        target.write_text(source)
+        (tmp_path / "test_parallel_target.py").write_text(
+            "from parallel_target import add\n\n"
+            "def test_add():\n"
+            "    assert add(2, 2) == 4\n"
+        )
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        points = find_mutation_points(source, str(target), "parallel_target")
+        binop_point = next(
+            p for p in points if p.node_type == "BinOp" and p.original_op == "Add"
+        )
+        # 2 - 2 fails the test; 2 * 2 still equals 4
+        mutants = [
+            Mutant(point=binop_point, replacement_op=op, mutant_id=i)
+            for i, op in enumerate(["Sub", "Mult", "Sub"])
+        ]
+
+        results = run_tests_for_mutants_parallel(
+            ((m, None) for m in mutants),
+            {"parallel_target": source},
+            {"parallel_target": str(target)},
+            test_dir=str(tmp_path),
+            workers=2,
+        )
+
+        assert [r.mutant.mutant_id for r in results] == [0, 1, 2]
+        assert [r.killed for r in results] == [True, False, True]
+        assert "parallel_target" not in sys.modules
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def it_kills_and_reaps_running_children_when_dispatch_fails():
+        point = find_mutation_points("x = 1 + 2\n", "hang.py", "hang")[0]
+        mutant = Mutant(point=point, replacement_op="Sub", mutant_id=0)
+        pids: list[int] = []
+
+        def jobs():
+            yield mutant, None
+            raise KeyboardInterrupt
+
+        def recording_fork(*args, **kwargs):
+            pid, read_fd = _fork_mutant(*args, **kwargs)
+            pids.append(pid)
+            return pid, read_fd
+
+        with (
+            patch("pytest_leela.runner.run_tests_for_mutant", side_effect=lambda *a, **k: time.sleep(60)),
+            patch("pytest_leela.runner._fork_mutant", side_effect=recording_fork),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            run_tests_for_mutants_parallel(jobs(), {"hang": ""}, {}, workers=2)
+
+        assert len(pids) == 1
+        with pytest.raises(ChildProcessError):
+            os.waitpid(pids[0], os.WNOHANG)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def it_closes_the_pipe_when_fork_fails():
+        point = find_mutation_points("x = 1 + 2\n", "nofork.py", "nofork")[0]
+        mutant = Mutant(point=point, replacement_op="Sub", mutant_id=0)
+        fds: list[int] = []
+        real_pipe = os.pipe
+
+        def recording_pipe():
+            pair = real_pipe()
+            fds.extend(pair)
+            return pair
+
+        with (
+            patch("pytest_leela.runner.os.pipe", side_effect=recording_pipe),
+            patch("pytest_leela.runner.os.fork", side_effect=OSError("no fork")),
+            pytest.raises(OSError, match="no fork"),
+        ):
+            _fork_mutant(mutant, {}, {}, None, None)
+
+        assert len(fds) == 2
+        for fd in fds:
+            with pytest.raises(OSError):
+                os.fstat(fd)
+
+    def it_runs_serially_with_a_single_worker():
+        point = find_mutation_points("x = 1 + 2\n", "serial.py", "serial")[0]
+        mutants = [
+            Mutant(point=point, replacement_op=op, mutant_id=i)
+            for i, op in enumerate(["Sub", "Mult"])
+        ]
+
+        def fake_run(mutant, *args, **kwargs):
+            return MutantResult(
+                mutant=mutant, killed=False, tests_run=0,
+                killing_test=None, time_seconds=0.0,
+            )
+
+        with patch(
+            "pytest_leela.runner.run_tests_for_mutant_forked", side_effect=fake_run
+        ) as run:
+            results = run_tests_for_mutants_parallel(
+                ((m, None) for m in mutants), {"serial": ""}, {}, workers=1
+            )
+
+        assert [r.mutant for r in results] == mutants
+        assert run.call_count == 2